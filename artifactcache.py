@@ -0,0 +1,191 @@
+"""Content-addressed store of finished mod jars."""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from plugin_manager import PluginManager
+
+
+class ArtifactCache:
+    """Stores build outputs under their content key with size-bounded LRU eviction.
+
+    Each artifact lives at ``<root>/<key[:2]>/<key>.jar`` next to a ``<key>.json`` record
+    holding its size and access times, so concurrent builds never share an index file.
+    """
+
+    DEFAULT_MAX_BYTES = 2 * 1024 * 1024 * 1024
+
+    class CacheError(Exception):
+        """Raised when the artifact store cannot be read or written."""
+
+    @dataclass
+    class Entry:
+        """Metadata recorded for one cached artifact."""
+
+        key: str
+        mod_id: str
+        size: int
+        created: float
+        last_access: float
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self._root = Path(root).expanduser().resolve()
+        self._max_bytes = max_bytes
+        self._lock = threading.RLock()
+        self._logger = logging.getLogger("stsm.artifact_cache")
+        if not self._logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter("[%(asctime)s] %(levelname)s %(name)s: %(message)s")
+            handler.setFormatter(formatter)
+            self._logger.addHandler(handler)
+        self._logger.setLevel(logging.INFO)
+
+    @classmethod
+    def default_root(cls) -> Path:
+        return Path.home() / ".cache" / "stsmodder" / "artifacts"
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def artifact_path(self, key: str) -> Path:
+        self._validate_key(key)
+        return self._root / key[:2] / f"{key}.jar"
+
+    def lookup(self, key: str) -> Optional[Path]:
+        """Return the cached artifact for ``key`` and mark it as recently used."""
+
+        artifact = self.artifact_path(key)
+        with self._lock:
+            entry = self._read_entry(key)
+            if entry is None or not artifact.exists():
+                return None
+            entry.last_access = time.time()
+            self._write_entry(entry)
+        return artifact
+
+    def store(self, key: str, artifact: Path, mod_id: str) -> Optional[Path]:
+        """Copy ``artifact`` into the store under ``key`` and evict least recently used entries.
+
+        Returns ``None`` without touching the store when the artifact alone exceeds ``max_bytes``.
+        """
+
+        destination = self.artifact_path(key)
+        try:
+            size = Path(artifact).stat().st_size
+        except OSError as exc:
+            raise ArtifactCache.CacheError(f"Unable to store artifact {key}: {exc}") from exc
+        if size > self._max_bytes:
+            self._logger.info("Skipped caching %s: %d bytes exceed the %d byte limit", key[:12], size, self._max_bytes)
+            return None
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            handle, temporary = tempfile.mkstemp(dir=destination.parent, suffix=".partial")
+            os.close(handle)
+            try:
+                shutil.copyfile(artifact, temporary)
+                os.replace(temporary, destination)
+            except OSError as exc:
+                Path(temporary).unlink(missing_ok=True)
+                raise ArtifactCache.CacheError(f"Unable to store artifact {key}: {exc}") from exc
+            now = time.time()
+            self._write_entry(
+                ArtifactCache.Entry(
+                    key=key,
+                    mod_id=mod_id,
+                    size=destination.stat().st_size,
+                    created=now,
+                    last_access=now,
+                )
+            )
+            self.prune()
+        return destination
+
+    def entries(self) -> List["ArtifactCache.Entry"]:
+        """Return every cached entry, most recently used first."""
+
+        collected: List[ArtifactCache.Entry] = []
+        if not self._root.exists():
+            return collected
+        with self._lock:
+            for record in self._root.glob("*/*.json"):
+                entry = self._read_entry(record.stem)
+                if entry is not None and self.artifact_path(entry.key).exists():
+                    collected.append(entry)
+        collected.sort(key=lambda entry: entry.last_access, reverse=True)
+        return collected
+
+    def total_size(self) -> int:
+        return sum(entry.size for entry in self.entries())
+
+    def prune(self, max_bytes: Optional[int] = None) -> List["ArtifactCache.Entry"]:
+        """Evict least recently used entries until the store fits in ``max_bytes``."""
+
+        limit = self._max_bytes if max_bytes is None else max_bytes
+        removed: List[ArtifactCache.Entry] = []
+        with self._lock:
+            entries = self.entries()
+            total = sum(entry.size for entry in entries)
+            while entries and total > limit:
+                victim = entries.pop()
+                self.remove(victim.key)
+                total -= victim.size
+                removed.append(victim)
+        if removed:
+            self._logger.info("Evicted %d cached artifacts", len(removed))
+        return removed
+
+    def remove(self, key: str) -> bool:
+        artifact = self.artifact_path(key)
+        record = artifact.with_suffix(".json")
+        with self._lock:
+            existed = artifact.exists()
+            artifact.unlink(missing_ok=True)
+            record.unlink(missing_ok=True)
+        return existed
+
+    def clear(self) -> int:
+        entries = self.entries()
+        for entry in entries:
+            self.remove(entry.key)
+        return len(entries)
+
+    def _read_entry(self, key: str) -> Optional["ArtifactCache.Entry"]:
+        record = self.artifact_path(key).with_suffix(".json")
+        try:
+            with record.open("r", encoding="utf-8") as handle:
+                raw = json.load(handle)
+            return ArtifactCache.Entry(**raw)
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _write_entry(self, entry: "ArtifactCache.Entry") -> None:
+        record = self.artifact_path(entry.key).with_suffix(".json")
+        handle, temporary = tempfile.mkstemp(dir=record.parent, suffix=".partial")
+        with os.fdopen(handle, "w", encoding="utf-8") as stream:
+            json.dump(asdict(entry), stream)
+        os.replace(temporary, record)
+
+    @staticmethod
+    def _validate_key(key: str) -> None:
+        if len(key) < 8 or not all(character in "0123456789abcdef" for character in key):
+            raise ArtifactCache.CacheError(f"Invalid artifact key '{key}'")
+
+
+PluginManager.get_instance().register_module(__name__, sys.modules[__name__])
+
+__all__ = ["ArtifactCache"]
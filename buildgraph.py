@@ -0,0 +1,189 @@
+"""Dependency graph of build phases with concurrent execution and dry-run planning."""
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, ContextManager, Dict, Iterable, List, Optional, Set, Tuple
+
+from plugin_manager import PluginManager
+
+
+class BuildGraph:
+    """Runs named build phases once every phase they depend on has finished.
+
+    A phase declares the phases it ``requires`` and, to slot itself in front of existing
+    phases, the phases it must run ``before``. Phases whose dependencies are satisfied run
+    concurrently on a thread pool; with a single worker they run one after another in plan
+    order. The first failure stops new phases from starting and is re-raised unchanged once
+    the running ones have finished.
+    """
+
+    class GraphError(Exception):
+        """Raised when phases are duplicated, reference unknown phases or form a cycle."""
+
+    @dataclass(frozen=True)
+    class Phase:
+        """One unit of build work, called with the build context."""
+
+        name: str
+        action: Callable[[Any], None]
+        requires: Tuple[str, ...] = ()
+        before: Tuple[str, ...] = ()
+        description: str = ""
+
+    def __init__(self, phases: Iterable["BuildGraph.Phase"] = ()) -> None:
+        self._phases: Dict[str, BuildGraph.Phase] = {}
+        self._lock = threading.RLock()
+        self._logger = logging.getLogger("stsm.build_graph")
+        if not self._logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter("[%(asctime)s] %(levelname)s %(name)s: %(message)s")
+            handler.setFormatter(formatter)
+            self._logger.addHandler(handler)
+        self._logger.setLevel(logging.INFO)
+        for phase in phases:
+            self.add(phase)
+
+    @property
+    def phases(self) -> List["BuildGraph.Phase"]:
+        with self._lock:
+            return list(self._phases.values())
+
+    def add(self, phase: "BuildGraph.Phase", replace: bool = False) -> None:
+        """Register ``phase``; an existing phase of the same name is only overwritten with ``replace``."""
+
+        with self._lock:
+            if phase.name in self._phases and not replace:
+                raise BuildGraph.GraphError(f"Build phase '{phase.name}' is already registered")
+            self._phases[phase.name] = phase
+
+    def remove(self, name: str) -> bool:
+        with self._lock:
+            return self._phases.pop(name, None) is not None
+
+    def copy(self) -> "BuildGraph":
+        return BuildGraph(self.phases)
+
+    def dependencies(self) -> Dict[str, Set[str]]:
+        """Return every phase's full set of prerequisites, folding ``before`` edges into ``requires``."""
+
+        with self._lock:
+            phases = dict(self._phases)
+        graph: Dict[str, Set[str]] = {name: set(phase.requires) for name, phase in phases.items()}
+        for phase in phases.values():
+            for required in phase.requires:
+                if required not in phases:
+                    raise BuildGraph.GraphError(f"Build phase '{phase.name}' requires unknown phase '{required}'")
+            for successor in phase.before:
+                if successor not in phases:
+                    raise BuildGraph.GraphError(f"Build phase '{phase.name}' must precede unknown phase '{successor}'")
+                graph[successor].add(phase.name)
+        return graph
+
+    def plan(self) -> List[List[str]]:
+        """Group the phases into waves; every phase of a wave can run once the earlier waves are done."""
+
+        graph = self.dependencies()
+        order = {name: index for index, name in enumerate(graph)}
+        waves: List[List[str]] = []
+        done: Set[str] = set()
+        while len(done) < len(graph):
+            wave = [name for name in graph if name not in done and graph[name] <= done]
+            if not wave:
+                cycle = sorted(name for name in graph if name not in done)
+                raise BuildGraph.GraphError(f"Build phases form a dependency cycle: {', '.join(cycle)}")
+            wave.sort(key=order.__getitem__)
+            waves.append(wave)
+            done.update(wave)
+        return waves
+
+    def run(
+        self,
+        context: Any,
+        workers: int = 0,
+        instrument: Optional[Callable[[str], ContextManager[Any]]] = None,
+        on_finished: Optional[Callable[[str], None]] = None,
+    ) -> List[str]:
+        """Execute every phase against ``context`` and return the phase names in completion order.
+
+        ``workers`` bounds the number of concurrently running phases; ``0`` allows as many as
+        are ready at once. Each phase runs inside ``instrument(name)`` when given, on the
+        thread executing it. ``on_finished(name)`` is always called on the calling thread once
+        a phase has ended, whether or not it succeeded.
+        """
+
+        waves = self.plan()
+        with self._lock:
+            phases = dict(self._phases)
+        if workers == 1 or max((len(wave) for wave in waves), default=0) <= 1:
+            completed: List[str] = []
+            for wave in waves:
+                for name in wave:
+                    try:
+                        self._invoke(phases[name], context, instrument)
+                    finally:
+                        if on_finished is not None:
+                            on_finished(name)
+                    completed.append(name)
+            return completed
+        return self._run_concurrently(context, phases, self.dependencies(), workers, instrument, on_finished)
+
+    @staticmethod
+    def _invoke(
+        phase: "BuildGraph.Phase",
+        context: Any,
+        instrument: Optional[Callable[[str], ContextManager[Any]]],
+    ) -> None:
+        if instrument is None:
+            phase.action(context)
+            return
+        with instrument(phase.name):
+            phase.action(context)
+
+    def _run_concurrently(
+        self,
+        context: Any,
+        phases: Dict[str, "BuildGraph.Phase"],
+        graph: Dict[str, Set[str]],
+        workers: int,
+        instrument: Optional[Callable[[str], ContextManager[Any]]],
+        on_finished: Optional[Callable[[str], None]],
+    ) -> List[str]:
+        pending = dict(graph)
+        completed: List[str] = []
+        done: Set[str] = set()
+        failure: Optional[BaseException] = None
+        max_workers = workers if workers > 0 else len(phases)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="stsm-phase") as executor:
+            running: Dict[Future, str] = {}
+            while pending or running:
+                if failure is None:
+                    for name in [name for name, required in pending.items() if required <= done]:
+                        del pending[name]
+                        running[executor.submit(self._invoke, phases[name], context, instrument)] = name
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    error = future.exception()
+                    if on_finished is not None:
+                        on_finished(name)
+                    if error is not None:
+                        if failure is None:
+                            failure = error
+                            self._logger.error("Build phase '%s' failed: %s", name, error)
+                        continue
+                    done.add(name)
+                    completed.append(name)
+        if failure is not None:
+            raise failure
+        return completed
+
+
+PluginManager.get_instance().register_module(__name__, sys.modules[__name__])
+
+__all__ = ["BuildGraph"]
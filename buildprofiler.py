@@ -0,0 +1,145 @@
+"""Timing and output accounting for mod builds."""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from plugin_manager import PluginManager
+
+
+class BuildProfiler:
+    """Records how long each build phase and compiler call takes and what it wrote.
+
+    Writes are attributed to the phase running on the current thread; helper threads started
+    by a phase inherit it through ``bind``. Writes outside any phase are booked under
+    ``UNATTRIBUTED``. All methods are thread-safe.
+    """
+
+    UNATTRIBUTED = "unattributed"
+
+    @dataclass
+    class PhaseRecord:
+        """Wall-clock timing and output volume of one phase."""
+
+        name: str
+        started: float
+        seconds: float = 0.0
+        files_written: int = 0
+        bytes_written: int = 0
+        error: str = ""
+
+    @dataclass
+    class CompilerCall:
+        """One invocation of a Java compiler backend."""
+
+        phase: str
+        backend: str
+        sources: int
+        seconds: float
+        success: bool
+
+    @dataclass
+    class Report:
+        """Structured summary of a build, safe to serialise with ``to_dict``."""
+
+        total_seconds: float
+        phases: List["BuildProfiler.PhaseRecord"] = field(default_factory=list)
+        compiler_calls: List["BuildProfiler.CompilerCall"] = field(default_factory=list)
+        files_written: int = 0
+        bytes_written: int = 0
+        jar_bytes: int = 0
+        metrics: Dict[str, float] = field(default_factory=dict)
+
+        def phase(self, name: str) -> Optional["BuildProfiler.PhaseRecord"]:
+            return next((record for record in self.phases if record.name == name), None)
+
+        def to_dict(self) -> Dict[str, Any]:
+            return asdict(self)
+
+    def __init__(self, on_phase: Optional[Callable[["BuildProfiler.PhaseRecord"], None]] = None) -> None:
+        self._on_phase = on_phase
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._origin = time.perf_counter()
+        self._phases: Dict[str, BuildProfiler.PhaseRecord] = {}
+        self._calls: List[BuildProfiler.CompilerCall] = []
+
+    def current_phase(self) -> str:
+        return getattr(self._local, "phase", BuildProfiler.UNATTRIBUTED)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator["BuildProfiler.PhaseRecord"]:
+        """Time the enclosed block as phase ``name`` and report it to ``on_phase`` when it ends."""
+
+        record = self._record(name)
+        record.started = time.perf_counter() - self._origin
+        outer = self.current_phase()
+        self._local.phase = name
+        started = time.perf_counter()
+        try:
+            yield record
+        except BaseException as exc:
+            record.error = str(exc) or type(exc).__name__
+            raise
+        finally:
+            record.seconds = time.perf_counter() - started
+            self._local.phase = outer
+            if self._on_phase is not None:
+                self._on_phase(record)
+
+    def bind(self, function: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap ``function`` so that writes it makes on another thread count towards the current phase."""
+
+        name = self.current_phase()
+
+        def bound(*args: Any, **kwargs: Any) -> Any:
+            outer = self.current_phase()
+            self._local.phase = name
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._local.phase = outer
+
+        return bound
+
+    def record_write(self, size: int) -> None:
+        record = self._record(self.current_phase())
+        with self._lock:
+            record.files_written += 1
+            record.bytes_written += size
+
+    def record_compile(self, backend: str, sources: int, seconds: float, success: bool) -> None:
+        call = BuildProfiler.CompilerCall(self.current_phase(), backend, sources, seconds, success)
+        with self._lock:
+            self._calls.append(call)
+
+    def report(self, jar_bytes: int = 0, metrics: Optional[Dict[str, float]] = None) -> "BuildProfiler.Report":
+        with self._lock:
+            phases = sorted(self._phases.values(), key=lambda record: record.started)
+            calls = list(self._calls)
+        return BuildProfiler.Report(
+            total_seconds=time.perf_counter() - self._origin,
+            phases=phases,
+            compiler_calls=calls,
+            files_written=sum(record.files_written for record in phases),
+            bytes_written=sum(record.bytes_written for record in phases),
+            jar_bytes=jar_bytes,
+            metrics=dict(metrics or {}),
+        )
+
+    def _record(self, name: str) -> "BuildProfiler.PhaseRecord":
+        with self._lock:
+            record = self._phases.get(name)
+            if record is None:
+                record = BuildProfiler.PhaseRecord(name, time.perf_counter() - self._origin)
+                self._phases[name] = record
+            return record
+
+
+PluginManager.get_instance().register_module(__name__, sys.modules[__name__])
+
+__all__ = ["BuildProfiler"]
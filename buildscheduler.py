@@ -0,0 +1,378 @@
+"""Priority queue in front of the mod orchestrator for builds requested by concurrent sessions."""
+from __future__ import annotations
+
+import hashlib
+import heapq
+import itertools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from modorchestrator import MOD_ORCHESTRATOR, ModOrchestrator
+from plugin_manager import PluginManager
+
+
+class BuildScheduler:
+    """Runs build requests from many callers on a bounded set of worker threads.
+
+    Requests are served by ``priority`` (lower first), then in arrival order. A request identical
+    to one still queued or running (same project data, destination, options and source file
+    timestamps) joins that build instead of starting another; its priority is raised to the
+    most urgent of the merged requests. Builds of the same project root never run at the
+    same time; a request whose root is busy waits while requests for other roots go ahead.
+
+    ``Ticket.cancel`` withdraws one request. The build itself stops only when no other
+    request still waits for it: a queued build is dropped, a running one stops at its next
+    phase and a running javac process is killed. ``BuildOptions.compile_timeout`` bounds each
+    javac run. Projects with a ``card_stream`` are consumed by their build and never merged.
+    """
+
+    PRIORITY_HIGH = 0
+    PRIORITY_NORMAL = 10
+    PRIORITY_LOW = 20
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    class SchedulerClosedError(Exception):
+        """Raised when a build is submitted after ``shutdown``."""
+
+    @dataclass(eq=False)
+    class Job:
+        """One build shared by every ticket whose request it satisfies."""
+
+        key: str
+        project: "ModOrchestrator.ModProject"
+        destination: Path
+        clean: bool
+        options: "ModOrchestrator.BuildOptions"
+        project_root: Path
+        priority: int
+        submitted: float
+        state: str = "queued"
+        started: float = 0.0
+        finished: float = 0.0
+        tickets: List["BuildScheduler.Ticket"] = field(default_factory=list)
+        cancel_event: threading.Event = field(default_factory=threading.Event)
+
+    @dataclass
+    class Status:
+        """Snapshot of the scheduler's queue."""
+
+        queued: int
+        running: int
+        merged: int
+        completed: int
+        running_roots: List[str]
+
+    class Ticket:
+        """A caller's handle on its request; several tickets may share one build."""
+
+        def __init__(self, scheduler: "BuildScheduler", job: "BuildScheduler.Job", merged: bool) -> None:
+            self._scheduler = scheduler
+            self._job = job
+            self._future: Future = Future()
+            self.merged = merged
+
+        @property
+        def mod_id(self) -> str:
+            return self._job.project.metadata.mod_id
+
+        @property
+        def project_root(self) -> Path:
+            return self._job.project_root
+
+        @property
+        def state(self) -> str:
+            if self._future.done() and self._job.state in (BuildScheduler.QUEUED, BuildScheduler.RUNNING):
+                return BuildScheduler.CANCELLED
+            return self._job.state
+
+        def done(self) -> bool:
+            return self._future.done()
+
+        def result(self, timeout: Optional[float] = None) -> "ModOrchestrator.BuildResult":
+            """Wait for the build; raises its error, or ``BuildCancelledError`` when cancelled."""
+
+            return self._future.result(timeout)
+
+        def exception(self, timeout: Optional[float] = None) -> Optional[BaseException]:
+            return self._future.exception(timeout)
+
+        def cancel(self) -> bool:
+            """Withdraw this request; returns ``False`` when its build had already finished."""
+
+            return self._scheduler._withdraw(self)
+
+    def __init__(
+        self,
+        orchestrator: ModOrchestrator,
+        plugin_manager: PluginManager,
+        workers: int = 0,
+    ) -> None:
+        self._orchestrator = orchestrator
+        self._workers = workers or min(4, os.cpu_count() or 1)
+        self._condition = threading.Condition()
+        self._queue: List[Tuple[int, int, "BuildScheduler.Job"]] = []
+        self._sequence = itertools.count()
+        self._jobs: Dict[str, "BuildScheduler.Job"] = {}
+        self._active_roots: Set[str] = set()
+        self._threads: List[threading.Thread] = []
+        self._closed = False
+        self._merged = 0
+        self._completed = 0
+        self._logger = logging.getLogger("stsm.build_scheduler")
+        if not self._logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter("[%(asctime)s] %(levelname)s %(name)s: %(message)s")
+            handler.setFormatter(formatter)
+            self._logger.addHandler(handler)
+        self._logger.setLevel(logging.INFO)
+        plugin_manager.register_symbol("buildscheduler.scheduler", self)
+
+    def submit(
+        self,
+        project: "ModOrchestrator.ModProject",
+        destination: Path,
+        clean: bool = True,
+        options: Optional["ModOrchestrator.BuildOptions"] = None,
+        priority: int = PRIORITY_NORMAL,
+    ) -> "BuildScheduler.Ticket":
+        """Queue a ``build_project`` call and return its ticket without waiting for the build."""
+
+        options = options or ModOrchestrator.BuildOptions()
+        destination = destination.expanduser().resolve()
+        key = self.request_key(project, destination, clean, options)
+        with self._condition:
+            if self._closed:
+                raise BuildScheduler.SchedulerClosedError("The build scheduler has been shut down")
+            job = self._jobs.get(key)
+            if job is not None and job.state in (BuildScheduler.QUEUED, BuildScheduler.RUNNING):
+                ticket = BuildScheduler.Ticket(self, job, merged=True)
+                job.tickets.append(ticket)
+                self._merged += 1
+                if priority < job.priority:
+                    job.priority = priority
+                    if job.state == BuildScheduler.QUEUED:
+                        heapq.heappush(self._queue, (priority, next(self._sequence), job))
+                self._logger.info("Merged build request for %s into the %s build", job.project_root, job.state)
+                return ticket
+            job = BuildScheduler.Job(
+                key=key,
+                project=project,
+                destination=destination,
+                clean=clean,
+                options=options,
+                project_root=destination / project.metadata.mod_id,
+                priority=priority,
+                submitted=time.monotonic(),
+            )
+            ticket = BuildScheduler.Ticket(self, job, merged=False)
+            job.tickets.append(ticket)
+            self._jobs[key] = job
+            heapq.heappush(self._queue, (priority, next(self._sequence), job))
+            self._start_workers()
+            self._condition.notify()
+        return ticket
+
+    def build(
+        self,
+        project: "ModOrchestrator.ModProject",
+        destination: Path,
+        clean: bool = True,
+        options: Optional["ModOrchestrator.BuildOptions"] = None,
+        priority: int = PRIORITY_NORMAL,
+    ) -> "ModOrchestrator.BuildResult":
+        """Submit a request and wait for its result."""
+
+        return self.submit(project, destination, clean, options, priority).result()
+
+    def status(self) -> "BuildScheduler.Status":
+        with self._condition:
+            states = [job.state for job in self._jobs.values()]
+            return BuildScheduler.Status(
+                queued=states.count(BuildScheduler.QUEUED),
+                running=len(self._active_roots),
+                merged=self._merged,
+                completed=self._completed,
+                running_roots=sorted(self._active_roots),
+            )
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        """Refuse new requests; queued builds still run unless ``cancel_pending`` is set."""
+
+        with self._condition:
+            self._closed = True
+            if cancel_pending:
+                for job in list(self._jobs.values()):
+                    self._cancel_job(job)
+            self._condition.notify_all()
+            threads = list(self._threads)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    @staticmethod
+    def request_key(
+        project: "ModOrchestrator.ModProject",
+        destination: Path,
+        clean: bool,
+        options: "ModOrchestrator.BuildOptions",
+    ) -> str:
+        """Identify a request by everything that shapes its output, including source file timestamps."""
+
+        if project.card_stream is not None:
+            return f"stream:{id(project.card_stream)}:{time.monotonic_ns()}"
+        keyed = replace(project, cards=list(project.cards), card_stream=None)
+        digest = hashlib.sha256(
+            json.dumps(
+                {
+                    "project": asdict(keyed),
+                    "destination": str(destination),
+                    "clean": clean,
+                    "options": asdict(options),
+                },
+                sort_keys=True,
+                default=str,
+            ).encode("utf-8")
+        )
+        sources = [asset.source for asset in project.assets]
+        sources.extend(card.image_path for card in project.cards if card.image_path is not None)
+        sources.extend(project.additional_dependencies)
+        for source in sources:
+            try:
+                stat = Path(source).stat()
+                digest.update(f"{source}:{stat.st_size}:{stat.st_mtime_ns}".encode("utf-8"))
+            except OSError:
+                digest.update(f"{source}:missing".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _start_workers(self) -> None:
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        while len(self._threads) < self._workers:
+            thread = threading.Thread(
+                target=self._work, name=f"stsm-build-{len(self._threads)}", daemon=True
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def _next_job(self) -> Optional["BuildScheduler.Job"]:
+        """Pop the most urgent queued job whose project root is idle; caller holds the condition."""
+
+        skipped: List[Tuple[int, int, "BuildScheduler.Job"]] = []
+        chosen: Optional[BuildScheduler.Job] = None
+        while self._queue:
+            entry = heapq.heappop(self._queue)
+            priority, _, job = entry
+            if job.state != BuildScheduler.QUEUED or priority != job.priority:
+                continue  # cancelled, or superseded by a higher-priority entry
+            if str(job.project_root) in self._active_roots:
+                skipped.append(entry)
+                continue
+            chosen = job
+            break
+        for entry in skipped:
+            heapq.heappush(self._queue, entry)
+        return chosen
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                job = self._next_job()
+                while job is None:
+                    if self._closed and not any(
+                        queued.state == BuildScheduler.QUEUED for _, _, queued in self._queue
+                    ):
+                        return
+                    self._condition.wait()
+                    job = self._next_job()
+                job.state = BuildScheduler.RUNNING
+                job.started = time.monotonic()
+                self._active_roots.add(str(job.project_root))
+            self._run(job)
+
+    def _run(self, job: "BuildScheduler.Job") -> None:
+        result: Optional[ModOrchestrator.BuildResult] = None
+        error: Optional[BaseException] = None
+        try:
+            result = self._orchestrator.build_project(
+                job.project, job.destination, job.clean, job.options, cancel=job.cancel_event
+            )
+        except Exception as exc:  # delivered to every ticket of the job
+            error = exc
+        with self._condition:
+            if error is None:
+                job.state = BuildScheduler.SUCCEEDED
+            elif isinstance(error, ModOrchestrator.BuildCancelledError):
+                job.state = BuildScheduler.CANCELLED
+            else:
+                job.state = BuildScheduler.FAILED
+            job.finished = time.monotonic()
+            self._active_roots.discard(str(job.project_root))
+            if self._jobs.get(job.key) is job:
+                del self._jobs[job.key]
+            self._completed += 1
+            tickets = list(job.tickets)
+            self._condition.notify_all()
+        self._logger.info(
+            "Build of %s %s after %.2fs (waited %.2fs, %d request(s))",
+            job.project_root,
+            job.state,
+            job.finished - job.started,
+            job.started - job.submitted,
+            len(tickets),
+        )
+        for ticket in tickets:
+            if ticket._future.done():
+                continue
+            if error is None:
+                ticket._future.set_result(result)
+            else:
+                ticket._future.set_exception(error)
+
+    def _withdraw(self, ticket: "BuildScheduler.Ticket") -> bool:
+        job = ticket._job
+        with self._condition:
+            if ticket._future.done() or ticket not in job.tickets:
+                return False
+            job.tickets.remove(ticket)
+            if not job.tickets:
+                self._cancel_job(job)
+        ticket._future.set_exception(
+            ModOrchestrator.BuildCancelledError(f"Build request for {job.project.metadata.mod_id} was cancelled")
+        )
+        return True
+
+    def _cancel_job(self, job: "BuildScheduler.Job") -> None:
+        """Drop a queued job or signal a running one; caller holds the condition."""
+
+        if self._jobs.get(job.key) is job:
+            del self._jobs[job.key]  # later identical requests start a fresh build
+        if job.state == BuildScheduler.QUEUED:
+            job.state = BuildScheduler.CANCELLED
+            error = ModOrchestrator.BuildCancelledError(f"Build of {job.project.metadata.mod_id} was cancelled")
+            for ticket in job.tickets:
+                if not ticket._future.done():
+                    ticket._future.set_exception(error)
+        elif job.state == BuildScheduler.RUNNING:
+            job.cancel_event.set()
+
+
+BUILD_SCHEDULER = BuildScheduler(MOD_ORCHESTRATOR, PluginManager.get_instance())
+
+PluginManager.get_instance().register_module(__name__, sys.modules[__name__])
+
+__all__ = [
+    "BuildScheduler",
+    "BUILD_SCHEDULER",
+]
@@ -0,0 +1,157 @@
+"""Card-art variant generation with an on-disk resize cache."""
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Mapping, Tuple
+
+from plugin_manager import PluginManager
+
+
+class CardArtPipeline:
+    """Derives the image variants BaseMod expects for a card from one source image.
+
+    ``CustomCard`` loads ``<card>.png`` (250x190) on the card and ``<card>_p.png`` (500x380)
+    in the single-card view. Resized files are cached under ``<root>/<hash[:2]>/`` keyed by
+    the source hash and target size, so repeated builds only resize new or changed art.
+    """
+
+    CACHE_FORMAT = 1
+
+    class PillowUnavailableError(Exception):
+        """Raised when Pillow is required but not installed."""
+
+    class ImageProcessingError(Exception):
+        """Raised when a source image cannot be decoded or resized."""
+
+    @dataclass(frozen=True)
+    class Variant:
+        """One derived image: the suffix appended before ``.png`` and its exact size."""
+
+        suffix: str
+        width: int
+        height: int
+
+    @dataclass
+    class Batch:
+        """Result of one render call: per source digest, the cached file for every variant suffix."""
+
+        outputs: Dict[str, Dict[str, Path]] = field(default_factory=dict)
+        resized: int = 0
+        reused: int = 0
+
+    DEFAULT_VARIANTS: Tuple["CardArtPipeline.Variant", ...] = ()
+
+    def __init__(self, root: Path, variants: Tuple["CardArtPipeline.Variant", ...] = ()) -> None:
+        self._root = Path(root).expanduser().resolve()
+        self._variants = tuple(variants) or CardArtPipeline.DEFAULT_VARIANTS
+        self._logger = logging.getLogger("stsm.card_art")
+        if not self._logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter("[%(asctime)s] %(levelname)s %(name)s: %(message)s")
+            handler.setFormatter(formatter)
+            self._logger.addHandler(handler)
+        self._logger.setLevel(logging.INFO)
+
+    @classmethod
+    def default_root(cls) -> Path:
+        return Path.home() / ".cache" / "stsmodder" / "card-art"
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @property
+    def variants(self) -> Tuple["CardArtPipeline.Variant", ...]:
+        return self._variants
+
+    @staticmethod
+    def variant_path(resource_path: str, suffix: str) -> str:
+        """Return the resource path of a variant, e.g. ``cards/Strike.png`` -> ``cards/Strike_p.png``."""
+
+        if not suffix:
+            return resource_path
+        stem, extension = os.path.splitext(resource_path)
+        return f"{stem}{suffix}{extension or '.png'}"
+
+    def cache_path(self, digest: str, variant: "CardArtPipeline.Variant") -> Path:
+        name = f"{digest}_{variant.width}x{variant.height}_v{CardArtPipeline.CACHE_FORMAT}.png"
+        return self._root / digest[:2] / name
+
+    def render(self, sources: Mapping[str, Path], workers: int = 0) -> "CardArtPipeline.Batch":
+        """Produce every variant for ``sources`` (source digest -> image path), resizing only cache misses."""
+
+        batch = CardArtPipeline.Batch()
+        jobs: List[Tuple[str, int, int, str]] = []
+        for digest, source in sources.items():
+            outputs: Dict[str, Path] = {}
+            for variant in self._variants:
+                target = self.cache_path(digest, variant)
+                outputs[variant.suffix] = target
+                if target.exists():
+                    batch.reused += 1
+                else:
+                    jobs.append((str(source), variant.width, variant.height, str(target)))
+            batch.outputs[digest] = outputs
+        if not jobs:
+            return batch
+        self.require_pillow()
+        worker_count = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+        if worker_count == 1:
+            for job in jobs:
+                CardArtPipeline._resize(*job)
+        else:
+            pool = ProcessPoolExecutor(max_workers=worker_count, mp_context=multiprocessing.get_context("spawn"))
+            with pool:
+                chunk_size = max(1, len(jobs) // (worker_count * 4))
+                list(pool.map(CardArtPipeline._resize, *zip(*jobs), chunksize=chunk_size))
+        batch.resized = len(jobs)
+        self._logger.info("Resized %d card art variants (%d reused from cache)", batch.resized, batch.reused)
+        return batch
+
+    @staticmethod
+    def require_pillow() -> None:
+        try:
+            import PIL  # noqa: F401  # pylint: disable=unused-import
+        except ImportError as exc:
+            raise CardArtPipeline.PillowUnavailableError(
+                "Pillow is required to generate card art variants; install it with 'pip install Pillow'"
+            ) from exc
+
+    @staticmethod
+    def _resize(source: str, width: int, height: int, target: str) -> str:
+        """Scale ``source`` to cover ``width`` x ``height``, centre-crop it and store it atomically; runs in workers."""
+
+        from PIL import Image, ImageOps
+
+        destination = Path(target)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with Image.open(source) as image:
+                fitted = ImageOps.fit(image.convert("RGBA"), (width, height), Image.Resampling.LANCZOS)
+        except (OSError, ValueError) as exc:
+            raise CardArtPipeline.ImageProcessingError(f"Unable to resize card art '{source}': {exc}") from exc
+        handle, temporary = tempfile.mkstemp(dir=destination.parent, suffix=".partial")
+        os.close(handle)
+        try:
+            fitted.save(temporary, format="PNG", optimize=False)
+            os.replace(temporary, destination)
+        finally:
+            Path(temporary).unlink(missing_ok=True)
+        return target
+
+
+CardArtPipeline.DEFAULT_VARIANTS = (
+    CardArtPipeline.Variant("", 250, 190),
+    CardArtPipeline.Variant("_p", 500, 380),
+)
+
+PluginManager.get_instance().register_module(__name__, sys.modules[__name__])
+
+__all__ = ["CardArtPipeline"]
@@ -0,0 +1,110 @@
+"""Row-at-a-time readers turning JSONL and CSV card catalogues into card definitions."""
+from __future__ import annotations
+
+import csv
+import json
+import sys
+from dataclasses import MISSING, fields
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+from modorchestrator import ModOrchestrator
+from plugin_manager import PluginManager
+
+
+class CardSource:
+    """Streams ``CardDefinition`` objects from a catalogue file without loading it whole.
+
+    Every row carries the ``CardDefinition`` field names. Integer fields accept numbers or
+    numeric strings, empty CSV cells fall back to the field default, and ``image_path`` is
+    resolved relative to the catalogue file. Unknown or missing columns fail with the line
+    number of the offending row. Pass the iterator to ``ModProject.card_stream`` so the build
+    consumes it in a single pass.
+    """
+
+    class RowError(ModOrchestrator.SpecificationError):
+        """Raised when a catalogue row cannot be turned into a card definition."""
+
+    SUFFIXES = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv"}
+
+    _FIELDS = {item.name: item for item in fields(ModOrchestrator.CardDefinition)}
+    _INT_FIELDS = frozenset(name for name, item in _FIELDS.items() if item.type in ("int", int))
+    _REQUIRED = frozenset(
+        name for name, item in _FIELDS.items() if item.default is MISSING and item.default_factory is MISSING
+    )
+
+    @classmethod
+    def open(cls, path: Path) -> Iterator["ModOrchestrator.CardDefinition"]:
+        """Dispatch on the file suffix: ``.jsonl``/``.ndjson`` or ``.csv``."""
+
+        path = Path(path)
+        kind = cls.SUFFIXES.get(path.suffix.lower())
+        if kind is None:
+            raise CardSource.RowError(f"Unsupported card catalogue '{path.name}'; expected .jsonl, .ndjson or .csv")
+        return cls.iter_jsonl(path) if kind == "jsonl" else cls.iter_csv(path)
+
+    @classmethod
+    def iter_jsonl(cls, path: Path) -> Iterator["ModOrchestrator.CardDefinition"]:
+        """Yield one card per non-blank line of a JSON Lines file."""
+
+        path = Path(path)
+        with path.open("r", encoding="utf-8") as handle:
+            for line_number, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError as exc:
+                    raise CardSource.RowError(f"{path.name}:{line_number}: invalid JSON: {exc.msg}") from exc
+                if not isinstance(row, dict):
+                    raise CardSource.RowError(f"{path.name}:{line_number}: expected a JSON object per line")
+                yield cls.card_from_row(row, path.parent, f"{path.name}:{line_number}")
+
+    @classmethod
+    def iter_csv(cls, path: Path) -> Iterator["ModOrchestrator.CardDefinition"]:
+        """Yield one card per data row of a CSV file whose header names the card fields."""
+
+        path = Path(path)
+        with path.open("r", encoding="utf-8", newline="") as handle:
+            reader = csv.DictReader(handle)
+            for row in reader:
+                location = f"{path.name}:{reader.line_num}"
+                if None in row:
+                    raise CardSource.RowError(f"{location}: row has more cells than the header")
+                values = {key: value for key, value in row.items() if value not in ("", None)}
+                yield cls.card_from_row(values, path.parent, location)
+
+    @classmethod
+    def card_from_row(
+        cls,
+        row: Mapping[str, Any],
+        base_dir: Optional[Path] = None,
+        location: str = "row",
+    ) -> "ModOrchestrator.CardDefinition":
+        unknown = sorted(set(row) - set(cls._FIELDS))
+        if unknown:
+            raise CardSource.RowError(f"{location}: unknown card fields {', '.join(unknown)}")
+        missing = sorted(cls._REQUIRED - set(row))
+        if missing:
+            raise CardSource.RowError(f"{location}: missing card fields {', '.join(missing)}")
+        values: Dict[str, Any] = {}
+        for name, value in row.items():
+            if name in cls._INT_FIELDS:
+                try:
+                    value = int(value)
+                except (TypeError, ValueError) as exc:
+                    raise CardSource.RowError(f"{location}: '{name}' must be an integer, got {value!r}") from exc
+            elif name == "image_path":
+                if value is not None:
+                    value = Path(value)
+                    if base_dir is not None and not value.is_absolute():
+                        value = base_dir / value
+            else:
+                value = str(value)
+            values[name] = value
+        return ModOrchestrator.CardDefinition(**values)
+
+
+PluginManager.get_instance().register_module(__name__, sys.modules[__name__])
+
+__all__ = ["CardSource"]
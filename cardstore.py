@@ -0,0 +1,286 @@
+"""Column-oriented card collection with secondary indexes for filtering large projects."""
+from __future__ import annotations
+
+import sys
+import weakref
+from array import array
+from bisect import bisect_left
+from collections.abc import MutableSequence
+from dataclasses import fields
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Union, overload
+
+from modorchestrator import ModOrchestrator
+from plugin_manager import PluginManager
+
+
+class CardStore(MutableSequence):
+    """Holds cards as columns instead of one object per card.
+
+    The enumerated fields (type, colour, rarity, target) are stored as small codes into a
+    per-store vocabulary, descriptions are interned so repeated texts are kept once, integer
+    fields live in ``array('i')`` columns (values outside 32 bits raise ``SpecificationError``)
+    and image paths are kept as strings. The store is a drop-in ``MutableSequence`` of
+    ``CardDefinition`` and can replace ``ModProject.cards``. Reading a row returns a
+    ``CardStore.Row``; while it is referenced, reading the same position returns the same
+    object, and assigning one of its fields writes the value back to the columns.
+
+    ``select`` and ``query`` filter on the ``INDEXED`` fields through per-value row indexes.
+    String comparisons are case-insensitive. Appends update the indexes in place; inserts and
+    deletions mark them stale, and the next query rebuilds them.
+    """
+
+    INDEXED = ("rarity", "card_color", "card_type", "cost")
+
+    class Row(ModOrchestrator.CardDefinition):
+        """A card materialised from a store; field assignments are written back to the store."""
+
+        __slots__ = ("_store", "_position", "__weakref__")
+
+        def __setattr__(self, name: str, value: Any) -> None:
+            store: Optional[CardStore] = getattr(self, "_store", None)
+            if store is not None and name in CardStore._FIELDS:
+                store._assign(self._position, name, value)
+            super().__setattr__(name, value)
+
+        def __eq__(self, other: object) -> bool:
+            if not isinstance(other, ModOrchestrator.CardDefinition):
+                return NotImplemented
+            return all(getattr(self, name) == getattr(other, name) for name in CardStore._FIELDS)
+
+        def __reduce__(self) -> Any:
+            # Pickled (e.g. for codegen workers) as a plain snapshot rather than with the whole store.
+            return ModOrchestrator.CardDefinition, tuple(getattr(self, name) for name in CardStore._FIELDS)
+
+    _FIELDS = tuple(item.name for item in fields(ModOrchestrator.CardDefinition))
+    _INT_FIELDS = tuple(
+        item.name for item in fields(ModOrchestrator.CardDefinition) if item.type in ("int", int)
+    )
+    _ENUM_FIELDS = ("card_type", "card_color", "rarity", "target")
+    _TEXT_FIELDS = tuple(
+        sorted(set(_FIELDS) - set(_INT_FIELDS) - set(_ENUM_FIELDS) - {"image_path"}, key=_FIELDS.index)
+    )
+    _INTERNED_FIELDS = frozenset({"description", "upgrade_description"})
+    _INT_RANGE = range(-(1 << 31), 1 << 31)
+
+    def __init__(self, cards: Iterable["ModOrchestrator.CardDefinition"] = ()) -> None:
+        self._strings: Dict[str, str] = {}
+        self._vocabulary: Dict[str, List[str]] = {name: [] for name in CardStore._ENUM_FIELDS}
+        self._codes: Dict[str, Dict[str, int]] = {name: {} for name in CardStore._ENUM_FIELDS}
+        self._enum_columns: Dict[str, array] = {name: array("H") for name in CardStore._ENUM_FIELDS}
+        self._text_columns: Dict[str, List[str]] = {name: [] for name in CardStore._TEXT_FIELDS}
+        self._int_columns: Dict[str, array] = {name: array("i") for name in CardStore._INT_FIELDS}
+        self._images: List[Optional[str]] = []
+        self._indexes: Optional[Dict[str, Dict[Any, List[int]]]] = {name: {} for name in CardStore.INDEXED}
+        self._rows: "weakref.WeakValueDictionary[int, CardStore.Row]" = weakref.WeakValueDictionary()
+        self.extend(cards)
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    @overload
+    def __getitem__(self, index: int) -> "ModOrchestrator.CardDefinition": ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List["ModOrchestrator.CardDefinition"]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union["ModOrchestrator.CardDefinition", List["ModOrchestrator.CardDefinition"]]:
+        if isinstance(index, slice):
+            return [self._row(position) for position in range(*index.indices(len(self)))]
+        return self._row(self._position(index))
+
+    def __setitem__(self, index: int, card: "ModOrchestrator.CardDefinition") -> None:
+        if isinstance(index, slice):
+            raise TypeError("CardStore does not support slice assignment")
+        position = self._position(index)
+        self._check_ints(card)
+        for name in CardStore._FIELDS:
+            self._assign(position, name, getattr(card, name))
+        row = self._rows.get(position)
+        if row is not None and row is not card:
+            row._store = None
+            del self._rows[position]
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        selected = range(len(self))[index]
+        removed = sorted(selected) if isinstance(selected, range) else [selected]
+        columns = (*self._enum_columns.values(), *self._text_columns.values(), *self._int_columns.values())
+        for column in (*columns, self._images):
+            del column[index]
+        self._indexes = None
+        gone = set(removed)
+        shifted: Dict[int, CardStore.Row] = {}
+        for position, row in list(self._rows.items()):
+            if position in gone:
+                row._store = None
+            else:
+                shifted[position - bisect_left(removed, position)] = row
+        self._move_rows(shifted)
+
+    def __iter__(self) -> Iterator["ModOrchestrator.CardDefinition"]:
+        for position in range(len(self)):
+            yield self._row(position)
+
+    def __repr__(self) -> str:
+        return f"CardStore({len(self)} cards)"
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        state["_rows"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._rows = weakref.WeakValueDictionary()
+
+    def insert(self, index: int, card: "ModOrchestrator.CardDefinition") -> None:
+        self._check_ints(card)
+        appending = index >= len(self)
+        if not appending and self._rows:
+            start = max(index + len(self), 0) if index < 0 else index
+            self._move_rows({position + (position >= start): row for position, row in list(self._rows.items())})
+        for name, column in self._enum_columns.items():
+            column.insert(index, self._encode(name, getattr(card, name)))
+        for name, column in self._text_columns.items():
+            column.insert(index, self._text(name, getattr(card, name)))
+        for name, column in self._int_columns.items():
+            column.insert(index, getattr(card, name))
+        self._images.insert(index, None if card.image_path is None else str(card.image_path))
+        if not appending:
+            self._indexes = None
+        elif self._indexes is not None:
+            position = len(self) - 1
+            for name, index_map in self._indexes.items():
+                index_map.setdefault(self._key(name, position), []).append(position)
+
+    def select(self, **criteria: Any) -> List[int]:
+        """Return the positions of cards matching every criterion, in store order.
+
+        Each keyword names an ``INDEXED`` field; its value is one value or a collection of
+        accepted values, e.g. ``select(rarity="RARE", card_type="ATTACK", cost=(0, 1))``.
+        """
+
+        unknown = sorted(set(criteria) - set(CardStore.INDEXED))
+        if unknown:
+            raise KeyError(f"CardStore cannot filter on {', '.join(unknown)}; indexed fields are {CardStore.INDEXED}")
+        indexes = self._ensure_indexes()
+        matches: Optional[Set[int]] = None
+        for name, accepted in sorted(criteria.items(), key=lambda item: self._estimate(indexes, *item)):
+            rows: Set[int] = set()
+            for value in self._values(accepted):
+                rows.update(indexes[name].get(self._normalise(name, value), ()))
+            matches = rows if matches is None else matches & rows
+            if not matches:
+                return []
+        return sorted(range(len(self)) if matches is None else matches)
+
+    def query(self, **criteria: Any) -> List["ModOrchestrator.CardDefinition"]:
+        """Return the cards matching ``criteria``; see ``select``."""
+
+        return [self._row(position) for position in self.select(**criteria)]
+
+    def counts(self, field_name: str) -> Dict[Any, int]:
+        """Return how many cards carry each value of an indexed field."""
+
+        if field_name not in CardStore.INDEXED:
+            raise KeyError(f"CardStore does not index '{field_name}'")
+        return {value: len(rows) for value, rows in self._ensure_indexes()[field_name].items()}
+
+    def _row(self, position: int) -> "CardStore.Row":
+        row = self._rows.get(position)
+        if row is not None:
+            return row
+        values: Dict[str, Any] = {name: column[position] for name, column in self._text_columns.items()}
+        values.update({name: self._vocabulary[name][column[position]] for name, column in self._enum_columns.items()})
+        values.update({name: column[position] for name, column in self._int_columns.items()})
+        image = self._images[position]
+        values["image_path"] = None if image is None else Path(image)
+        row = CardStore.Row(**values)
+        row._position = position
+        row._store = self
+        self._rows[position] = row
+        return row
+
+    def _assign(self, position: int, name: str, value: Any) -> None:
+        if name in self._enum_columns:
+            self._enum_columns[name][position] = self._encode(name, value)
+        elif name in self._text_columns:
+            self._text_columns[name][position] = self._text(name, value)
+        elif name in self._int_columns:
+            self._int_columns[name][position] = self._checked_int(self._text_columns["card_id"][position], name, value)
+        else:
+            self._images[position] = None if value is None else str(value)
+        if name in CardStore.INDEXED:
+            self._indexes = None
+
+    def _check_ints(self, card: "ModOrchestrator.CardDefinition") -> None:
+        # Checked up front so a rejected card never leaves the columns with different lengths.
+        for name in CardStore._INT_FIELDS:
+            self._checked_int(card.card_id, name, getattr(card, name))
+
+    @staticmethod
+    def _checked_int(card_id: str, name: str, value: Any) -> int:
+        if isinstance(value, int) and value in CardStore._INT_RANGE:
+            return value
+        raise ModOrchestrator.SpecificationError(
+            f"Card '{card_id}' {name} must be an integer between {CardStore._INT_RANGE.start} and "
+            f"{CardStore._INT_RANGE.stop - 1}, got {value!r}"
+        )
+
+    def _move_rows(self, rows: Dict[int, "CardStore.Row"]) -> None:
+        self._rows = weakref.WeakValueDictionary()
+        for position, row in rows.items():
+            row._position = position
+            self._rows[position] = row
+
+    def _position(self, index: int) -> int:
+        position = index + len(self) if index < 0 else index
+        if not 0 <= position < len(self):
+            raise IndexError("CardStore index out of range")
+        return position
+
+    def _encode(self, name: str, value: str) -> int:
+        codes = self._codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self._vocabulary[name])
+            self._vocabulary[name].append(value)
+        return code
+
+    def _text(self, name: str, value: str) -> str:
+        if name in CardStore._INTERNED_FIELDS:
+            return self._strings.setdefault(value, value)
+        return value
+
+    def _key(self, name: str, position: int) -> Any:
+        if name in self._int_columns:
+            return self._int_columns[name][position]
+        return self._vocabulary[name][self._enum_columns[name][position]].upper()
+
+    def _normalise(self, name: str, value: Any) -> Any:
+        return value if name in self._int_columns else str(value).upper()
+
+    def _ensure_indexes(self) -> Dict[str, Dict[Any, List[int]]]:
+        if self._indexes is None:
+            indexes: Dict[str, Dict[Any, List[int]]] = {name: {} for name in CardStore.INDEXED}
+            for position in range(len(self)):
+                for name, index_map in indexes.items():
+                    index_map.setdefault(self._key(name, position), []).append(position)
+            self._indexes = indexes
+        return self._indexes
+
+    @staticmethod
+    def _values(accepted: Any) -> Iterable[Any]:
+        if isinstance(accepted, (str, int)):
+            return (accepted,)
+        return accepted
+
+    def _estimate(self, indexes: Dict[str, Dict[Any, List[int]]], name: str, accepted: Any) -> int:
+        return sum(len(indexes[name].get(self._normalise(name, value), ())) for value in self._values(accepted))
+
+
+PluginManager.get_instance().register_module(__name__, sys.modules[__name__])
+
+__all__ = ["CardStore"]
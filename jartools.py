@@ -0,0 +1,525 @@
+"""Streaming jar writer with parallel compression, a central-directory reader and jar diffing."""
+from __future__ import annotations
+
+import logging
+import os
+import struct
+import sys
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from plugin_manager import PluginManager
+
+
+class JarReader:
+    """Reads a jar's central directory and raw entry payloads without decompressing anything."""
+
+    _END_RECORD = struct.Struct("<IHHHHIIH")
+    _ZIP64_END_RECORD = struct.Struct("<IQHHIIQQQQ")
+    _ZIP64_LOCATOR = struct.Struct("<IIQI")
+    _CENTRAL_HEADER = struct.Struct("<IHHHHHHIIIHHHHHII")
+    _LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+    _MAX_32 = 0xFFFFFFFF
+    _MAX_16 = 0xFFFF
+
+    class FormatError(Exception):
+        """Raised when a file is not a readable zip archive."""
+
+    @dataclass
+    class Member:
+        """Central directory record of one entry."""
+
+        name: str
+        method: int
+        crc: int
+        compressed_size: int
+        size: int
+        header_offset: int
+        dos_time: int
+        dos_date: int
+        mode: int
+
+    def __init__(self, path: Path) -> None:
+        self._path = Path(path)
+        self._members: Optional[Dict[str, JarReader.Member]] = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def members(self) -> Dict[str, "JarReader.Member"]:
+        """Return the entries in archive order, keyed by name; only the directory is read."""
+
+        if self._members is None:
+            try:
+                with self._path.open("rb") as handle:
+                    self._members = self._read_directory(handle)
+            except (OSError, struct.error) as exc:
+                raise JarReader.FormatError(f"Unable to read {self._path}: {exc}") from exc
+        return self._members
+
+    def raw_payload(self, member: "JarReader.Member") -> bytes:
+        """Return the stored (possibly deflated) bytes of ``member`` exactly as they sit in the archive."""
+
+        with self._path.open("rb") as handle:
+            handle.seek(member.header_offset)
+            header = handle.read(self._LOCAL_HEADER.size)
+            fields = self._LOCAL_HEADER.unpack(header)
+            if fields[0] != 0x04034B50:
+                raise JarReader.FormatError(f"Corrupt local header for '{member.name}' in {self._path}")
+            handle.seek(fields[9] + fields[10], os.SEEK_CUR)
+            payload = handle.read(member.compressed_size)
+        if len(payload) != member.compressed_size:
+            raise JarReader.FormatError(f"Truncated entry '{member.name}' in {self._path}")
+        return payload
+
+    def _read_directory(self, handle) -> Dict[str, "JarReader.Member"]:
+        handle.seek(0, os.SEEK_END)
+        file_size = handle.tell()
+        tail_size = min(file_size, self._END_RECORD.size + self._MAX_16)
+        handle.seek(file_size - tail_size)
+        tail = handle.read(tail_size)
+        position = tail.rfind(b"PK\x05\x06")
+        if position < 0:
+            raise JarReader.FormatError(f"{self._path} has no end of central directory record")
+        _, _, _, _, count, directory_size, directory_offset, _ = self._END_RECORD.unpack_from(tail, position)
+        if count == self._MAX_16 or directory_size == self._MAX_32 or directory_offset == self._MAX_32:
+            locator_at = file_size - tail_size + position - self._ZIP64_LOCATOR.size
+            handle.seek(locator_at)
+            signature, _, record_offset, _ = self._ZIP64_LOCATOR.unpack(handle.read(self._ZIP64_LOCATOR.size))
+            if signature != 0x07064B50:
+                raise JarReader.FormatError(f"{self._path} has a damaged zip64 locator")
+            handle.seek(record_offset)
+            record = self._ZIP64_END_RECORD.unpack(handle.read(self._ZIP64_END_RECORD.size))
+            count, directory_size, directory_offset = record[7], record[8], record[9]
+        handle.seek(directory_offset)
+        directory = handle.read(directory_size)
+        members: Dict[str, JarReader.Member] = {}
+        cursor = 0
+        for _ in range(count):
+            fields = self._CENTRAL_HEADER.unpack_from(directory, cursor)
+            if fields[0] != 0x02014B50:
+                raise JarReader.FormatError(f"{self._path} has a corrupt central directory")
+            name_length, extra_length, comment_length = fields[10], fields[11], fields[12]
+            start = cursor + self._CENTRAL_HEADER.size
+            raw_name = directory[start : start + name_length]
+            extra = directory[start + name_length : start + name_length + extra_length]
+            compressed_size, size, header_offset = fields[8], fields[9], fields[16]
+            if self._MAX_32 in (compressed_size, size, header_offset):
+                size, compressed_size, header_offset = self._zip64_values(extra, size, compressed_size, header_offset)
+            name = raw_name.decode("utf-8" if fields[3] & 0x0800 else "cp437")
+            members[name] = JarReader.Member(
+                name=name,
+                method=fields[4],
+                crc=fields[7],
+                compressed_size=compressed_size,
+                size=size,
+                header_offset=header_offset,
+                dos_time=fields[5],
+                dos_date=fields[6],
+                mode=fields[15] >> 16,
+            )
+            cursor = start + name_length + extra_length + comment_length
+        return members
+
+    def _zip64_values(
+        self,
+        extra: bytes,
+        size: int,
+        compressed_size: int,
+        header_offset: int,
+    ) -> Tuple[int, int, int]:
+        cursor = 0
+        while cursor + 4 <= len(extra):
+            tag, length = struct.unpack_from("<HH", extra, cursor)
+            if tag == 0x0001:
+                values = list(struct.unpack_from(f"<{length // 8}Q", extra, cursor + 4))
+                if size == self._MAX_32:
+                    size = values.pop(0)
+                if compressed_size == self._MAX_32:
+                    compressed_size = values.pop(0)
+                if header_offset == self._MAX_32:
+                    header_offset = values.pop(0)
+                break
+            cursor += 4 + length
+        return size, compressed_size, header_offset
+
+
+class JarWriter:
+    """Writes jar (zip) archives, deflating entries on a thread pool while output streams in order.
+
+    Entries are prepared (read, checksummed and compressed) by worker threads; ``zlib``
+    releases the GIL, so compression scales with cores. At most a bounded window of prepared
+    entries is held in memory and the archive is written to a temporary file that replaces
+    the destination once complete. Formats that are already compressed are stored as-is.
+
+    Given a ``previous`` archive written with the same settings, entries whose CRC and size
+    are unchanged have their compressed bytes copied verbatim instead of being deflated again,
+    and keep their previous timestamp. Compression is deterministic, so reused payloads are
+    byte-identical to freshly deflated ones. In-memory entries are dated 1980-01-01 00:00 UTC.
+
+    With ``deterministic=True`` entries are sorted by name (manifest first), every entry gets
+    the same timestamp (``SOURCE_DATE_EPOCH`` when set, otherwise 1980-01-01 00:00 UTC) and
+    permissions are normalised to ``0644``, so identical inputs yield identical bytes.
+    """
+
+    STORED_SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".gif", ".ogg", ".mp3", ".zip", ".jar", ".gz"})
+    MANIFEST_NAME = "META-INF/MANIFEST.MF"
+    DEFAULT_EPOCH = 315532800
+
+    _LOCAL_HEADER = JarReader._LOCAL_HEADER
+    _CENTRAL_HEADER = JarReader._CENTRAL_HEADER
+    _END_RECORD = JarReader._END_RECORD
+    _ZIP64_END_RECORD = JarReader._ZIP64_END_RECORD
+    _ZIP64_LOCATOR = JarReader._ZIP64_LOCATOR
+    _MAX_32 = JarReader._MAX_32
+    _MAX_16 = JarReader._MAX_16
+
+    class JarError(Exception):
+        """Raised when an archive cannot be written."""
+
+    @dataclass
+    class Entry:
+        """One archive member, backed by a file on disk or by in-memory ``data``."""
+
+        name: str
+        source: Optional[Path] = None
+        data: Optional[bytes] = None
+
+        @classmethod
+        def from_file(cls, name: str, source: Path) -> "JarWriter.Entry":
+            return cls(name=name, source=source)
+
+    @dataclass
+    class Prepared:
+        """Entry after checksumming and compression, ready to be streamed into the archive."""
+
+        name: bytes
+        method: int
+        crc: int
+        size: int
+        payload: bytes
+        dos_time: int
+        dos_date: int
+        mode: int
+        payload_size: int = 0
+        reused: bool = False
+
+    @dataclass
+    class Summary:
+        """Totals for one written archive."""
+
+        entries: int = 0
+        deflated: int = 0
+        stored: int = 0
+        reused: int = 0
+        bytes_in: int = 0
+        bytes_out: int = 0
+        seconds: float = 0.0
+
+    def __init__(self, workers: int = 0, compression_level: int = 6, deterministic: bool = False) -> None:
+        if not 0 <= compression_level <= 9:
+            raise JarWriter.JarError(f"Compression level must be between 0 and 9, got {compression_level}")
+        self._workers = max(1, workers or os.cpu_count() or 1)
+        self._compression_level = compression_level
+        self._deterministic = deterministic
+        self._fixed_timestamp: Optional[Tuple[int, int]] = None
+        if deterministic:
+            try:
+                epoch = int(os.environ.get("SOURCE_DATE_EPOCH", JarWriter.DEFAULT_EPOCH))
+            except ValueError as exc:
+                raise JarWriter.JarError("SOURCE_DATE_EPOCH must be an integer number of seconds") from exc
+            self._fixed_timestamp = self._dos_timestamp(max(epoch, JarWriter.DEFAULT_EPOCH), utc=True)
+        self._logger = logging.getLogger("stsm.jar_writer")
+        if not self._logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter("[%(asctime)s] %(levelname)s %(name)s: %(message)s")
+            handler.setFormatter(formatter)
+            self._logger.addHandler(handler)
+        self._logger.setLevel(logging.INFO)
+
+    @staticmethod
+    def directory_entries(root: Path, prefix: str = "") -> List["JarWriter.Entry"]:
+        """List every file below ``root`` as an entry named by its path relative to ``root``."""
+
+        entries: List[JarWriter.Entry] = []
+        for path in sorted(root.rglob("*")):
+            if path.is_file():
+                entries.append(JarWriter.Entry.from_file(prefix + path.relative_to(root).as_posix(), path))
+        return entries
+
+    def should_compress(self, name: str) -> bool:
+        lowered = name.lower()
+        return self._compression_level > 0 and not any(lowered.endswith(suffix) for suffix in self.STORED_SUFFIXES)
+
+    def write(
+        self,
+        destination: Path,
+        entries: Iterable["JarWriter.Entry"],
+        previous: Optional[Path] = None,
+    ) -> "JarWriter.Summary":
+        """Write ``entries`` to ``destination`` in order; later entries reusing a name are skipped.
+
+        ``previous`` may be ``destination`` itself; it is only replaced once the new archive is complete.
+        """
+
+        started = time.perf_counter()
+        reader: Optional[JarReader] = None
+        if previous is not None and previous.exists():
+            reader = JarReader(previous)
+            try:
+                reader.members()
+            except JarReader.FormatError as exc:
+                self._logger.warning("Ignoring unreadable previous jar: %s", exc)
+                reader = None
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        temporary = destination.with_name(destination.name + ".partial")
+        summary = JarWriter.Summary()
+        central: List[Tuple[JarWriter.Prepared, int]] = []
+        seen: Set[str] = set()
+        window = self._workers * 4
+        if self._deterministic:
+            entries = sorted(entries, key=lambda entry: (entry.name != JarWriter.MANIFEST_NAME, entry.name))
+        try:
+            with temporary.open("wb") as handle, ThreadPoolExecutor(
+                max_workers=self._workers, thread_name_prefix="stsm-jar"
+            ) as pool:
+                in_flight: Deque[Future] = deque()
+                for entry in entries:
+                    if entry.name in seen:
+                        self._logger.warning("Skipping duplicate jar entry %s", entry.name)
+                        continue
+                    seen.add(entry.name)
+                    in_flight.append(pool.submit(self._prepare, entry, reader))
+                    if len(in_flight) >= window:
+                        self._stream(handle, in_flight.popleft().result(), central, summary)
+                while in_flight:
+                    self._stream(handle, in_flight.popleft().result(), central, summary)
+                self._write_central_directory(handle, central)
+                summary.bytes_out = handle.tell()
+            os.replace(temporary, destination)
+        except BaseException:
+            temporary.unlink(missing_ok=True)
+            raise
+        summary.seconds = time.perf_counter() - started
+        self._logger.info(
+            "Wrote %s: %d entries (%d deflated, %d stored, %d reused), %d -> %d bytes in %.3fs",
+            destination.name,
+            summary.entries,
+            summary.deflated,
+            summary.stored,
+            summary.reused,
+            summary.bytes_in,
+            summary.bytes_out,
+            summary.seconds,
+        )
+        return summary
+
+    def _prepare(self, entry: "JarWriter.Entry", previous: Optional[JarReader] = None) -> "JarWriter.Prepared":
+        mtime: Optional[float] = None
+        if entry.data is not None:
+            data = entry.data
+            mode = 0o100644
+        elif entry.source is not None:
+            stat = entry.source.stat()
+            data = entry.source.read_bytes()
+            mtime = stat.st_mtime
+            mode = stat.st_mode & 0xFFFF
+        else:
+            raise JarWriter.JarError(f"Jar entry '{entry.name}' has neither a source file nor data")
+        if len(data) >= self._MAX_32:
+            raise JarWriter.JarError(f"Jar entry '{entry.name}' exceeds 4 GiB")
+        crc = zlib.crc32(data)
+        member = previous.members().get(entry.name) if previous is not None else None
+        reused = member is not None and member.crc == crc and member.size == len(data) and member.method in (0, 8)
+        if reused and member.method == zlib.DEFLATED:
+            method, payload = zlib.DEFLATED, previous.raw_payload(member)
+        elif reused:
+            method, payload = 0, data
+        else:
+            method, payload = zlib.DEFLATED, b""
+            if self.should_compress(entry.name):
+                compressor = zlib.compressobj(self._compression_level, zlib.DEFLATED, -15)
+                payload = compressor.compress(data) + compressor.flush()
+            if not payload or len(payload) >= len(data):
+                method, payload = 0, data
+        if self._fixed_timestamp is not None:
+            dos_time, dos_date = self._fixed_timestamp
+        elif reused:
+            dos_time, dos_date = member.dos_time, member.dos_date
+        elif mtime is None:
+            # In-memory entries have no file time; a constant keeps rewrites of the same data identical.
+            dos_time, dos_date = self._dos_timestamp(JarWriter.DEFAULT_EPOCH, utc=True)
+        else:
+            dos_time, dos_date = self._dos_timestamp(mtime)
+        if self._deterministic:
+            mode = 0o100644
+        return JarWriter.Prepared(
+            name=entry.name.encode("utf-8"),
+            method=method,
+            crc=crc,
+            size=len(data),
+            payload=payload,
+            payload_size=len(payload),
+            dos_time=dos_time,
+            dos_date=dos_date,
+            mode=mode,
+            reused=reused,
+        )
+
+    def _stream(
+        self,
+        handle,
+        prepared: "JarWriter.Prepared",
+        central: List[Tuple["JarWriter.Prepared", int]],
+        summary: "JarWriter.Summary",
+    ) -> None:
+        offset = handle.tell()
+        handle.write(
+            self._LOCAL_HEADER.pack(
+                0x04034B50,
+                20,
+                self._flags(prepared.name),
+                prepared.method,
+                prepared.dos_time,
+                prepared.dos_date,
+                prepared.crc,
+                prepared.payload_size,
+                prepared.size,
+                len(prepared.name),
+                0,
+            )
+        )
+        handle.write(prepared.name)
+        handle.write(prepared.payload)
+        central.append((prepared, offset))
+        summary.entries += 1
+        summary.bytes_in += prepared.size
+        if prepared.method:
+            summary.deflated += 1
+        else:
+            summary.stored += 1
+        if prepared.reused:
+            summary.reused += 1
+        # The payload is no longer needed once streamed; only header fields stay for the directory.
+        prepared.payload = b""
+
+    def _write_central_directory(self, handle, central: List[Tuple["JarWriter.Prepared", int]]) -> None:
+        directory_offset = handle.tell()
+        for prepared, offset in central:
+            extra = b""
+            header_offset = offset
+            if offset >= self._MAX_32:
+                extra = struct.pack("<HHQ", 0x0001, 8, offset)
+                header_offset = self._MAX_32
+            handle.write(
+                self._CENTRAL_HEADER.pack(
+                    0x02014B50,
+                    (3 << 8) | 20,
+                    45 if extra else 20,
+                    self._flags(prepared.name),
+                    prepared.method,
+                    prepared.dos_time,
+                    prepared.dos_date,
+                    prepared.crc,
+                    prepared.payload_size,
+                    prepared.size,
+                    len(prepared.name),
+                    len(extra),
+                    0,
+                    0,
+                    0,
+                    prepared.mode << 16,
+                    header_offset,
+                )
+            )
+            handle.write(prepared.name)
+            handle.write(extra)
+        directory_end = handle.tell()
+        directory_size = directory_end - directory_offset
+        count = len(central)
+        if count > self._MAX_16 or directory_offset >= self._MAX_32 or directory_size >= self._MAX_32:
+            handle.write(
+                self._ZIP64_END_RECORD.pack(
+                    0x06064B50, 44, (3 << 8) | 45, 45, 0, 0, count, count, directory_size, directory_offset
+                )
+            )
+            handle.write(self._ZIP64_LOCATOR.pack(0x07064B50, 0, directory_end, 1))
+            handle.write(
+                self._END_RECORD.pack(
+                    0x06054B50, 0, 0, self._MAX_16, self._MAX_16, self._MAX_32, self._MAX_32, 0
+                )
+            )
+            return
+        handle.write(
+            self._END_RECORD.pack(0x06054B50, 0, 0, count, count, directory_size, directory_offset, 0)
+        )
+
+    @staticmethod
+    def _flags(name: bytes) -> int:
+        # Bit 11 marks UTF-8 names; plain ASCII names leave it clear like the JDK jar tool.
+        return 0x0800 if any(byte > 0x7F for byte in name) else 0
+
+    @staticmethod
+    def _dos_timestamp(mtime: float, utc: bool = False) -> Tuple[int, int]:
+        local = time.gmtime(mtime) if utc else time.localtime(mtime)
+        if local.tm_year < 1980:
+            return 0, (1 << 5) | 1
+        dos_date = ((local.tm_year - 1980) << 9) | (local.tm_mon << 5) | local.tm_mday
+        dos_time = (local.tm_hour << 11) | (local.tm_min << 5) | (local.tm_sec // 2)
+        return dos_time, dos_date
+
+
+class JarDiff:
+    """Compares two jars entry by entry using only their central directories."""
+
+    @dataclass
+    class Result:
+        """Entry names grouped by how they differ between the left and right jar."""
+
+        added: List[str] = field(default_factory=list)
+        removed: List[str] = field(default_factory=list)
+        changed: List[str] = field(default_factory=list)
+        metadata_changed: List[str] = field(default_factory=list)
+        unchanged: int = 0
+
+        @property
+        def identical(self) -> bool:
+            """True when every entry has the same content; timestamps and permissions are ignored."""
+
+            return not (self.added or self.removed or self.changed)
+
+    @staticmethod
+    def compare(left: Path, right: Path) -> "JarDiff.Result":
+        left_members = JarReader(left).members()
+        right_members = JarReader(right).members()
+        result = JarDiff.Result()
+        for name in sorted(set(left_members) | set(right_members)):
+            before = left_members.get(name)
+            after = right_members.get(name)
+            if before is None:
+                result.added.append(name)
+            elif after is None:
+                result.removed.append(name)
+            elif (before.crc, before.size) != (after.crc, after.size):
+                result.changed.append(name)
+            else:
+                result.unchanged += 1
+                if (before.dos_time, before.dos_date, before.mode, before.method) != (
+                    after.dos_time,
+                    after.dos_date,
+                    after.mode,
+                    after.method,
+                ):
+                    result.metadata_changed.append(name)
+        return result
+
+
+PluginManager.get_instance().register_module(__name__, sys.modules[__name__])
+
+__all__ = ["JarDiff", "JarReader", "JarWriter"]
@@ -0,0 +1,628 @@
+"""Java compiler backends used by the mod export pipeline."""
+from __future__ import annotations
+
+import logging
+import os
+import re
+import subprocess
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from logic import APPLICATION_LOGIC, ApplicationLogic
+from plugin_manager import PluginManager
+
+
+class JavaCompilerService:
+    """Compiles Java sources through a fresh javac process or a long-lived in-JVM compiler."""
+
+    SUBPROCESS = "subprocess"
+    JVM = "jvm"
+
+    class CompilerUnavailableError(Exception):
+        """Raised when the requested compiler backend cannot be used."""
+
+    class CompileCancelledError(Exception):
+        """Raised when a compilation is cancelled or exceeds its timeout; ``timed_out`` tells which."""
+
+        def __init__(self, message: str, timed_out: bool = False) -> None:
+            super().__init__(message)
+            self.timed_out = timed_out
+
+    @dataclass
+    class Diagnostic:
+        """Structured compiler message."""
+
+        kind: str
+        message: str
+        source: Optional[str] = None
+        line: Optional[int] = None
+        column: Optional[int] = None
+        code: Optional[str] = None
+
+        def format(self) -> str:
+            location = ""
+            if self.source:
+                location = self.source
+                if self.line is not None:
+                    location += f":{self.line}"
+                    if self.column is not None:
+                        location += f":{self.column}"
+                location += ": "
+            return f"{location}{self.kind.lower()}: {self.message}"
+
+    @dataclass
+    class CompileRequest:
+        """Sources, classpath and output location for one compiler invocation.
+
+        ``source_texts`` maps package-relative paths such as ``com/buddy/Mod.java`` to source
+        text compiled without a file on disk. Without an ``output_dir`` the class files are
+        returned in ``CompileResult.classes`` instead of being written.
+
+        Setting ``cancel_event`` or exceeding ``timeout`` seconds kills a running javac process;
+        in-JVM compilations cannot be interrupted and only honour a cancellation that arrives
+        before they start.
+        """
+
+        sources: List[Path]
+        classpath: List[str]
+        output_dir: Optional[Path]
+        javac: str = ""
+        release: Optional[str] = "8"
+        encoding: str = "UTF-8"
+        source_texts: Dict[str, str] = field(default_factory=dict)
+        timeout: Optional[float] = None
+        cancel_event: Optional[threading.Event] = field(default=None, repr=False, compare=False)
+
+    @dataclass
+    class CompileResult:
+        """Outcome of one compiler invocation."""
+
+        success: bool
+        backend: str
+        diagnostics: List["JavaCompilerService.Diagnostic"] = field(default_factory=list)
+        duration: float = 0.0
+        exit_code: int = 0
+        raw_output: str = ""
+        classes: Dict[str, bytes] = field(default_factory=dict)
+
+        @property
+        def errors(self) -> List["JavaCompilerService.Diagnostic"]:
+            return [diagnostic for diagnostic in self.diagnostics if diagnostic.kind == "ERROR"]
+
+    class SubprocessBackend:
+        """Runs javac as a child process; the release-flag probe is cached per binary."""
+
+        _HEADER = re.compile(r"^(?P<source>.+?\.java):(?P<line>\d+): (?P<kind>error|warning|note): (?P<message>.*)$")
+        _BARE = re.compile(r"^(?P<kind>error|warning|note): (?P<message>.*)$", re.IGNORECASE)
+        POLL_INTERVAL = 0.1
+
+        def __init__(self) -> None:
+            self._release_support: Dict[Tuple[str, int], bool] = {}
+            self._versions: Dict[Tuple[str, int], str] = {}
+            self._lock = threading.Lock()
+
+        def supports_release_flag(self, javac: str) -> bool:
+            try:
+                key = (javac, Path(javac).stat().st_mtime_ns)
+            except OSError:
+                key = (javac, 0)
+            with self._lock:
+                cached = self._release_support.get(key)
+            if cached is not None:
+                return cached
+            try:
+                completed = subprocess.run([javac, "--help"], check=False, capture_output=True, text=True)
+            except FileNotFoundError as exc:
+                raise JavaCompilerService.CompilerUnavailableError("javac binary not executable") from exc
+            supported = "--release" in completed.stdout
+            with self._lock:
+                self._release_support[key] = supported
+            return supported
+
+        def version(self, javac: str) -> str:
+            try:
+                key = (f"version:{javac}", Path(javac).stat().st_mtime_ns)
+            except OSError:
+                key = (f"version:{javac}", 0)
+            with self._lock:
+                cached = self._versions.get(key)
+            if cached is not None:
+                return cached
+            try:
+                completed = subprocess.run([javac, "-version"], check=False, capture_output=True, text=True)
+            except FileNotFoundError as exc:
+                raise JavaCompilerService.CompilerUnavailableError("javac binary not executable") from exc
+            reported = (completed.stdout + completed.stderr).strip()
+            with self._lock:
+                self._versions[key] = reported
+            return reported
+
+        def compile(self, request: "JavaCompilerService.CompileRequest") -> "JavaCompilerService.CompileResult":
+            if not request.javac:
+                raise JavaCompilerService.CompilerUnavailableError("Subprocess backend requires a javac path")
+            if request.source_texts or request.output_dir is None:
+                return self._compile_staged(request)
+            command = [request.javac, "-encoding", request.encoding, "-d", str(request.output_dir)]
+            if request.release and self.supports_release_flag(request.javac):
+                command.extend(["--release", request.release])
+            if request.classpath:
+                command.extend(["-cp", os.pathsep.join(request.classpath)])
+            started = time.perf_counter()
+            with tempfile.TemporaryDirectory(prefix="stsm-javac-") as scratch:
+                argument_file = Path(scratch) / "sources.txt"
+                argument_file.write_text(
+                    "\n".join(self._quote_argument(str(path)) for path in request.sources) + "\n",
+                    encoding="utf-8",
+                )
+                command.append(f"@{argument_file}")
+                exit_code, stderr = self._execute(command, request)
+            return JavaCompilerService.CompileResult(
+                success=exit_code == 0,
+                backend=JavaCompilerService.SUBPROCESS,
+                diagnostics=self.parse_diagnostics(stderr),
+                duration=time.perf_counter() - started,
+                exit_code=exit_code,
+                raw_output=stderr.strip(),
+            )
+
+        def _execute(self, command: List[str], request: "JavaCompilerService.CompileRequest") -> Tuple[int, str]:
+            """Run javac and return its exit code and stderr, killing it on cancellation or timeout."""
+
+            try:
+                process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            except FileNotFoundError as exc:
+                raise JavaCompilerService.CompilerUnavailableError("javac binary not executable") from exc
+            if request.cancel_event is None and not request.timeout:
+                _, stderr = process.communicate()
+                return process.returncode, stderr
+            deadline = time.monotonic() + request.timeout if request.timeout else None
+            while True:
+                wait = self.POLL_INTERVAL
+                if deadline is not None:
+                    wait = max(0.0, min(wait, deadline - time.monotonic()))
+                try:
+                    _, stderr = process.communicate(timeout=wait)
+                    return process.returncode, stderr
+                except subprocess.TimeoutExpired:
+                    timed_out = deadline is not None and time.monotonic() >= deadline
+                    if not timed_out and not (request.cancel_event is not None and request.cancel_event.is_set()):
+                        continue
+                process.kill()
+                process.communicate()
+                if timed_out:
+                    raise JavaCompilerService.CompileCancelledError(
+                        f"javac exceeded its {request.timeout:g}s timeout and was stopped", timed_out=True
+                    )
+                raise JavaCompilerService.CompileCancelledError("javac was cancelled")
+
+        def _compile_staged(
+            self, request: "JavaCompilerService.CompileRequest"
+        ) -> "JavaCompilerService.CompileResult":
+            """Run javac on in-memory sources through a private scratch directory and read the classes back.
+
+            javac cannot read or write memory, so this backend pays one local round trip; the
+            caller's build tree is never touched.
+            """
+
+            with tempfile.TemporaryDirectory(prefix="stsm-javac-memory-") as scratch:
+                source_root = Path(scratch) / "src"
+                sources = list(request.sources)
+                for relative, text in request.source_texts.items():
+                    path = source_root / relative
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    path.write_text(text, encoding=request.encoding)
+                    sources.append(path)
+                output_dir = request.output_dir or Path(scratch) / "classes"
+                result = self.compile(replace(request, sources=sources, source_texts={}, output_dir=output_dir))
+                if request.output_dir is None:
+                    result.classes = {
+                        path.relative_to(output_dir).as_posix(): path.read_bytes()
+                        for path in output_dir.rglob("*.class")
+                    }
+                prefix = str(source_root) + os.sep
+                for diagnostic in result.diagnostics:
+                    if diagnostic.source and diagnostic.source.startswith(prefix):
+                        diagnostic.source = Path(diagnostic.source[len(prefix) :]).as_posix()
+                result.raw_output = result.raw_output.replace(prefix, "")
+            return result
+
+        @staticmethod
+        def _quote_argument(argument: str) -> str:
+            """Quote a path for a javac ``@argfile`` so long source lists bypass command-line limits."""
+
+            escaped = argument.replace("\\", "\\\\").replace('"', '\\"')
+            return f'"{escaped}"'
+
+        @classmethod
+        def parse_diagnostics(cls, output: str) -> List["JavaCompilerService.Diagnostic"]:
+            diagnostics: List[JavaCompilerService.Diagnostic] = []
+            current: Optional[JavaCompilerService.Diagnostic] = None
+            for line in output.splitlines():
+                header = cls._HEADER.match(line)
+                if header:
+                    current = JavaCompilerService.Diagnostic(
+                        kind=header.group("kind").upper(),
+                        message=header.group("message"),
+                        source=header.group("source"),
+                        line=int(header.group("line")),
+                    )
+                    diagnostics.append(current)
+                    continue
+                bare = cls._BARE.match(line)
+                if bare:
+                    current = JavaCompilerService.Diagnostic(
+                        kind=bare.group("kind").upper(),
+                        message=bare.group("message"),
+                    )
+                    diagnostics.append(current)
+                    continue
+                if current is not None and current.column is None and line.strip() == "^":
+                    current.column = line.index("^") + 1
+            return diagnostics
+
+    class JvmBackend:
+        """Compiles through ``javax.tools`` inside the JPype bridge JVM.
+
+        The JVM, the system compiler and its file manager survive between builds, so
+        classpath archives are opened once and later builds skip javac start-up.
+        """
+
+        def __init__(self, logic: ApplicationLogic) -> None:
+            self._logic = logic
+            self._lock = threading.RLock()
+            self._compiler: Any = None
+            self._file_manager: Any = None
+            self._classpath: Optional[Tuple[str, ...]] = None
+            self._release_supported: Optional[bool] = None
+            self._memory_types: Optional[Tuple[Any, Any]] = None
+
+        def compile(self, request: "JavaCompilerService.CompileRequest") -> "JavaCompilerService.CompileResult":
+            with self._lock:
+                started = time.perf_counter()
+                jpype = self._ensure_compiler()
+                file_manager = self._prepare_file_manager(jpype, request)
+                collector = jpype.JClass("javax.tools.DiagnosticCollector")()
+                options = jpype.JClass("java.util.ArrayList")()
+                options.add("-encoding")
+                options.add(request.encoding)
+                if request.release and self._release_supported:
+                    options.add("--release")
+                    options.add(request.release)
+                java_files = jpype.JClass("java.util.ArrayList")()
+                for source in request.sources:
+                    java_files.add(jpype.JClass("java.io.File")(str(source)))
+                units = jpype.JClass("java.util.ArrayList")()
+                for unit in file_manager.getJavaFileObjectsFromFiles(java_files):
+                    units.add(unit)
+                task_manager = file_manager
+                if request.source_texts or request.output_dir is None:
+                    memory_file, memory_manager = self._ensure_memory_types(jpype)
+                    source_kind = jpype.JClass("javax.tools.JavaFileObject$Kind").SOURCE
+                    for relative, text in request.source_texts.items():
+                        units.add(memory_file(relative, source_kind, text, request.encoding))
+                    task_manager = memory_manager(file_manager, capture_classes=request.output_dir is None)
+                task = self._compiler.getTask(None, task_manager, collector, options, None, units)
+                success = bool(task.call())
+                diagnostics = [self._convert(item) for item in collector.getDiagnostics()]
+                classes: Dict[str, bytes] = {}
+                if task_manager is not file_manager:
+                    classes = task_manager.collect()
+                return JavaCompilerService.CompileResult(
+                    success=success,
+                    backend=JavaCompilerService.JVM,
+                    diagnostics=diagnostics,
+                    duration=time.perf_counter() - started,
+                    exit_code=0 if success else 1,
+                    raw_output="\n".join(diagnostic.format() for diagnostic in diagnostics),
+                    classes=classes,
+                )
+
+        def version(self, javac: str = "") -> str:
+            _ = javac
+            with self._lock:
+                jpype = self._ensure_compiler()
+                system = jpype.JClass("java.lang.System")
+                return f"jvm {system.getProperty('java.vendor')} {system.getProperty('java.version')}"
+
+        def reset(self) -> None:
+            with self._lock:
+                if self._file_manager is not None:
+                    self._file_manager.close()
+                self._compiler = None
+                self._file_manager = None
+                self._classpath = None
+                self._release_supported = None
+                self._memory_types = None
+
+        def _ensure_compiler(self) -> Any:
+            controller = self._logic.bridge_controller
+            if controller.get_state() != ApplicationLogic.BridgeState.RUNNING:
+                controller.start_jvm()
+            import jpype
+
+            if self._compiler is None:
+                compiler = jpype.JClass("javax.tools.ToolProvider").getSystemJavaCompiler()
+                if compiler is None:
+                    raise JavaCompilerService.CompilerUnavailableError(
+                        "The bridge JVM has no system Java compiler; configure java_home to point at a JDK"
+                    )
+                self._compiler = compiler
+                self._file_manager = compiler.getStandardFileManager(None, None, None)
+                self._release_supported = compiler.isSupportedOption("--release") >= 0
+            return jpype
+
+        def _prepare_file_manager(self, jpype: Any, request: "JavaCompilerService.CompileRequest") -> Any:
+            locations = jpype.JClass("javax.tools.StandardLocation")
+            file_class = jpype.JClass("java.io.File")
+            classpath = tuple(request.classpath)
+            if classpath != self._classpath:
+                entries = jpype.JClass("java.util.ArrayList")()
+                for component in classpath:
+                    entries.add(file_class(component))
+                self._file_manager.setLocation(locations.CLASS_PATH, entries)
+                self._classpath = classpath
+            if request.output_dir is not None:
+                request.output_dir.mkdir(parents=True, exist_ok=True)
+                output = jpype.JClass("java.util.Collections").singletonList(file_class(str(request.output_dir)))
+                self._file_manager.setLocation(locations.CLASS_OUTPUT, output)
+            return self._file_manager
+
+        def _ensure_memory_types(self, jpype: Any) -> Tuple[Any, Any]:
+            """Define the in-memory ``JavaFileObject`` and forwarding ``JavaFileManager`` proxies once per JVM."""
+
+            if self._memory_types is not None:
+                return self._memory_types
+            JImplements, JOverride = jpype.JImplements, jpype.JOverride
+            kinds = jpype.JClass("javax.tools.JavaFileObject$Kind")
+            locations = jpype.JClass("javax.tools.StandardLocation")
+            uri = jpype.JClass("java.net.URI")
+            byte_input = jpype.JClass("java.io.ByteArrayInputStream")
+            byte_output = jpype.JClass("java.io.ByteArrayOutputStream")
+            string_reader = jpype.JClass("java.io.StringReader")
+            unsupported = jpype.JClass("java.lang.UnsupportedOperationException")
+
+            @JImplements("javax.tools.JavaFileObject")
+            class MemoryFile:
+                """Source text or captured class bytes addressed by a package-relative name."""
+
+                def __init__(self, name: str, kind: Any, text: Optional[str] = None, encoding: str = "UTF-8") -> None:
+                    self.memory_name = name
+                    self.kind = kind
+                    self.text = text
+                    self.encoding = encoding
+                    self.buffer: Any = None
+
+                @JOverride
+                def toUri(self) -> Any:
+                    return uri.create(f"memory:///{self.memory_name}")
+
+                @JOverride
+                def getName(self) -> str:
+                    return self.memory_name
+
+                @JOverride
+                def openInputStream(self) -> Any:
+                    if self.text is not None:
+                        return byte_input(self.text.encode(self.encoding))
+                    if self.buffer is None:
+                        raise unsupported(f"{self.memory_name} has not been written")
+                    return byte_input(self.buffer.toByteArray())
+
+                @JOverride
+                def openOutputStream(self) -> Any:
+                    if self.text is not None:
+                        raise unsupported(f"{self.memory_name} is a read-only source")
+                    self.buffer = byte_output()
+                    return self.buffer
+
+                @JOverride
+                def openReader(self, ignore_encoding_errors: bool) -> Any:
+                    return string_reader(self.getCharContent(ignore_encoding_errors))
+
+                @JOverride
+                def getCharContent(self, ignore_encoding_errors: bool) -> str:
+                    if self.text is None:
+                        raise unsupported(f"{self.memory_name} is not a source file")
+                    return self.text
+
+                @JOverride
+                def openWriter(self) -> Any:
+                    raise unsupported(f"{self.memory_name} cannot be written as text")
+
+                @JOverride
+                def getLastModified(self) -> int:
+                    return 0
+
+                @JOverride
+                def delete(self) -> bool:
+                    return False
+
+                @JOverride
+                def getKind(self) -> Any:
+                    return self.kind
+
+                @JOverride
+                def isNameCompatible(self, simple_name: str, kind: Any) -> bool:
+                    base_name = self.memory_name.rsplit("/", 1)[-1]
+                    return kind == self.kind and base_name == f"{simple_name}{kind.extension}"
+
+                @JOverride
+                def getNestingKind(self) -> Any:
+                    return None
+
+                @JOverride
+                def getAccessLevel(self) -> Any:
+                    return None
+
+            @JImplements("javax.tools.JavaFileManager")
+            class MemoryFileManager:
+                """Forwards to the persistent standard file manager but captures class output in memory."""
+
+                def __init__(self, delegate: Any, capture_classes: bool) -> None:
+                    self.delegate = delegate
+                    self.capture_classes = capture_classes
+                    self.outputs: Dict[str, MemoryFile] = {}
+
+                def collect(self) -> Dict[str, bytes]:
+                    return {
+                        name: bytes(output.buffer.toByteArray())
+                        for name, output in self.outputs.items()
+                        if output.buffer is not None
+                    }
+
+                @JOverride
+                def getJavaFileForOutput(self, location: Any, class_name: str, kind: Any, sibling: Any) -> Any:
+                    if self.capture_classes and location == locations.CLASS_OUTPUT and kind == kinds.CLASS:
+                        name = f"{str(class_name).replace('.', '/')}{kind.extension}"
+                        output = MemoryFile(name, kind)
+                        self.outputs[name] = output
+                        return output
+                    return self.delegate.getJavaFileForOutput(location, class_name, kind, sibling)
+
+                @JOverride
+                def isSameFile(self, first: Any, second: Any) -> bool:
+                    if isinstance(first, MemoryFile) or isinstance(second, MemoryFile):
+                        return first is second
+                    return self.delegate.isSameFile(first, second)
+
+                @JOverride
+                def inferBinaryName(self, location: Any, file: Any) -> Any:
+                    if isinstance(file, MemoryFile):
+                        return file.memory_name.rsplit(".", 1)[0].replace("/", ".")
+                    return self.delegate.inferBinaryName(location, file)
+
+                @JOverride
+                def contains(self, location: Any, file: Any) -> bool:
+                    if isinstance(file, MemoryFile):
+                        return False
+                    return self.delegate.contains(location, file)
+
+                @JOverride
+                def close(self) -> None:
+                    # The delegate is shared across builds and closed by JvmBackend.reset().
+                    return None
+
+                @JOverride
+                def getClassLoader(self, location: Any) -> Any:
+                    return self.delegate.getClassLoader(location)
+
+                @JOverride
+                def list(self, location: Any, package_name: str, kinds_filter: Any, recurse: bool) -> Any:
+                    return self.delegate.list(location, package_name, kinds_filter, recurse)
+
+                @JOverride
+                def handleOption(self, current: str, remaining: Any) -> bool:
+                    return self.delegate.handleOption(current, remaining)
+
+                @JOverride
+                def hasLocation(self, location: Any) -> bool:
+                    return self.delegate.hasLocation(location)
+
+                @JOverride
+                def getJavaFileForInput(self, location: Any, class_name: str, kind: Any) -> Any:
+                    return self.delegate.getJavaFileForInput(location, class_name, kind)
+
+                @JOverride
+                def getFileForInput(self, location: Any, package_name: str, relative_name: str) -> Any:
+                    return self.delegate.getFileForInput(location, package_name, relative_name)
+
+                @JOverride
+                def getFileForOutput(self, location: Any, package_name: str, relative_name: str, sibling: Any) -> Any:
+                    return self.delegate.getFileForOutput(location, package_name, relative_name, sibling)
+
+                @JOverride
+                def flush(self) -> None:
+                    self.delegate.flush()
+
+                @JOverride
+                def isSupportedOption(self, option: str) -> int:
+                    return self.delegate.isSupportedOption(option)
+
+                @JOverride
+                def getLocationForModule(self, location: Any, module: Any) -> Any:
+                    return self.delegate.getLocationForModule(location, module)
+
+                @JOverride
+                def listLocationsForModules(self, location: Any) -> Any:
+                    return self.delegate.listLocationsForModules(location)
+
+                @JOverride
+                def inferModuleName(self, location: Any) -> Any:
+                    return self.delegate.inferModuleName(location)
+
+            self._memory_types = (MemoryFile, MemoryFileManager)
+            return self._memory_types
+
+        @staticmethod
+        def _convert(item: Any) -> "JavaCompilerService.Diagnostic":
+            source = item.getSource()
+            line = int(item.getLineNumber())
+            column = int(item.getColumnNumber())
+            code = item.getCode()
+            return JavaCompilerService.Diagnostic(
+                kind=str(item.getKind().name()),
+                message=str(item.getMessage(None)),
+                source=str(source.getName()) if source is not None else None,
+                line=line if line >= 0 else None,
+                column=column if column >= 0 else None,
+                code=str(code) if code is not None else None,
+            )
+
+    def __init__(self, logic: ApplicationLogic, plugin_manager: PluginManager) -> None:
+        self._logic = logic
+        self._plugin_manager = plugin_manager
+        self._logger = logging.getLogger("stsm.java_compiler")
+        if not self._logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter("[%(asctime)s] %(levelname)s %(name)s: %(message)s")
+            handler.setFormatter(formatter)
+            self._logger.addHandler(handler)
+        self._logger.setLevel(logging.INFO)
+        self._backends: Dict[str, Any] = {
+            JavaCompilerService.SUBPROCESS: JavaCompilerService.SubprocessBackend(),
+            JavaCompilerService.JVM: JavaCompilerService.JvmBackend(logic),
+        }
+        self._plugin_manager.register_module(__name__, __import__(__name__))
+        self._plugin_manager.register_symbol("javacompiler.service", self)
+
+    def backend(self, name: str) -> Any:
+        if name not in self._backends:
+            raise JavaCompilerService.CompilerUnavailableError(f"Unknown compiler backend '{name}'")
+        return self._backends[name]
+
+    def register_backend(self, name: str, backend: Any) -> None:
+        """Expose an additional backend providing ``compile(request) -> CompileResult``."""
+
+        if not callable(getattr(backend, "compile", None)):
+            raise ValueError("Compiler backends must define a callable 'compile' method")
+        self._backends[name] = backend
+
+    def compiler_version(self, backend: str = SUBPROCESS, javac: str = "") -> str:
+        """Describe the compiler a backend would use; build caches key their outputs on it."""
+
+        return self.backend(backend).version(javac)
+
+    def compile(
+        self,
+        request: "JavaCompilerService.CompileRequest",
+        backend: str = SUBPROCESS,
+    ) -> "JavaCompilerService.CompileResult":
+        if request.cancel_event is not None and request.cancel_event.is_set():
+            raise JavaCompilerService.CompileCancelledError("Compilation cancelled before it started")
+        result = self.backend(backend).compile(request)
+        self._logger.debug(
+            "Compiled %d sources with %s backend in %.3fs", len(request.sources), result.backend, result.duration
+        )
+        return result
+
+
+JAVA_COMPILER_SERVICE = JavaCompilerService(APPLICATION_LOGIC, PluginManager.get_instance())
+
+__all__ = [
+    "JavaCompilerService",
+    "JAVA_COMPILER_SERVICE",
+]
@@ -0,0 +1,182 @@
+"""Keyword usage index over card descriptions built on an Aho-Corasick automaton."""
+from __future__ import annotations
+
+import re
+import sys
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from plugin_manager import PluginManager
+
+
+class KeywordIndex:
+    """Cross-references keyword names with the card descriptions that use them.
+
+    All keyword names are compiled into one Aho-Corasick automaton, so each description is
+    scanned once, in time linear in its length, whatever the number of keywords. Matching is
+    case-insensitive and only counts whole words, so ``burn`` matches ``Burn`` and
+    ``mymod:burn`` but not ``burnt``. References written as ``prefix:word`` whose word is not
+    a keyword name are reported as undefined.
+
+    Cards are tracked by id. ``update_card`` and ``remove_card`` rescan a single card and
+    adjust the totals; ``set_keywords`` rebuilds the automaton and rescans every card.
+    """
+
+    _QUALIFIED_REFERENCE = re.compile(r"(?<![\w:])([A-Za-z][\w.-]*):([A-Za-z_]\w*)")
+
+    @dataclass
+    class Report:
+        """Keyword usage across all indexed cards."""
+
+        usage: Dict[str, int] = field(default_factory=dict)
+        cards: Dict[str, List[str]] = field(default_factory=dict)
+        orphans: List[str] = field(default_factory=list)
+        undefined: Dict[str, List[str]] = field(default_factory=dict)
+
+    def __init__(self, keywords: Iterable[Any] = (), cards: Iterable[Any] = ()) -> None:
+        self._keywords: List[str] = []
+        self._names: Set[str] = set()
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, int]]] = [[]]
+        self._texts: Dict[str, Tuple[str, ...]] = {}
+        self._matches: Dict[str, Counter] = {}
+        self._references: Dict[str, Set[str]] = {}
+        self._totals: Counter = Counter()
+        self.set_keywords(keywords)
+        for card in cards:
+            self.update_card(card)
+
+    @property
+    def keywords(self) -> List[str]:
+        return list(self._keywords)
+
+    def set_keywords(self, keywords: Iterable[Any]) -> None:
+        """Rebuild the automaton from ``KeywordDefinition``-like objects and rescan every card."""
+
+        self._keywords = []
+        patterns: Dict[str, List[int]] = {}
+        for keyword in keywords:
+            index = len(self._keywords)
+            self._keywords.append(keyword.proper_name)
+            for name in keyword.names:
+                owners = patterns.setdefault(name.lower(), [])
+                if index not in owners:
+                    owners.append(index)
+        self._names = set(patterns)
+        self._build(patterns)
+        texts = dict(self._texts)
+        self._matches, self._references, self._totals = {}, {}, Counter()
+        for card_id, card_texts in texts.items():
+            self._index(card_id, card_texts)
+
+    def update_card(self, card: Any) -> None:
+        """Index or re-index one ``CardDefinition``-like object by its ``card_id``."""
+
+        self.remove_card(card.card_id)
+        self._index(card.card_id, (card.description, card.upgrade_description))
+
+    def remove_card(self, card_id: str) -> bool:
+        if card_id not in self._texts:
+            return False
+        del self._texts[card_id]
+        self._totals.subtract(self._matches.pop(card_id))
+        self._references.pop(card_id, None)
+        return True
+
+    def scan(self, text: str) -> List[Tuple[int, str]]:
+        """Return ``(start, proper_name)`` for every whole-word keyword occurrence in ``text``."""
+
+        found: List[Tuple[int, str]] = []
+        lowered = text.lower()
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for position, character in enumerate(lowered):
+            while state and character not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(character, 0)
+            for length, keyword in output[state]:
+                start = position - length + 1
+                if self._boundary(lowered, start - 1) and self._boundary(lowered, position + 1):
+                    found.append((start, self._keywords[keyword]))
+        return found
+
+    def usage(self, keyword: str) -> int:
+        return max(self._totals.get(keyword, 0), 0)
+
+    def cards_using(self, keyword: str) -> List[str]:
+        return [card_id for card_id, matches in self._matches.items() if matches.get(keyword)]
+
+    def orphans(self) -> List[str]:
+        """Keywords that no indexed description mentions."""
+
+        return [keyword for keyword in dict.fromkeys(self._keywords) if self._totals.get(keyword, 0) <= 0]
+
+    def undefined(self) -> Dict[str, List[str]]:
+        """Map each ``prefix:word`` reference naming no keyword to the cards that contain it."""
+
+        references: Dict[str, List[str]] = {}
+        for card_id, card_references in self._references.items():
+            for reference in sorted(card_references):
+                references.setdefault(reference, []).append(card_id)
+        return dict(sorted(references.items()))
+
+    def report(self) -> "KeywordIndex.Report":
+        usage = {keyword: self.usage(keyword) for keyword in dict.fromkeys(self._keywords)}
+        cards: Dict[str, List[str]] = {keyword: [] for keyword in usage}
+        for card_id, matches in self._matches.items():
+            for keyword in matches:
+                cards[keyword].append(card_id)
+        return KeywordIndex.Report(usage, cards, self.orphans(), self.undefined())
+
+    def _index(self, card_id: str, texts: Tuple[str, ...]) -> None:
+        matches: Counter = Counter()
+        references: Set[str] = set()
+        for text in texts:
+            if not text:
+                continue
+            matches.update(keyword for _, keyword in self.scan(text))
+            for match in KeywordIndex._QUALIFIED_REFERENCE.finditer(text):
+                if match.group(2).lower() not in self._names:
+                    references.add(match.group(0))
+        self._texts[card_id] = texts
+        self._matches[card_id] = matches
+        if references:
+            self._references[card_id] = references
+        self._totals.update(matches)
+
+    def _build(self, patterns: Dict[str, List[int]]) -> None:
+        goto: List[Dict[str, int]] = [{}]
+        output: List[List[Tuple[int, int]]] = [[]]
+        for pattern, owners in patterns.items():
+            state = 0
+            for character in pattern:
+                following = goto[state].get(character)
+                if following is None:
+                    following = goto[state][character] = len(goto)
+                    goto.append({})
+                    output.append([])
+                state = following
+            output[state].extend((len(pattern), owner) for owner in owners)
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for character, following in goto[state].items():
+                queue.append(following)
+                fallback = fail[state]
+                while fallback and character not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[following] = goto[fallback].get(character, 0)
+                output[following] = output[following] + output[fail[following]]
+        self._goto, self._fail, self._output = goto, fail, output
+
+    @staticmethod
+    def _boundary(text: str, position: int) -> bool:
+        return position < 0 or position >= len(text) or not (text[position].isalnum() or text[position] == "_")
+
+
+PluginManager.get_instance().register_module(__name__, sys.modules[__name__])
+
+__all__ = ["KeywordIndex"]
@@ -41,6 +41,9 @@ class ApplicationLogic:
         desktop_jar_path: str = ""
         enabled_libraries: List[str] = field(default_factory=lambda: ["BaseMod", "StSLib", "ActLikeIt"])
         suppress_dependency_modal: bool = False
+        artifact_cache_dir: str = ""
+        artifact_cache_max_mb: int = 2048
+        card_art_cache_dir: str = ""
 
         def to_dict(self) -> Dict[str, Any]:
             return {
@@ -52,6 +55,9 @@ class ApplicationLogic:
                 "desktop_jar_path": self.desktop_jar_path,
                 "enabled_libraries": list(self.enabled_libraries),
                 "suppress_dependency_modal": self.suppress_dependency_modal,
+                "artifact_cache_dir": self.artifact_cache_dir,
+                "artifact_cache_max_mb": self.artifact_cache_max_mb,
+                "card_art_cache_dir": self.card_art_cache_dir,
             }
 
         @classmethod
@@ -65,6 +71,9 @@ class ApplicationLogic:
             config.desktop_jar_path = raw.get("desktop_jar_path", "")
             config.enabled_libraries = list(raw.get("enabled_libraries", config.enabled_libraries))
             config.suppress_dependency_modal = bool(raw.get("suppress_dependency_modal", False))
+            config.artifact_cache_dir = raw.get("artifact_cache_dir", "")
+            config.artifact_cache_max_mb = int(raw.get("artifact_cache_max_mb", config.artifact_cache_max_mb))
+            config.card_art_cache_dir = raw.get("card_art_cache_dir", "")
             return config
 
     class JPypeBridgeController:
@@ -1,31 +1,550 @@
 """Orchestrates generation of ModTheSpire-ready Slay the Spire mods."""
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
 import re
 import shutil
-import subprocess
+import struct
+import multiprocessing
 import textwrap
-import zipfile
-from dataclasses import dataclass, field
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, fields, replace
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import IO, Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
+from artifactcache import ArtifactCache
+from buildgraph import BuildGraph
+from buildprofiler import BuildProfiler
+from cardart import CardArtPipeline
+from jartools import JarWriter
+from textureatlas import TextureAtlasPacker
+from javacompiler import JAVA_COMPILER_SERVICE, JavaCompilerService
 from logic import APPLICATION_LOGIC, ApplicationLogic
 from plugin_manager import PluginManager
+from projectvalidator import ProjectValidator
+from templateengine import TEMPLATE_ENGINE, TemplateEngine
 
 
 class ModOrchestrator:
     """High-level builder that materializes GUI-authored mods on disk."""
 
+    CARD_TEMPLATE = "modorchestrator.card"
+    ENTRY_TEMPLATE = "modorchestrator.entry"
+    ENTRY_TEMPLATE_OUTDENTED = "modorchestrator.entry.outdented"
+    KEYWORD_TEMPLATE = "modorchestrator.keyword"
+    KEYWORD_FILE_TEMPLATE = "modorchestrator.keyword_file"
+    CARD_ATLAS_TEMPLATE = "modorchestrator.card_atlas"
+    CARD_REGISTRY_TEMPLATE = "modorchestrator.card_registry"
+    CARD_TABLE_TEMPLATE = "modorchestrator.card_table"
+    TABLE_CARD_TEMPLATE = "modorchestrator.table_card"
+    CARD_FACTORY_TEMPLATE = "modorchestrator.card_factory"
+    CARDS_AS_CLASSES = "classes"
+    CARDS_AS_TABLE = "table"
+    CARD_TABLE_MAGIC = 0x53545343
+    CARD_TABLE_VERSION = 1
+    REGISTRATION_AUTO = "auto"
+    REGISTRATION_INLINE = "inline"
+    REGISTRATION_CHUNKED = "chunked"
+    REGISTRATION_TABLE = "table"
+    ARTIFACT_FORMAT = 1
+    PHASE_METADATA = "metadata"
+    PHASE_LOCALIZATION = "localization"
+    PHASE_ASSETS = "assets"
+    PHASE_ENTRY_CLASS = "entry_class"
+    PHASE_CARD_CLASSES = "card_classes"
+    PHASE_PRUNE = "prune"
+    PHASE_COMPILE = "compile"
+    PHASE_CARD_STREAM = "card_stream"
+
+    DEFAULT_LANGUAGE = "eng"
+    PHASE_PREPARE = "prepare"
+    PHASE_CACHE_LOOKUP = "cache_lookup"
+    PHASE_FINALIZE = "finalize"
+    _BUILTIN_PHASES = frozenset(
+        {PHASE_METADATA, PHASE_LOCALIZATION, PHASE_ASSETS, PHASE_ENTRY_CLASS, PHASE_CARD_CLASSES, PHASE_PRUNE, PHASE_COMPILE}
+    )
+    JAR_MANIFEST = b"Manifest-Version: 1.0\nCreated-By: STSMODDER ModOrchestrator\n"
+    _FICLONE = 0x40049409
+    _RUNTIME_ONLY_OPTIONS = frozenset(
+        {
+            "incremental",
+            "compiler_backend",
+            "sharded_compile",
+            "compile_shard_size",
+            "compile_workers",
+            "parallel_codegen",
+            "codegen_chunk_size",
+            "codegen_workers",
+            "use_artifact_cache",
+            "link_assets",
+            "card_art_workers",
+            "jar_workers",
+            "incremental_jar",
+            "in_memory",
+            "phase_workers",
+            "localization_workers",
+            "compile_timeout",
+        }
+    )
+    # Generated helpers in the cards package that card classes reference.
+    _CARD_SUPPORT_SOURCES = frozenset({"CardAtlas.java", "TableCard.java", "CardTable.java"})
+    # Project root -> [lock, number of builds holding or waiting for it]; dropped when unused.
+    _ROOT_LOCKS: Dict[str, List[Any]] = {}
+    _ROOT_LOCKS_GUARD = threading.Lock()
+
+    _CARD_TEMPLATE_SOURCE = """
+            package ${package_name};
+
+            import basemod.abstracts.CustomCard;
+            import com.megacrit.cardcrawl.actions.AbstractGameAction;
+            import com.megacrit.cardcrawl.actions.common.DamageAction;
+            import com.megacrit.cardcrawl.actions.common.GainBlockAction;
+            import com.megacrit.cardcrawl.cards.AbstractCard;
+            import com.megacrit.cardcrawl.cards.DamageInfo;
+            import com.megacrit.cardcrawl.characters.AbstractPlayer;
+            import com.megacrit.cardcrawl.monsters.AbstractMonster;
+
+            public class ${class_name} extends CustomCard {
+                public static final String ID = "${mod_id}:${card_id}";
+                private static final int COST = ${cost};
+                private static final int DAMAGE = ${base_damage};
+                private static final int BLOCK = ${base_block};
+                private static final int MAGIC = ${base_magic};
+
+                public ${class_name}() {
+                    super(
+                        ID,
+                        "${name}",
+                        "${image_path}",
+                        COST,
+                        "${description}",
+                        CardType.${card_type},
+                        CardColor.${card_color},
+                        CardRarity.${rarity},
+                        CardTarget.${target}
+                    );
+                    baseDamage = DAMAGE;
+                    baseBlock = BLOCK;
+                    baseMagicNumber = MAGIC;
+                    magicNumber = baseMagicNumber;
+                }
+
+                @Override
+                public void use(AbstractPlayer p, AbstractMonster m) {
+            ${use_body}
+                }
+
+                @Override
+                public void upgrade() {
+                    if (!upgraded) {
+                        upgradeName();
+            ${upgrade_body}
+                    }
+                }
+
+                @Override
+                public AbstractCard makeCopy() {
+                    return new ${class_name}();
+                }${atlas_members}
+            }
+            """
+
+    # Appended to card classes when art is packed; CustomCard calls loadCardImage from its constructor.
+    _CARD_ATLAS_MEMBERS = """
+
+    @Override
+    public void loadCardImage(String img) {
+        com.badlogic.gdx.graphics.g2d.TextureAtlas.AtlasRegion region = CardAtlas.region(img);
+        if (region == null) {
+            super.loadCardImage(img);
+            return;
+        }
+        basemod.ReflectionHacks.setPrivateInherited(this, CustomCard.class, "portrait", region);
+    }"""
+
+    _CARD_ATLAS_TEMPLATE_SOURCE = """
+            package ${package_name};
+
+            import com.badlogic.gdx.Gdx;
+            import com.badlogic.gdx.graphics.g2d.TextureAtlas;
+
+            public final class CardAtlas {
+                private static final String ATLAS_PATH = "${atlas_path}";
+                private static TextureAtlas atlas;
+
+                private CardAtlas() {
+                }
+
+                public static synchronized TextureAtlas.AtlasRegion region(String imagePath) {
+                    if (atlas == null) {
+                        atlas = new TextureAtlas(Gdx.files.internal(ATLAS_PATH));
+                    }
+                    String name = imagePath.endsWith(".png") ? imagePath.substring(0, imagePath.length() - 4) : imagePath;
+                    return atlas.findRegion(name);
+                }
+            }
+            """
+
+    _ENTRY_TEMPLATE_SOURCE = """
+            package ${package};
+
+            import basemod.BaseMod;
+            import basemod.interfaces.EditCardsSubscriber;
+            import basemod.interfaces.EditStringsSubscriber;
+            import basemod.interfaces.PostInitializeSubscriber;
+            import com.evacipated.cardcrawl.modthespire.lib.SpireInitializer;
+            import com.megacrit.cardcrawl.localization.CardStrings;
+
+            @SpireInitializer
+            public class ${entry_class} implements EditCardsSubscriber, EditStringsSubscriber, PostInitializeSubscriber {
+                public ${entry_class}() {
+                    BaseMod.subscribe(this);
+                }
+
+                public static void initialize() {
+                    new ${entry_class}();
+                }
+
+                @Override
+                public void receiveEditCards() {
+            ${card_registrations}
+                }
+
+                @Override
+                public void receiveEditStrings() {
+                    BaseMod.loadCustomStringsFile(
+                        CardStrings.class,
+                        ${cards_strings_path}
+                    );
+                }
+
+                @Override
+                public void receivePostInitialize() {
+            ${keyword_registrations}
+                }
+            }
+            """
+
+    # Table-driven mode: one card class parameterised by a row of the binary card table.
+    _TABLE_CARD_TEMPLATE_SOURCE = """
+            package ${package_name};
+
+            import basemod.abstracts.CustomCard;
+            import com.megacrit.cardcrawl.actions.AbstractGameAction;
+            import com.megacrit.cardcrawl.actions.common.DamageAction;
+            import com.megacrit.cardcrawl.actions.common.GainBlockAction;
+            import com.megacrit.cardcrawl.cards.AbstractCard;
+            import com.megacrit.cardcrawl.cards.DamageInfo;
+            import com.megacrit.cardcrawl.characters.AbstractPlayer;
+            import com.megacrit.cardcrawl.monsters.AbstractMonster;
+
+            public class TableCard extends CustomCard {
+                public static final class Data {
+                    public final String id;
+                    public final String name;
+                    public final String img;
+                    public final String description;
+                    public final AbstractCard.CardType type;
+                    public final AbstractCard.CardColor color;
+                    public final AbstractCard.CardRarity rarity;
+                    public final AbstractCard.CardTarget target;
+                    public final int cost;
+                    public final int damage;
+                    public final int block;
+                    public final int magic;
+                    public final int upgradeDamage;
+                    public final int upgradeBlock;
+                    public final int upgradeMagic;
+
+                    Data(
+                        String id,
+                        String name,
+                        String img,
+                        String description,
+                        AbstractCard.CardType type,
+                        AbstractCard.CardColor color,
+                        AbstractCard.CardRarity rarity,
+                        AbstractCard.CardTarget target,
+                        int cost,
+                        int damage,
+                        int block,
+                        int magic,
+                        int upgradeDamage,
+                        int upgradeBlock,
+                        int upgradeMagic
+                    ) {
+                        this.id = id;
+                        this.name = name;
+                        this.img = img;
+                        this.description = description;
+                        this.type = type;
+                        this.color = color;
+                        this.rarity = rarity;
+                        this.target = target;
+                        this.cost = cost;
+                        this.damage = damage;
+                        this.block = block;
+                        this.magic = magic;
+                        this.upgradeDamage = upgradeDamage;
+                        this.upgradeBlock = upgradeBlock;
+                        this.upgradeMagic = upgradeMagic;
+                    }
+                }
+
+                private final Data data;
+
+                public TableCard(Data data) {
+                    super(
+                        data.id,
+                        data.name,
+                        data.img,
+                        data.cost,
+                        data.description,
+                        data.type,
+                        data.color,
+                        data.rarity,
+                        data.target
+                    );
+                    this.data = data;
+                    baseDamage = data.damage;
+                    baseBlock = data.block;
+                    baseMagicNumber = data.magic;
+                    magicNumber = baseMagicNumber;
+                }
+
+                @Override
+                public void use(AbstractPlayer p, AbstractMonster m) {
+                    if (data.damage > 0) {
+                        addToBot(new DamageAction(m, new DamageInfo(p, this.damage, DamageInfo.DamageType.NORMAL), AbstractGameAction.AttackEffect.SLASH_HORIZONTAL));
+                    }
+                    if (data.block > 0) {
+                        addToBot(new GainBlockAction(p, p, this.block));
+                    }
+                }
+
+                @Override
+                public void upgrade() {
+                    if (!upgraded) {
+                        upgradeName();
+                        if (data.upgradeDamage != 0) {
+                            upgradeDamage(data.upgradeDamage);
+                        }
+                        if (data.upgradeBlock != 0) {
+                            upgradeBlock(data.upgradeBlock);
+                        }
+                        if (data.upgradeMagic != 0) {
+                            upgradeMagicNumber(data.upgradeMagic);
+                        }
+                    }
+                }
+
+                @Override
+                public AbstractCard makeCopy() {
+                    return CardTable.create(data.id);
+                }${atlas_members}
+            }
+            """
+
+    # Loads the binary card table once and creates TableCard instances for registration and makeCopy.
+    _CARD_FACTORY_TEMPLATE_SOURCE = """
+            package ${package_name};
+
+            import basemod.BaseMod;
+            import com.megacrit.cardcrawl.cards.AbstractCard;
+            import java.io.BufferedInputStream;
+            import java.io.DataInputStream;
+            import java.io.IOException;
+            import java.io.InputStream;
+            import java.nio.charset.StandardCharsets;
+            import java.util.Collections;
+            import java.util.LinkedHashMap;
+            import java.util.Map;
+
+            public final class CardTable {
+                private static final String TABLE = "/${table_path}";
+                private static final int MAGIC = ${table_magic};
+                private static final int VERSION = ${table_version};
+                private static Map<String, TableCard.Data> cards;
+
+                private CardTable() {
+                }
+
+                public static synchronized Map<String, TableCard.Data> cards() {
+                    if (cards == null) {
+                        cards = Collections.unmodifiableMap(load());
+                    }
+                    return cards;
+                }
+
+                public static AbstractCard create(String id) {
+                    TableCard.Data data = cards().get(id);
+                    if (data == null) {
+                        throw new IllegalArgumentException("Unknown card " + id);
+                    }
+                    return new TableCard(data);
+                }
+
+                public static void registerAll() {
+                    for (TableCard.Data data : cards().values()) {
+                        BaseMod.addCard(new TableCard(data));
+                    }
+                }
+
+                private static Map<String, TableCard.Data> load() {
+                    InputStream stream = CardTable.class.getResourceAsStream(TABLE);
+                    if (stream == null) {
+                        throw new IllegalStateException("Missing card table " + TABLE);
+                    }
+                    try (DataInputStream input = new DataInputStream(new BufferedInputStream(stream))) {
+                        if (input.readInt() != MAGIC || input.readInt() != VERSION) {
+                            throw new IllegalStateException("Unsupported card table " + TABLE);
+                        }
+                        int count = input.readInt();
+                        Map<String, TableCard.Data> loaded = new LinkedHashMap<>(count * 2);
+                        for (int index = 0; index < count; index++) {
+                            TableCard.Data data = new TableCard.Data(
+                                readString(input),
+                                readString(input),
+                                readString(input),
+                                readString(input),
+                                AbstractCard.CardType.valueOf(readString(input)),
+                                AbstractCard.CardColor.valueOf(readString(input)),
+                                AbstractCard.CardRarity.valueOf(readString(input)),
+                                AbstractCard.CardTarget.valueOf(readString(input)),
+                                input.readInt(),
+                                input.readInt(),
+                                input.readInt(),
+                                input.readInt(),
+                                input.readInt(),
+                                input.readInt(),
+                                input.readInt()
+                            );
+                            loaded.put(data.id, data);
+                        }
+                        return loaded;
+                    } catch (IOException e) {
+                        throw new IllegalStateException("Unable to read card table " + TABLE, e);
+                    }
+                }
+
+                private static String readString(DataInputStream input) throws IOException {
+                    byte[] bytes = new byte[input.readInt()];
+                    input.readFully(bytes);
+                    return new String(bytes, StandardCharsets.UTF_8);
+                }
+            }
+            """
+
+    # Registers one chunk of cards; keeps receiveEditCards and its constant pool small for large projects.
+    _CARD_REGISTRY_TEMPLATE_SOURCE = """
+            package ${package};
+
+            import basemod.BaseMod;
+
+            final class ${class_name} {
+                private ${class_name}() {
+                }
+
+                static void register() {
+            ${card_registrations}
+                }
+            }
+            """
+
+    # Registers every card listed in a resource table, one simple class name per line.
+    _CARD_TABLE_TEMPLATE_SOURCE = """
+            package ${package};
+
+            import basemod.BaseMod;
+            import com.megacrit.cardcrawl.cards.AbstractCard;
+            import java.io.BufferedReader;
+            import java.io.IOException;
+            import java.io.InputStream;
+            import java.io.InputStreamReader;
+            import java.nio.charset.StandardCharsets;
+
+            final class ${class_name} {
+                private static final String TABLE = "/${table_path}";
+                private static final String CARDS_PACKAGE = "${cards_package}.";
+
+                private ${class_name}() {
+                }
+
+                static void register() {
+                    InputStream stream = ${class_name}.class.getResourceAsStream(TABLE);
+                    if (stream == null) {
+                        throw new IllegalStateException("Missing card registration table " + TABLE);
+                    }
+                    InputStreamReader input = new InputStreamReader(stream, StandardCharsets.UTF_8);
+                    try (BufferedReader reader = new BufferedReader(input)) {
+                        String line;
+                        while ((line = reader.readLine()) != null) {
+                            if (!line.isEmpty()) {
+                                Class<?> cardClass = Class.forName(CARDS_PACKAGE + line);
+                                BaseMod.addCard((AbstractCard) cardClass.getDeclaredConstructor().newInstance());
+                            }
+                        }
+                    } catch (IOException | ReflectiveOperationException e) {
+                        throw new IllegalStateException("Unable to register cards from " + TABLE, e);
+                    }
+                }
+            }
+            """
+
+    _KEYWORD_TEMPLATE_SOURCE = """
+            BaseMod.addKeyword("${proper_name}", new String[]{${names}}, "${description}");
+            """
+
+    # Translated projects register keywords from the keywords.json of the game's language.
+    _KEYWORD_FILE_TEMPLATE_SOURCE = """
+            String keywordJson = com.badlogic.gdx.Gdx.files.internal(${keywords_strings_path}).readString("UTF-8");
+            com.google.gson.Gson gson = new com.google.gson.Gson();
+            com.google.gson.JsonObject keywordFile = gson.fromJson(keywordJson, com.google.gson.JsonObject.class);
+            for (com.google.gson.JsonElement element : keywordFile.getAsJsonArray("keywords")) {
+                com.google.gson.JsonObject keyword = element.getAsJsonObject();
+                BaseMod.addKeyword(
+                    keyword.get("PROPER_NAME").getAsString(),
+                    gson.fromJson(keyword.get("NAMES"), String[].class),
+                    keyword.get("DESCRIPTION").getAsString()
+                );
+            }
+            """
+
     class SpecificationError(Exception):
         """Raised when a provided project specification is invalid."""
 
+    class ValidationError(SpecificationError):
+        """Raised when a project breaks validation rules; carries every violation found."""
+
+        def __init__(self, message: str, violations: Optional[List[ProjectValidator.Violation]] = None) -> None:
+            super().__init__(message)
+            self.violations: List[ProjectValidator.Violation] = list(violations or [])
+
     class BuildError(Exception):
         """Raised when the compilation pipeline fails."""
 
+        def __init__(
+            self,
+            message: str,
+            diagnostics: Optional[List[JavaCompilerService.Diagnostic]] = None,
+        ) -> None:
+            super().__init__(message)
+            self.diagnostics: List[JavaCompilerService.Diagnostic] = list(diagnostics or [])
+
+    class BuildCancelledError(BuildError):
+        """Raised when a build is cancelled or its compiler exceeds ``compile_timeout``."""
+
+        def __init__(self, message: str, timed_out: bool = False) -> None:
+            super().__init__(message)
+            self.timed_out = timed_out
+
     @dataclass
     class AssetMapping:
         """Mapping of source asset to a resources-relative destination."""
@@ -41,7 +560,7 @@ class ModOrchestrator:
         names: List[str]
         description: str
 
-    @dataclass
+    @dataclass(slots=True)
     class CardDefinition:
         """Card description encapsulating gameplay and presentation fields."""
 
@@ -73,6 +592,18 @@ class ModOrchestrator:
             file_name = f"{self.card_id}.png"
             return f"{mod_id}Resources/images/cards/{file_name}"
 
+    @dataclass
+    class Translation:
+        """Localized strings for one game language; anything missing falls back to the English text.
+
+        ``cards`` maps card ids and ``keywords`` maps English proper names to overrides keyed
+        like the generated JSON (``NAME``, ``DESCRIPTION``, ``PROPER_NAME``, ``NAMES``, …).
+        """
+
+        language: str
+        cards: Dict[str, Dict[str, str]] = field(default_factory=dict)
+        keywords: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
     @dataclass
     class ModMetadata:
         """Primary metadata for the mod."""
@@ -95,14 +626,257 @@ class ModOrchestrator:
         """Aggregate project definition produced by the GUI."""
 
         metadata: "ModOrchestrator.ModMetadata"
+        # Any mutable sequence of cards; ``CardStore`` keeps large projects compact and indexed.
         cards: List["ModOrchestrator.CardDefinition"] = field(default_factory=list)
         keywords: List["ModOrchestrator.KeywordDefinition"] = field(default_factory=list)
         assets: List["ModOrchestrator.AssetMapping"] = field(default_factory=list)
         additional_dependencies: List[Path] = field(default_factory=list)
+        # Consumed once by the build instead of ``cards``; see ``CardSource`` for file readers.
+        card_stream: Optional[Iterable["ModOrchestrator.CardDefinition"]] = None
+        translations: List["ModOrchestrator.Translation"] = field(default_factory=list)
+
+    @dataclass
+    class BuildOptions:
+        """Pipeline switches controlling how a project is materialized."""
+
+        incremental: bool = False
+        compiler_backend: str = JavaCompilerService.SUBPROCESS
+        sharded_compile: bool = False
+        compile_shard_size: int = 200
+        compile_workers: int = 0
+        parallel_codegen: bool = False
+        codegen_chunk_size: int = 500
+        codegen_workers: int = 0
+        use_artifact_cache: bool = False
+        deduplicate_assets: bool = True
+        link_assets: bool = True
+        card_art_variants: bool = False
+        card_art_workers: int = 0
+        pack_card_atlas: bool = False
+        atlas_page_size: int = 2048
+        jar_compression_level: int = 6
+        jar_workers: int = 0
+        incremental_jar: bool = True
+        deterministic_jar: bool = False
+        in_memory: bool = False
+        phase_workers: int = 0
+        card_registration: str = "auto"
+        registration_chunk_size: int = 500
+        card_implementation: str = "classes"
+        compact_localization: bool = False
+        localization_workers: int = 0
+        compile_timeout: float = 0.0
+
+    @dataclass
+    class BuildManifest:
+        """Content hashes of every output produced by a build, keyed by project-relative path.
+
+        ``sources`` maps each asset source path to its ``[size, mtime_ns, sha256]`` fingerprint
+        so later builds only rehash files whose size or modification time moved. ``packaging``
+        identifies the jar writer settings the existing jar was produced with.
+        """
+
+        entries: Dict[str, str] = field(default_factory=dict)
+        toolchain: str = ""
+        sources: Dict[str, List] = field(default_factory=dict)
+        packaging: str = ""
+
+        @classmethod
+        def load(cls, path: Path) -> "ModOrchestrator.BuildManifest":
+            if not path.exists():
+                return cls()
+            try:
+                with path.open("r", encoding="utf-8") as handle:
+                    raw = json.load(handle)
+            except (OSError, ValueError):
+                return cls()
+            return cls(
+                entries=dict(raw.get("entries", {})),
+                toolchain=raw.get("toolchain", ""),
+                sources=dict(raw.get("sources", {})),
+                packaging=raw.get("packaging", ""),
+            )
+
+        def save(self, path: Path) -> None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("w", encoding="utf-8") as handle:
+                json.dump(
+                    {
+                        "entries": self.entries,
+                        "toolchain": self.toolchain,
+                        "sources": self.sources,
+                        "packaging": self.packaging,
+                    },
+                    handle,
+                    indent=2,
+                    sort_keys=True,
+                )
+
+    @dataclass
+    class BuildResult:
+        """Outcome of ``build_project``.
+
+        In-memory builds keep every generated source, compiled class and resource in
+        ``files`` (project-relative path to bytes, or to the source file of a copied asset)
+        so the tree can be exported on demand.
+        """
+
+        jar_path: Path
+        project_root: Path
+        metrics: Dict[str, float] = field(default_factory=dict)
+        cache_hit: bool = False
+        files: Dict[str, Union[bytes, Path]] = field(default_factory=dict)
+        report: Optional[BuildProfiler.Report] = None
+
+        def export_tree(self, destination: Optional[Path] = None, prefix: str = "") -> List[Path]:
+            """Write the in-memory files below ``destination`` (default: the project root).
+
+            ``prefix`` limits the export, e.g. ``"src/main/java/"`` for the generated sources only.
+            """
+
+            root = destination or self.project_root
+            written: List[Path] = []
+            for relative, payload in sorted(self.files.items()):
+                if not relative.startswith(prefix):
+                    continue
+                target = root / relative
+                target.parent.mkdir(parents=True, exist_ok=True)
+                if isinstance(payload, Path):
+                    shutil.copy2(payload, target)
+                else:
+                    target.write_bytes(payload)
+                written.append(target)
+            return written
+
+    @dataclass
+    class BatchOutcome:
+        """One project's entry in ``build_many``: its ``result``, or the error that stopped it."""
+
+        mod_id: str
+        result: Optional["ModOrchestrator.BuildResult"] = None
+        error: str = ""
+        error_type: str = ""
+        diagnostics: List[JavaCompilerService.Diagnostic] = field(default_factory=list)
+        seconds: float = 0.0
+
+        @property
+        def ok(self) -> bool:
+            return self.result is not None
+
+    @dataclass
+    class StringsEncoder:
+        """Encodes ``{key: container}`` one entry at a time.
+
+        The indented form is byte-identical to ``json.dumps(document, indent=2)``; the compact
+        form drops all whitespace and writes non-ASCII text as UTF-8 instead of escapes.
+        """
+
+        key: str
+        compact: bool = False
+        as_list: bool = False
+        count: int = 0
+
+        def header(self) -> bytes:
+            opening = "[" if self.as_list else "{"
+            if self.compact:
+                return f'{{{json.dumps(self.key)}:{opening}'.encode("utf-8")
+            return f'{{\n  {json.dumps(self.key)}: {opening}'.encode("utf-8")
+
+        def item(self, value: Any, name: Optional[str] = None) -> bytes:
+            separator = "," if self.count else ""
+            self.count += 1
+            if self.compact:
+                encoded = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+                prefix = "" if name is None else json.dumps(name, ensure_ascii=False) + ":"
+                return f"{separator}{prefix}{encoded}".encode("utf-8")
+            encoded = json.dumps(value, indent=2).replace("\n", "\n    ")
+            prefix = "" if name is None else json.dumps(name) + ": "
+            return f"{separator}\n    {prefix}{encoded}".encode("utf-8")
+
+        def footer(self) -> bytes:
+            closing = "]" if self.as_list else "}"
+            if self.compact:
+                return f"{closing}}}".encode("utf-8")
+            return (f"\n  {closing}\n}}" if self.count else f"{closing}\n}}").encode("utf-8")
+
+    @dataclass
+    class StreamedOutput:
+        """An output written piece by piece and claimed in the manifest once complete."""
+
+        path: Path
+        digest: Any = field(default_factory=hashlib.sha256)
+        size: int = 0
+        handle: Optional[IO[bytes]] = None
+        buffer: Optional[bytearray] = None
 
-    def __init__(self, logic: ApplicationLogic, plugin_manager: PluginManager) -> None:
+        @property
+        def partial_path(self) -> Path:
+            return self.path.with_name(self.path.name + ".partial")
+
+        def write(self, data: bytes) -> None:
+            self.digest.update(data)
+            self.size += len(data)
+            if self.handle is not None:
+                self.handle.write(data)
+            elif self.buffer is not None:
+                self.buffer += data
+
+    @dataclass
+    class BuildContext:
+        """Mutable state threaded through the phases of a single build."""
+
+        project: "ModOrchestrator.ModProject"
+        project_root: Path
+        options: "ModOrchestrator.BuildOptions"
+        previous_manifest: "ModOrchestrator.BuildManifest"
+        manifest: "ModOrchestrator.BuildManifest" = field(default_factory=lambda: ModOrchestrator.BuildManifest())
+        changed_outputs: Set[str] = field(default_factory=set)
+        removed_outputs: Set[str] = field(default_factory=set)
+        image_paths: Dict[str, str] = field(default_factory=dict)
+        card_atlas: str = ""
+        memory: Optional[Dict[str, Union[bytes, Path]]] = None
+        streamed_classes: List[str] = field(default_factory=list)
+        metrics: Dict[str, float] = field(default_factory=dict)
+        profiler: BuildProfiler = field(default_factory=BuildProfiler, repr=False)
+        lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+        cancel: Optional[threading.Event] = field(default=None, repr=False)
+        previous_jar: Optional[Path] = None
+
+        @property
+        def java_root(self) -> Path:
+            return self.project_root / "src" / "main" / "java"
+
+        @property
+        def resource_root(self) -> Path:
+            return self.project_root / "src" / "main" / "resources"
+
+        @property
+        def classes_dir(self) -> Path:
+            return self.project_root / "build" / "classes"
+
+        @property
+        def manifest_path(self) -> Path:
+            return self.project_root / "build" / "build-manifest.json"
+
+        def relative(self, path: Path) -> str:
+            return path.relative_to(self.project_root).as_posix()
+
+    def __init__(
+        self,
+        logic: ApplicationLogic,
+        plugin_manager: PluginManager,
+        compiler_service: Optional[JavaCompilerService] = None,
+        template_engine: Optional[TemplateEngine] = None,
+    ) -> None:
         self._logic = logic
         self._plugin_manager = plugin_manager
+        self._compiler_service = compiler_service or JAVA_COMPILER_SERVICE
+        self._template_engine = template_engine or TEMPLATE_ENGINE
+        self._digest_cache: Dict[Tuple[str, int, int], str] = {}
+        self._digest_lock = threading.Lock()
+        self._artifact_store: Optional[ArtifactCache] = None
+        self._card_art: Optional[CardArtPipeline] = None
+        self._validator = ProjectValidator()
         self._logger = logging.getLogger("stsm.mod_orchestrator")
         if not self._logger.handlers:
             handler = logging.StreamHandler()
@@ -110,65 +884,814 @@ class ModOrchestrator:
             handler.setFormatter(formatter)
             self._logger.addHandler(handler)
         self._logger.setLevel(logging.INFO)
+        self._register_templates()
+        self._build_graph = self._default_build_graph()
         self._plugin_manager.register_module(__name__, __import__(__name__))
         self._plugin_manager.register_symbol("modorchestrator.orchestrator", self)
 
-    def build_mod(self, project: "ModOrchestrator.ModProject", destination: Path, clean: bool = True) -> Path:
-        """Create the on-disk project structure and compile it into a mod jar."""
+    def _default_build_graph(self) -> BuildGraph:
+        """Describe the built-in phases; only pruning and compilation wait for the generators."""
+
+        generators = (
+            ModOrchestrator.PHASE_METADATA,
+            ModOrchestrator.PHASE_LOCALIZATION,
+            ModOrchestrator.PHASE_ASSETS,
+            ModOrchestrator.PHASE_ENTRY_CLASS,
+            ModOrchestrator.PHASE_CARD_CLASSES,
+        )
+        return BuildGraph(
+            [
+                BuildGraph.Phase(
+                    ModOrchestrator.PHASE_METADATA, self._write_mod_metadata, description="ModTheSpire mod.json"
+                ),
+                BuildGraph.Phase(
+                    ModOrchestrator.PHASE_LOCALIZATION, self._write_localization, description="Localization strings"
+                ),
+                BuildGraph.Phase(ModOrchestrator.PHASE_ASSETS, self._copy_assets, description="Assets and card art"),
+                BuildGraph.Phase(
+                    ModOrchestrator.PHASE_ENTRY_CLASS, self._write_entry_class, description="Mod entry class"
+                ),
+                BuildGraph.Phase(
+                    ModOrchestrator.PHASE_CARD_CLASSES,
+                    self._write_card_classes,
+                    requires=(ModOrchestrator.PHASE_ASSETS,),
+                    description="Card classes",
+                ),
+                BuildGraph.Phase(
+                    ModOrchestrator.PHASE_PRUNE,
+                    self._remove_stale_outputs,
+                    requires=generators,
+                    description="Remove outputs the previous build produced but this one does not",
+                ),
+                BuildGraph.Phase(
+                    ModOrchestrator.PHASE_COMPILE,
+                    self._compile_project,
+                    requires=(ModOrchestrator.PHASE_PRUNE,),
+                    description="Compile Java sources and package the jar",
+                ),
+            ]
+        )
+
+    def register_build_phase(
+        self,
+        name: str,
+        action: Callable[["ModOrchestrator.BuildContext"], Any],
+        requires: Sequence[str] = (),
+        before: Sequence[str] = (PHASE_PRUNE,),
+        description: str = "",
+        replace: bool = False,
+    ) -> None:
+        """Insert a plugin phase into every subsequent build.
+
+        ``action`` receives the ``BuildContext`` and should write its outputs through
+        ``emit_output`` so incremental and in-memory builds track them. By default the phase
+        runs before stale outputs are pruned, and therefore before compilation. Unless
+        ``phase_workers`` is ``1``, ``action`` runs on a pool thread alongside other phases, so it
+        must not rely on thread-local state of the caller; ``mod.build.phase`` listeners are
+        still called on the thread that started the build.
+        """
+
+        phase = BuildGraph.Phase(name, action, tuple(requires), tuple(before), description)
+        candidate = self._build_graph.copy()
+        try:
+            candidate.add(phase, replace=replace)
+            candidate.plan()
+        except BuildGraph.GraphError as exc:
+            raise ModOrchestrator.SpecificationError(str(exc)) from exc
+        self._build_graph.add(phase, replace=True)
+
+    def unregister_build_phase(self, name: str) -> bool:
+        return self._build_graph.remove(name)
+
+    def plan_build(self, streaming: bool = False) -> List[List[Tuple[str, str]]]:
+        """Dry run: return the phases in waves of ``(name, description)`` that may run concurrently.
+
+        ``streaming`` plans a build whose project supplies ``card_stream`` instead of ``cards``.
+        """
+
+        graph = self._phase_graph(streaming)
+        try:
+            waves = graph.plan()
+        except BuildGraph.GraphError as exc:
+            raise ModOrchestrator.SpecificationError(str(exc)) from exc
+        descriptions = {phase.name: phase.description for phase in graph.phases}
+        return [[(name, descriptions[name]) for name in wave] for wave in waves]
+
+    def _phase_graph(self, streaming: bool) -> BuildGraph:
+        """Copy the registered phases; streaming builds add one pass over the cards ahead of the entry class."""
+
+        graph = self._build_graph.copy()
+        if not streaming:
+            return graph
+        graph.add(
+            BuildGraph.Phase(
+                ModOrchestrator.PHASE_CARD_STREAM,
+                self._stream_cards,
+                before=(ModOrchestrator.PHASE_PRUNE,),
+                description="Validate, localize, stage art and generate classes for streamed cards in one pass",
+            )
+        )
+        for phase in graph.phases:
+            if phase.name == ModOrchestrator.PHASE_ENTRY_CLASS:
+                graph.add(replace(phase, requires=phase.requires + (ModOrchestrator.PHASE_CARD_STREAM,)), replace=True)
+        return graph
+
+    def emit_output(self, context: "ModOrchestrator.BuildContext", relative_path: str, payload: bytes) -> bool:
+        """Write a project-relative output for a plugin phase; returns ``False`` when it was already up to date."""
+
+        return self._emit_file(context, context.project_root / relative_path, payload)
 
+    def _register_templates(self) -> None:
+        """Precompile the built-in Java templates unless a plugin already supplied replacements."""
+
+        entry_text = textwrap.dedent(ModOrchestrator._ENTRY_TEMPLATE_SOURCE).strip() + "\n"
+        # The original generator dedented after interpolating registration lines, so projects with
+        # several cards or keywords were emitted with the class body shifted four columns right.
+        outdented_entry = textwrap.indent(
+            entry_text, "    ", lambda line: bool(line.strip()) and not line.startswith("${")
+        )
+        sources = [
+            (ModOrchestrator.CARD_TEMPLATE, ModOrchestrator._CARD_TEMPLATE_SOURCE, "card"),
+            (ModOrchestrator.ENTRY_TEMPLATE, entry_text, "entry"),
+            (ModOrchestrator.ENTRY_TEMPLATE_OUTDENTED, outdented_entry, "entry"),
+            (ModOrchestrator.KEYWORD_TEMPLATE, ModOrchestrator._KEYWORD_TEMPLATE_SOURCE, "keyword"),
+            (ModOrchestrator.KEYWORD_FILE_TEMPLATE, ModOrchestrator._KEYWORD_FILE_TEMPLATE_SOURCE, "keyword"),
+            (ModOrchestrator.CARD_ATLAS_TEMPLATE, ModOrchestrator._CARD_ATLAS_TEMPLATE_SOURCE, "card"),
+            (ModOrchestrator.TABLE_CARD_TEMPLATE, ModOrchestrator._TABLE_CARD_TEMPLATE_SOURCE, "card"),
+            (ModOrchestrator.CARD_FACTORY_TEMPLATE, ModOrchestrator._CARD_FACTORY_TEMPLATE_SOURCE, "card"),
+            (ModOrchestrator.CARD_REGISTRY_TEMPLATE, ModOrchestrator._CARD_REGISTRY_TEMPLATE_SOURCE, "entry"),
+            (ModOrchestrator.CARD_TABLE_TEMPLATE, ModOrchestrator._CARD_TABLE_TEMPLATE_SOURCE, "entry"),
+        ]
+        registered = set(self._template_engine.templates())
+        for name, text, kind in sources:
+            if name not in registered:
+                self._template_engine.register_template(name, text, kind=kind)
+
+    def build_mod(
+        self,
+        project: "ModOrchestrator.ModProject",
+        destination: Path,
+        clean: bool = True,
+        options: Optional["ModOrchestrator.BuildOptions"] = None,
+    ) -> Path:
+        """Create the on-disk project structure and compile it into a mod jar.
+
+        With ``options.incremental`` the previous output tree is kept, only outputs whose
+        content hash changed are rewritten and recompiled, and ``clean`` is ignored.
+        """
+
+        return self.build_project(project, destination, clean, options).jar_path
+
+    def build_project(
+        self,
+        project: "ModOrchestrator.ModProject",
+        destination: Path,
+        clean: bool = True,
+        options: Optional["ModOrchestrator.BuildOptions"] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> "ModOrchestrator.BuildResult":
+        """Build like ``build_mod`` and return the jar together with metrics and any in-memory tree.
+
+        With ``options.in_memory`` generated sources, classes and resources never touch the
+        build directory; only the jar and the build manifest are written. Such builds are
+        always full builds.
+
+        Builds of the same project root are serialized within the process, so two callers
+        building one ``mod_id`` into one destination never remove each other's output. Setting
+        ``cancel`` stops the build at the next phase boundary, kills a running javac process and
+        raises ``BuildCancelledError``; ``options.compile_timeout`` bounds each javac run.
+        """
+
+        options = options or ModOrchestrator.BuildOptions()
+        if options.in_memory and options.incremental:
+            options = replace(options, incremental=False)
         self._validate_project(project)
+        if project.card_stream is not None and options.use_artifact_cache:
+            raise ModOrchestrator.SpecificationError("Streamed card sources cannot be keyed for the artifact cache")
         destination = destination.expanduser().resolve()
         destination.mkdir(parents=True, exist_ok=True)
         project_root = destination / project.metadata.mod_id
-        if clean and project_root.exists():
-            shutil.rmtree(project_root)
-        java_root = project_root / "src" / "main" / "java"
-        resource_root = project_root / "src" / "main" / "resources"
-        java_root.mkdir(parents=True, exist_ok=True)
-        resource_root.mkdir(parents=True, exist_ok=True)
+        with self._project_lock(project_root, cancel):
+            try:
+                return self._build_locked(project, project_root, clean, options, cancel)
+            finally:
+                self._previous_jar_path(project_root).unlink(missing_ok=True)
+
+    def _build_locked(
+        self,
+        project: "ModOrchestrator.ModProject",
+        project_root: Path,
+        clean: bool,
+        options: "ModOrchestrator.BuildOptions",
+        cancel: Optional[threading.Event],
+    ) -> "ModOrchestrator.BuildResult":
+        build_thread = threading.get_ident()
+        finished_phases: Deque[BuildProfiler.PhaseRecord] = deque()
+
+        def report_phase(record: BuildProfiler.PhaseRecord) -> None:
+            # Listeners only ever run on the build thread; pooled phases are reported as the graph collects them.
+            if threading.get_ident() == build_thread:
+                self._dispatch_phase(project, record)
+            else:
+                finished_phases.append(record)
 
+        def flush_phases(name: str = "") -> None:
+            while finished_phases:
+                self._dispatch_phase(project, finished_phases.popleft())
+
+        profiler = BuildProfiler(on_phase=report_phase)
+        context = ModOrchestrator.BuildContext(
+            project=project,
+            project_root=project_root,
+            options=options,
+            previous_manifest=ModOrchestrator.BuildManifest(),
+            profiler=profiler,
+            cancel=cancel,
+        )
         self._plugin_manager.dispatch_event(
             "mod.build.start",
             {"project": project, "destination": str(project_root)},
         )
 
-        self._write_mod_metadata(resource_root, project)
-        self._write_localization(resource_root, project)
-        self._copy_assets(resource_root, project)
-        self._write_entry_class(java_root, project)
-        self._write_card_classes(java_root, project)
+        jar_path = project_root / "build" / f"{project.metadata.mod_id}.jar"
+        with profiler.phase(ModOrchestrator.PHASE_PREPARE):
+            previous_manifest = ModOrchestrator.BuildManifest.load(context.manifest_path)
+            if options.incremental:
+                context.previous_manifest = previous_manifest
+            else:
+                # Source fingerprints stay valid across clean builds; only the output records are dropped.
+                context.previous_manifest.sources = previous_manifest.sources
+                context.previous_manifest.packaging = previous_manifest.packaging
+            if clean and not options.incremental and project_root.exists():
+                if options.incremental_jar and jar_path.exists():
+                    # Parked beside the tree being removed so packaging can still reuse its compressed entries.
+                    context.previous_jar = self._previous_jar_path(project_root)
+                    os.replace(jar_path, context.previous_jar)
+                shutil.rmtree(project_root)
+            if options.in_memory:
+                context.memory = {}
+            else:
+                context.java_root.mkdir(parents=True, exist_ok=True)
+                context.resource_root.mkdir(parents=True, exist_ok=True)
 
-        jar_path = self._compile_project(project_root, project)
+        artifact_cache: Optional[ArtifactCache] = None
+        artifact_key = ""
+        if options.use_artifact_cache:
+            with profiler.phase(ModOrchestrator.PHASE_CACHE_LOOKUP):
+                artifact_cache = self.artifact_cache()
+                artifact_key = self._artifact_key(project, options)
+                cached = artifact_cache.lookup(artifact_key)
+                if cached is not None:
+                    jar_path.parent.mkdir(parents=True, exist_ok=True)
+                    try:
+                        shutil.copy2(cached, jar_path)
+                    except OSError as exc:
+                        # Another build may evict the artifact between the lookup and the copy.
+                        self._logger.warning("Cached artifact %s is unreadable: %s", artifact_key[:12], exc)
+                        jar_path.unlink(missing_ok=True)
+                        cached = None
+            if cached is not None:
+                report = profiler.report(jar_path.stat().st_size)
+                result = ModOrchestrator.BuildResult(
+                    jar_path=jar_path, project_root=project_root, cache_hit=True, report=report
+                )
+                self._plugin_manager.dispatch_event(
+                    "mod.build.completed",
+                    {
+                        "project": project,
+                        "jar_path": str(jar_path),
+                        "metrics": {},
+                        "cache_hit": True,
+                        "result": result,
+                        "report": report,
+                    },
+                )
+                self._logger.info("Reused cached artifact %s for %s", artifact_key[:12], jar_path)
+                return result
 
+        graph = self._phase_graph(project.card_stream is not None)
+        try:
+            graph.run(
+                context,
+                options.phase_workers,
+                instrument=lambda name: self._guarded_phase(context, name),
+                on_finished=flush_phases,
+            )
+        except BuildGraph.GraphError as exc:
+            raise ModOrchestrator.SpecificationError(str(exc)) from exc
+        except BaseException:
+            # Outputs may already differ from the recorded hashes; the next incremental build must not trust them.
+            if context.memory is None:
+                context.manifest_path.unlink(missing_ok=True)
+            raise
+        with profiler.phase(ModOrchestrator.PHASE_FINALIZE):
+            context.manifest.save(context.manifest_path)
+            if artifact_cache is not None:
+                try:
+                    artifact_cache.store(artifact_key, jar_path, project.metadata.mod_id)
+                except ArtifactCache.CacheError as exc:
+                    # The jar is already built; a full or read-only cache must not fail the build.
+                    self._logger.warning("Unable to cache artifact for %s: %s", project.metadata.mod_id, exc)
+
+        report = profiler.report(jar_path.stat().st_size, context.metrics)
+        result = ModOrchestrator.BuildResult(
+            jar_path=jar_path,
+            project_root=project_root,
+            metrics=dict(context.metrics),
+            files=dict(context.memory or {}),
+            report=report,
+        )
         self._plugin_manager.dispatch_event(
             "mod.build.completed",
-            {"project": project, "jar_path": str(jar_path)},
+            {
+                "project": project,
+                "jar_path": str(jar_path),
+                "metrics": dict(context.metrics),
+                "cache_hit": False,
+                "result": result,
+                "report": report,
+            },
         )
-        self._logger.info("Built mod jar at %s", jar_path)
-        return jar_path
+        self._logger.info(
+            "Built mod jar at %s in %.2fs (%d files, %d bytes written; jar %d bytes)",
+            jar_path,
+            report.total_seconds,
+            report.files_written,
+            report.bytes_written,
+            report.jar_bytes,
+        )
+        return result
 
-    def _validate_project(self, project: "ModOrchestrator.ModProject") -> None:
-        metadata = project.metadata
-        if not re.fullmatch(r"[a-z][a-z0-9_.-]*", metadata.mod_id):
-            raise ModOrchestrator.SpecificationError(
-                "mod_id must start with a lowercase letter and contain only lowercase letters, numbers, '_', '-' or '.'"
+    @contextmanager
+    def _project_lock(self, project_root: Path, cancel: Optional[threading.Event] = None) -> Iterator[None]:
+        """Hold the process-wide lock of ``project_root``, giving up if ``cancel`` is set while waiting."""
+
+        key = str(project_root)
+        with ModOrchestrator._ROOT_LOCKS_GUARD:
+            entry = ModOrchestrator._ROOT_LOCKS.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+        lock: threading.Lock = entry[0]
+        try:
+            if cancel is None:
+                lock.acquire()
+            else:
+                while not lock.acquire(timeout=JavaCompilerService.SubprocessBackend.POLL_INTERVAL):
+                    if cancel.is_set():
+                        raise ModOrchestrator.BuildCancelledError(f"Build of {project_root.name} was cancelled")
+            try:
+                yield
+            finally:
+                lock.release()
+        finally:
+            with ModOrchestrator._ROOT_LOCKS_GUARD:
+                entry[1] -= 1
+                if not entry[1]:
+                    del ModOrchestrator._ROOT_LOCKS[key]
+
+    @staticmethod
+    def _previous_jar_path(project_root: Path) -> Path:
+        return project_root.with_name(f".{project_root.name}.previous.jar")
+
+    @contextmanager
+    def _guarded_phase(self, context: "ModOrchestrator.BuildContext", name: str) -> Iterator[Any]:
+        self._check_cancelled(context)
+        with context.profiler.phase(name) as record:
+            yield record
+
+    @staticmethod
+    def _check_cancelled(context: "ModOrchestrator.BuildContext") -> None:
+        if context.cancel is not None and context.cancel.is_set():
+            raise ModOrchestrator.BuildCancelledError(f"Build of {context.project.metadata.mod_id} was cancelled")
+
+    def build_many(
+        self,
+        projects: Sequence["ModOrchestrator.ModProject"],
+        destination: Path,
+        clean: bool = True,
+        options: Optional["ModOrchestrator.BuildOptions"] = None,
+        workers: int = 0,
+    ) -> List["ModOrchestrator.BatchOutcome"]:
+        """Build every project on one shared worker pool; outcomes come back in input order.
+
+        Files used by more than one project, such as shared card art, are fingerprinted once
+        here, along with the dependency jars when artifact keys need them. The digests are
+        handed to every worker. Each worker process keeps its orchestrator and warms the
+        compiler once, before its first build, so per-project start-up is paid once per worker.
+        A failing project is reported in its outcome and never stops the batch.
+        ``workers=1`` builds here, one after another. Worker processes import this module
+        afresh: build phases registered at runtime and plugin event handlers of this process
+        do not apply to their builds.
+        """
+
+        options = options or ModOrchestrator.BuildOptions()
+        destination = destination.expanduser().resolve()
+        outcomes: List[Optional[ModOrchestrator.BatchOutcome]] = [None] * len(projects)
+        roots: Dict[str, int] = {}
+        pending: List[int] = []
+        for index, project in enumerate(projects):
+            owner = roots.setdefault(project.metadata.mod_id, index)
+            if owner != index:
+                outcomes[index] = ModOrchestrator.BatchOutcome(
+                    project.metadata.mod_id,
+                    error=f"Project #{owner} already builds mod '{project.metadata.mod_id}' into {destination}",
+                    error_type=ModOrchestrator.SpecificationError.__name__,
+                )
+            else:
+                pending.append(index)
+        started = time.perf_counter()
+        digests = self._shared_digests([projects[index] for index in pending], options)
+        workers = workers or min(len(pending), os.cpu_count() or 1)
+        if workers <= 1 or len(pending) <= 1:
+            self._warm_compiler(options.compiler_backend)
+            for index in pending:
+                outcomes[index] = self._build_outcome(projects[index], destination, clean, options)
+        else:
+            config = self._logic.runtime_config.to_dict()
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=ModOrchestrator._init_batch_worker,
+                initargs=(config, digests, options.compiler_backend),
+            ) as executor:
+                build = ModOrchestrator._batch_worker_build
+                futures = {
+                    executor.submit(build, projects[index], destination, clean, options): index for index in pending
+                }
+                for future, index in futures.items():
+                    try:
+                        outcomes[index] = future.result()
+                    except Exception as exc:  # pickling failures and crashed workers
+                        outcomes[index] = ModOrchestrator.BatchOutcome(
+                            projects[index].metadata.mod_id, error=str(exc), error_type=type(exc).__name__
+                        )
+        results = [outcome for outcome in outcomes if outcome is not None]
+        failed = sum(1 for outcome in results if not outcome.ok)
+        self._logger.info(
+            "Built %d of %d projects in %.2fs with %d worker(s)",
+            len(results) - failed,
+            len(results),
+            time.perf_counter() - started,
+            max(1, workers),
+        )
+        return results
+
+    def _build_outcome(
+        self,
+        project: "ModOrchestrator.ModProject",
+        destination: Path,
+        clean: bool,
+        options: "ModOrchestrator.BuildOptions",
+    ) -> "ModOrchestrator.BatchOutcome":
+        started = time.perf_counter()
+        try:
+            result = self.build_project(project, destination, clean, options)
+        except Exception as exc:
+            self._logger.error("Build of %s failed: %s", project.metadata.mod_id, exc)
+            return ModOrchestrator.BatchOutcome(
+                project.metadata.mod_id,
+                error=str(exc),
+                error_type=type(exc).__name__,
+                diagnostics=list(getattr(exc, "diagnostics", [])),
+                seconds=time.perf_counter() - started,
             )
-        if not re.fullmatch(r"[A-Za-z_][0-9A-Za-z_.]*", metadata.package):
-            raise ModOrchestrator.SpecificationError("package name must be a valid Java package identifier")
-        if not re.fullmatch(r"[A-Za-z_][0-9A-Za-z_]*", metadata.entry_class):
-            raise ModOrchestrator.SpecificationError("entry class must be a valid Java identifier")
-        seen_ids = set()
-        for card in project.cards:
-            if card.card_id in seen_ids:
-                raise ModOrchestrator.SpecificationError(f"Duplicate card id '{card.card_id}' detected")
-            seen_ids.add(card.card_id)
-        for asset in project.assets:
-            if not asset.source.exists():
-                raise ModOrchestrator.SpecificationError(f"Asset '{asset.source}' does not exist")
+        return ModOrchestrator.BatchOutcome(project.metadata.mod_id, result, seconds=time.perf_counter() - started)
+
+    def _shared_digests(
+        self,
+        projects: Sequence["ModOrchestrator.ModProject"],
+        options: "ModOrchestrator.BuildOptions",
+    ) -> Dict[Tuple[str, int, int], str]:
+        """Fingerprint files that several builds would otherwise each hash, and return the digest cache entries."""
+
+        uses: Dict[Path, int] = {}
+        for project in projects:
+            sources = {asset.source for asset in project.assets}
+            sources.update(card.image_path for card in project.cards if card.image_path is not None)
+            if options.use_artifact_cache:
+                try:
+                    sources.update(Path(entry) for entry in self._compose_classpath(project).split(os.pathsep) if entry)
+                except ModOrchestrator.BuildError:
+                    pass  # reported by the project's own build
+            for source in sources:
+                uses[source] = uses.get(source, 0) + 1
+        shared = [path for path, count in uses.items() if count > 1 or options.use_artifact_cache]
+        keys = set()
+        for path in shared:
+            try:
+                self._file_digest(path)
+                stat = path.stat()
+            except OSError:
+                continue
+            keys.add((str(path), stat.st_size, stat.st_mtime_ns))
+        with self._digest_lock:
+            return {key: self._digest_cache[key] for key in keys if key in self._digest_cache}
+
+    def _warm_compiler(self, backend: str) -> None:
+        """Pay the compiler's start-up cost (``javac`` probes or JVM launch) before the first build."""
+
+        try:
+            javac = self._locate_javac() if backend == JavaCompilerService.SUBPROCESS else ""
+            self._compiler_service.compiler_version(backend, javac)
+            if javac:
+                self._compiler_service.backend(backend).supports_release_flag(javac)
+        except Exception as exc:  # the builds themselves report a missing compiler
+            self._logger.debug("Compiler warm-up for %s skipped: %s", backend, exc)
+
+    @staticmethod
+    def _init_batch_worker(
+        config: Dict[str, Any],
+        digests: Dict[Tuple[str, int, int], str],
+        backend: str,
+    ) -> None:
+        # Only this worker process sees the parent's configuration; nothing is saved to disk.
+        runtime_config = MOD_ORCHESTRATOR._logic.runtime_config
+        for key, value in config.items():
+            setattr(runtime_config, key, value)
+        with MOD_ORCHESTRATOR._digest_lock:
+            MOD_ORCHESTRATOR._digest_cache.update(digests)
+        MOD_ORCHESTRATOR._warm_compiler(backend)
+
+    @staticmethod
+    def _batch_worker_build(
+        project: "ModOrchestrator.ModProject",
+        destination: Path,
+        clean: bool,
+        options: "ModOrchestrator.BuildOptions",
+    ) -> "ModOrchestrator.BatchOutcome":
+        return MOD_ORCHESTRATOR._build_outcome(project, destination, clean, options)
+
+    def _dispatch_phase(self, project: "ModOrchestrator.ModProject", record: BuildProfiler.PhaseRecord) -> None:
+        self._plugin_manager.dispatch_event(
+            "mod.build.phase",
+            {
+                "project": project,
+                "phase": record.name,
+                "seconds": record.seconds,
+                "files_written": record.files_written,
+                "bytes_written": record.bytes_written,
+                "error": record.error,
+            },
+        )
+
+    def artifact_cache(self) -> ArtifactCache:
+        """Return the artifact store configured in the runtime configuration."""
+
+        config = self._logic.runtime_config
+        root = ArtifactCache.default_root()
+        if config.artifact_cache_dir:
+            root = Path(config.artifact_cache_dir).expanduser()
+        max_bytes = int(config.artifact_cache_max_mb) * 1024 * 1024
+        store = self._artifact_store
+        if store is None or store.root != root.resolve() or store.max_bytes != max_bytes:
+            store = ArtifactCache(root, max_bytes)
+            self._artifact_store = store
+        return store
+
+    def card_art_pipeline(self) -> CardArtPipeline:
+        """Return the card-art variant generator rooted at the configured resize cache."""
+
+        config = self._logic.runtime_config
+        root = CardArtPipeline.default_root()
+        if config.card_art_cache_dir:
+            root = Path(config.card_art_cache_dir).expanduser()
+        pipeline = self._card_art
+        if pipeline is None or pipeline.root != root.resolve():
+            pipeline = CardArtPipeline(root)
+            self._card_art = pipeline
+        return pipeline
+
+    def _artifact_key(self, project: "ModOrchestrator.ModProject", options: "ModOrchestrator.BuildOptions") -> str:
+        """Hash everything that determines the jar: project data, asset bytes, dependencies and toolchain."""
+
+        digest = hashlib.sha256(f"stsmodder-artifact-v{ModOrchestrator.ARTIFACT_FORMAT}".encode("utf-8"))
+        keyed = replace(project, cards=list(project.cards))
+        digest.update(json.dumps(asdict(keyed), sort_keys=True, default=str).encode("utf-8"))
+        output_options = {
+            option.name: getattr(options, option.name)
+            for option in fields(options)
+            if option.name not in ModOrchestrator._RUNTIME_ONLY_OPTIONS
+        }
+        digest.update(json.dumps(output_options, sort_keys=True, default=str).encode("utf-8"))
+        sources = [asset.source for asset in project.assets]
+        sources.extend(card.image_path for card in project.cards if card.image_path is not None)
+        for source in sources:
+            digest.update(f"{source}={self._file_digest(source)}".encode("utf-8"))
+        for component in filter(None, self._compose_classpath(project).split(os.pathsep)):
+            digest.update(f"{component}={self._file_digest(Path(component))}".encode("utf-8"))
+        backend = options.compiler_backend
+        javac = self._locate_javac() if backend == JavaCompilerService.SUBPROCESS else ""
+        try:
+            digest.update(self._compiler_service.compiler_version(backend, javac).encode("utf-8"))
+        except (
+            JavaCompilerService.CompilerUnavailableError,
+            ApplicationLogic.ConfigurationError,
+            ApplicationLogic.JPypeUnavailableError,
+        ) as exc:
+            raise ModOrchestrator.BuildError(str(exc)) from exc
+        plugin_phases = sorted(
+            phase.name for phase in self._build_graph.phases if phase.name not in ModOrchestrator._BUILTIN_PHASES
+        )
+        digest.update(repr(plugin_phases).encode("utf-8"))
+        for name in sorted(self._template_engine.templates()):
+            if name.startswith("modorchestrator."):
+                template = self._template_engine.get_template(name)
+                digest.update(repr((name, template.segments, template.slot_positions)).encode("utf-8"))
+        return digest.hexdigest()
+
+    def validate_project(self, project: "ModOrchestrator.ModProject") -> ProjectValidator.Report:
+        """Check the whole project in one pass and return every violation without building."""
+
+        return self._validator.validate(project)
+
+    def _validate_project(self, project: "ModOrchestrator.ModProject") -> None:
+        report = self._validator.validate(project)
+        if not report.ok:
+            raise ModOrchestrator.ValidationError(report.summary(), report.violations)
+
+    def _emit_file(
+        self,
+        context: "ModOrchestrator.BuildContext",
+        path: Path,
+        payload: bytes,
+        digest: Optional[str] = None,
+    ) -> bool:
+        """Write ``payload`` unless an incremental build already produced identical bytes."""
+
+        if not self._claim_output(context, path, digest or hashlib.sha256(payload).hexdigest()):
+            return False
+        self._store(context, path, payload)
+        return True
+
+    def _store(self, context: "ModOrchestrator.BuildContext", path: Path, payload: Union[bytes, Path]) -> None:
+        """Persist an output, or keep it in ``context.memory`` for in-memory builds."""
+
+        context.profiler.record_write(payload.stat().st_size if isinstance(payload, Path) else len(payload))
+        if context.memory is not None:
+            relative = context.relative(path)
+            with context.lock:
+                context.memory[relative] = payload
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(payload, Path):
+            shutil.copy2(payload, path)
+        else:
+            path.write_bytes(payload)
+
+    def _emit_copy(
+        self,
+        context: "ModOrchestrator.BuildContext",
+        source: Path,
+        path: Path,
+        digest: Optional[str] = None,
+    ) -> bool:
+        """Place ``source`` at ``path`` unless the destination already mirrors it.
+
+        A destination that is the same inode as ``source``, or carries its size and mtime, is
+        kept as is. Otherwise the file is hardlinked, reflinked or copied, in that order of
+        preference, so unchanged art never has its bytes rewritten.
+        """
+
+        digest = digest or self._source_digest(context, source)
+        if context.memory is not None:
+            # The jar writer reads the source directly; nothing is staged.
+            if self._claim_output(context, path, digest):
+                self._store(context, path, source)
+            return True
+        if self._destination_mirrors(source, path):
+            relative = context.relative(path)
+            with context.lock:
+                context.manifest.entries[relative] = digest
+                if context.previous_manifest.entries.get(relative) != digest:
+                    context.changed_outputs.add(relative)
+                context.metrics["assets_skipped"] = context.metrics.get("assets_skipped", 0.0) + 1
+            return False
+        if not self._claim_output(context, path, digest):
+            return False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        method = self._place_file(source, path, context.options.link_assets)
+        context.profiler.record_write(path.stat().st_size)
+        with context.lock:
+            context.metrics[f"assets_{method}"] = context.metrics.get(f"assets_{method}", 0.0) + 1
+        return True
+
+    @staticmethod
+    def _destination_mirrors(source: Path, path: Path) -> bool:
+        try:
+            destination_stat = path.stat()
+        except FileNotFoundError:
+            return False
+        source_stat = source.stat()
+        if (source_stat.st_dev, source_stat.st_ino) == (destination_stat.st_dev, destination_stat.st_ino):
+            return True
+        return (
+            source_stat.st_size == destination_stat.st_size
+            and source_stat.st_mtime_ns == destination_stat.st_mtime_ns
+        )
 
-    def _write_mod_metadata(self, resource_root: Path, project: "ModOrchestrator.ModProject") -> None:
-        meta_dir = resource_root / "META-INF"
-        meta_dir.mkdir(parents=True, exist_ok=True)
+    @staticmethod
+    def _place_file(source: Path, path: Path, link: bool) -> str:
+        """Materialise ``source`` at ``path`` and return how: ``linked``, ``cloned`` or ``copied``."""
+
+        # Never write through an existing destination: it may be a hardlink to an older source.
+        path.unlink(missing_ok=True)
+        if link:
+            try:
+                os.link(source, path)
+                return "linked"
+            except OSError:
+                pass
+            if ModOrchestrator._reflink(source, path):
+                return "cloned"
+        shutil.copy2(source, path)
+        return "copied"
+
+    @staticmethod
+    def _reflink(source: Path, path: Path) -> bool:
+        """Clone ``source`` into ``path`` with the Linux FICLONE ioctl (btrfs, XFS, bcachefs)."""
+
+        try:
+            import fcntl
+        except ImportError:
+            return False
+        try:
+            with source.open("rb") as source_handle, path.open("wb") as target_handle:
+                fcntl.ioctl(target_handle.fileno(), ModOrchestrator._FICLONE, source_handle.fileno())
+            shutil.copystat(source, path)
+            return True
+        except OSError:
+            path.unlink(missing_ok=True)
+            return False
+
+    def _claim_output(self, context: "ModOrchestrator.BuildContext", path: Path, digest: str) -> bool:
+        """Record ``path`` in the manifest and report whether its bytes must be (re)written."""
+
+        relative = context.relative(path)
+        with context.lock:
+            context.manifest.entries[relative] = digest
+            if (
+                context.options.incremental
+                and context.previous_manifest.entries.get(relative) == digest
+                and path.exists()
+            ):
+                return False
+            context.changed_outputs.add(relative)
+        return True
+
+    def _source_digest(self, context: "ModOrchestrator.BuildContext", path: Path) -> str:
+        """Return the sha256 of an asset source, trusting the previous build's fingerprint when it still matches."""
+
+        stat = path.stat()
+        key = str(path.resolve())
+        recorded = context.previous_manifest.sources.get(key)
+        if recorded and recorded[0] == stat.st_size and recorded[1] == stat.st_mtime_ns:
+            digest = recorded[2]
+        else:
+            digest = self._file_digest(path)
+        with context.lock:
+            context.manifest.sources[key] = [stat.st_size, stat.st_mtime_ns, digest]
+        return digest
+
+    def _file_digest(self, path: Path) -> str:
+        """Return the sha256 of ``path``, reusing the previous result while size and mtime are unchanged."""
+
+        stat = path.stat()
+        key = (str(path), stat.st_size, stat.st_mtime_ns)
+        with self._digest_lock:
+            cached = self._digest_cache.get(key)
+        if cached is None:
+            cached = self._hash_file(path)
+            with self._digest_lock:
+                self._digest_cache[key] = cached
+        return cached
+
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        digest = hashlib.sha256()
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _remove_stale_outputs(self, context: "ModOrchestrator.BuildContext") -> None:
+        """Delete outputs recorded by the previous build that this build no longer produces."""
+
+        java_prefix = context.relative(context.java_root) + "/"
+        for relative in sorted(set(context.previous_manifest.entries) - set(context.manifest.entries)):
+            stale_path = context.project_root / relative
+            if stale_path.exists():
+                stale_path.unlink()
+            context.removed_outputs.add(relative)
+            if relative.startswith(java_prefix) and relative.endswith(".java"):
+                class_stem = relative[len(java_prefix) : -len(".java")]
+                class_path = context.classes_dir / f"{class_stem}.class"
+                for compiled in class_path.parent.glob(f"{class_path.stem}$*.class"):
+                    compiled.unlink()
+                if class_path.exists():
+                    class_path.unlink()
+
+    def _write_mod_metadata(self, context: "ModOrchestrator.BuildContext") -> None:
+        project = context.project
+        meta_dir = context.resource_root / "META-INF"
         metadata = project.metadata
         mod_json = {
             "modid": metadata.mod_id,
@@ -185,134 +1708,679 @@ class ModOrchestrator:
         if metadata.homepage:
             mod_json["homepage"] = metadata.homepage
         mod_json_path = meta_dir / "mod.json"
-        with mod_json_path.open("w", encoding="utf-8") as handle:
-            json.dump(mod_json, handle, indent=2)
+        self._emit_file(context, mod_json_path, json.dumps(mod_json, indent=2).encode("utf-8"))
 
-    def _write_localization(self, resource_root: Path, project: "ModOrchestrator.ModProject") -> None:
-        base_dir = resource_root / f"{project.metadata.mod_id}Resources" / "localization" / "eng"
-        base_dir.mkdir(parents=True, exist_ok=True)
-        cards_payload: Dict[str, Dict[str, str]] = {}
-        for card in project.cards:
-            cards_payload[card.card_id] = {
-                "NAME": card.name,
-                "DESCRIPTION": card.description,
-                "UPGRADE_DESCRIPTION": card.upgrade_description,
-            }
-        cards_path = base_dir / "cards.json"
-        with cards_path.open("w", encoding="utf-8") as handle:
-            json.dump({"cards": cards_payload}, handle, indent=2)
+    def _write_localization(self, context: "ModOrchestrator.BuildContext") -> None:
+        """Write ``cards.json`` and ``keywords.json`` for English and every translated language.
+
+        Languages are written concurrently and every file is streamed entry by entry. Streamed
+        projects get their ``cards.json`` files from the card stream phase instead.
+        """
+
+        project = context.project
+        translations = {translation.language: translation for translation in project.translations}
+        languages = self._languages(project)
+        workers = context.options.localization_workers or len(languages)
+        if workers <= 1 or len(languages) == 1:
+            for language in languages:
+                self._write_language(context, language, translations.get(language))
+            return
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stsm-l10n") as executor:
+            write = context.profiler.bind(self._write_language)
+            futures = [executor.submit(write, context, language, translations.get(language)) for language in languages]
+            for future in futures:
+                future.result()
+
+    def _write_language(
+        self,
+        context: "ModOrchestrator.BuildContext",
+        language: str,
+        translation: Optional["ModOrchestrator.Translation"],
+    ) -> None:
+        project = context.project
+        compact = context.options.compact_localization
+        base_dir = self._localization_dir(context, language)
+        if project.card_stream is None:
+
+            def card_chunks() -> Iterable[bytes]:
+                encoder = ModOrchestrator.StringsEncoder("cards", compact)
+                yield encoder.header()
+                for card in project.cards:
+                    yield encoder.item(self._card_strings(card, translation), card.card_id)
+                yield encoder.footer()
+
+            self._emit_stream(context, base_dir / "cards.json", card_chunks)
 
         if project.keywords:
-            keyword_payload = []
-            for keyword in project.keywords:
-                keyword_payload.append(
-                    {
+
+            def keyword_chunks() -> Iterable[bytes]:
+                encoder = ModOrchestrator.StringsEncoder("keywords", compact, as_list=True)
+                yield encoder.header()
+                for keyword in project.keywords:
+                    strings: Dict[str, Any] = {
                         "PROPER_NAME": keyword.proper_name,
                         "NAMES": keyword.names,
                         "DESCRIPTION": keyword.description,
                     }
-                )
-            keywords_path = base_dir / "keywords.json"
-            with keywords_path.open("w", encoding="utf-8") as handle:
-                json.dump({"keywords": keyword_payload}, handle, indent=2)
+                    if translation is not None:
+                        strings.update(translation.keywords.get(keyword.proper_name, {}))
+                    yield encoder.item(strings)
+                yield encoder.footer()
+
+            self._emit_stream(context, base_dir / "keywords.json", keyword_chunks)
 
-    def _copy_assets(self, resource_root: Path, project: "ModOrchestrator.ModProject") -> None:
+    @staticmethod
+    def _languages(project: "ModOrchestrator.ModProject") -> List[str]:
+        languages = [ModOrchestrator.DEFAULT_LANGUAGE]
+        languages.extend(translation.language for translation in project.translations)
+        return list(dict.fromkeys(languages))
+
+    @staticmethod
+    def _localization_dir(context: "ModOrchestrator.BuildContext", language: str) -> Path:
+        return context.resource_root / f"{context.project.metadata.mod_id}Resources" / "localization" / language
+
+    @staticmethod
+    def _card_strings(
+        card: "ModOrchestrator.CardDefinition",
+        translation: Optional["ModOrchestrator.Translation"] = None,
+    ) -> Dict[str, str]:
+        strings = {
+            "NAME": card.name,
+            "DESCRIPTION": card.description,
+            "UPGRADE_DESCRIPTION": card.upgrade_description,
+        }
+        if translation is not None:
+            strings.update(translation.cards.get(card.card_id, {}))
+        return strings
+
+    @staticmethod
+    def _strings_path_expression(metadata: "ModOrchestrator.ModMetadata", languages: List[str], file_name: str) -> str:
+        """Java expression locating a strings file; picks the game language when a translation exists."""
+
+        root = f"{metadata.mod_id}Resources/localization/"
+        if languages == [ModOrchestrator.DEFAULT_LANGUAGE]:
+            return f'"{root}{ModOrchestrator.DEFAULT_LANGUAGE}/{file_name}"'
+        language = "com.megacrit.cardcrawl.core.Settings.language.name().toLowerCase()"
+        known = ", ".join(f'"{code}"' for code in languages)
+        return (
+            f'"{root}" + (java.util.Arrays.asList({known}).contains({language}) ? {language} : '
+            f'"{ModOrchestrator.DEFAULT_LANGUAGE}") + "/{file_name}"'
+        )
+
+    def _emit_stream(
+        self,
+        context: "ModOrchestrator.BuildContext",
+        path: Path,
+        chunks: Callable[[], Iterable[bytes]],
+    ) -> bool:
+        """Write the bytes produced by ``chunks()`` to ``path`` without holding them all at once.
+
+        Incremental builds first hash the content and leave the file alone when the digest
+        matches the previous build, so unchanged languages are never rewritten.
+        """
+
+        if context.options.incremental and context.memory is None:
+            digest = hashlib.sha256()
+            for chunk in chunks():
+                digest.update(chunk)
+            if not self._claim_output(context, path, digest.hexdigest()):
+                return False
+        output = self._open_output(context, path)
+        try:
+            for chunk in chunks():
+                output.write(chunk)
+        except BaseException:
+            self._abort_output(output)
+            raise
+        return self._close_output(context, output)
+
+    def _copy_assets(self, context: "ModOrchestrator.BuildContext") -> None:
+        """Stage assets and card art, storing byte-identical card images only once.
+
+        With ``options.deduplicate_assets`` a card whose image matches an already staged file
+        is pointed at that file through ``context.image_paths`` instead of receiving a copy.
+        With ``options.card_art_variants`` each card image is replaced by the resized small
+        and ``_p`` portrait variants produced by ``CardArtPipeline``. With
+        ``options.pack_card_atlas`` the small images go into texture atlas pages instead of
+        individual files.
+        """
+
+        project = context.project
+        staged: Dict[str, str] = {}
         for asset in project.assets:
-            destination = resource_root / asset.relative_path
-            destination.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(asset.source, destination)
+            digest = self._source_digest(context, asset.source)
+            self._emit_copy(context, asset.source, context.resource_root / asset.relative_path, digest)
+            staged.setdefault(digest, asset.relative_path)
+        card_digests = {
+            card.card_id: self._source_digest(context, card.image_path)
+            for card in project.cards
+            if card.image_path is not None
+        }
+        variants: Dict[str, Dict[str, Path]] = {}
+        if context.options.card_art_variants and card_digests:
+            variants = self._render_card_art(context, card_digests)
+            # Variant sets can only be shared with other cards, never with plain asset mappings.
+            staged = {}
+        atlas_images: Dict[str, Path] = {}
+        duplicates = 0
         for card in project.cards:
             if card.image_path is None:
                 continue
-            destination = resource_root / card.resource_image_path(project.metadata.mod_id)
-            destination.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(card.image_path, destination)
+            digest = card_digests[card.card_id]
+            resource_path = card.resource_image_path(project.metadata.mod_id)
+            shared = staged.get(digest)
+            if context.options.deduplicate_assets and shared is not None and shared != resource_path:
+                context.image_paths[card.card_id] = shared
+                duplicates += 1
+                continue
+            if variants:
+                files = {
+                    CardArtPipeline.variant_path(resource_path, suffix): rendered
+                    for suffix, rendered in variants[digest].items()
+                }
+            else:
+                files = {resource_path: card.image_path}
+            if context.options.pack_card_atlas:
+                atlas_images[resource_path] = files.pop(resource_path)
+            for relative_path, source in files.items():
+                source_digest = digest if source == card.image_path else None
+                self._emit_copy(context, source, context.resource_root / relative_path, source_digest)
+            staged.setdefault(digest, resource_path)
+        context.metrics["assets_deduplicated"] = float(duplicates)
+        if atlas_images:
+            self._write_card_atlas(context, atlas_images)
+
+    def _write_card_atlas(self, context: "ModOrchestrator.BuildContext", images: Dict[str, Path]) -> None:
+        """Pack card images into atlas pages; pages are only recomposited when their layout or art changed."""
 
-    def _write_entry_class(self, java_root: Path, project: "ModOrchestrator.ModProject") -> None:
+        atlas_dir = f"{context.project.metadata.mod_id}Resources/images/cards/atlas"
+        regions = {os.path.splitext(resource_path)[0]: source for resource_path, source in images.items()}
+        packer = TextureAtlasPacker(context.options.atlas_page_size)
+        try:
+            pages = packer.layout(regions, page_name="cards")
+            layout_digest = hashlib.sha256(f"atlas-v1:{context.options.atlas_page_size}".encode("utf-8"))
+            for page in pages:
+                layout_digest.update(f"{page.file_name}:{page.width}x{page.height}".encode("utf-8"))
+                for region in page.regions:
+                    placement = f"{region.name}@{region.x},{region.y}={self._file_digest(region.source)}"
+                    layout_digest.update(placement.encode("utf-8"))
+            key = layout_digest.hexdigest()
+            for page in pages:
+                page_path = context.resource_root / atlas_dir / page.file_name
+                page_digest = hashlib.sha256(f"{key}:{page.file_name}".encode("utf-8")).hexdigest()
+                if self._claim_output(context, page_path, page_digest):
+                    self._store(context, page_path, packer.render_page(page))
+        except (TextureAtlasPacker.AtlasError, TextureAtlasPacker.PillowUnavailableError) as exc:
+            raise ModOrchestrator.BuildError(str(exc)) from exc
+        atlas_path = f"{atlas_dir}/cards.atlas"
+        self._emit_file(context, context.resource_root / atlas_path, packer.atlas_text(pages).encode("utf-8"))
+        context.card_atlas = atlas_path
+        context.metrics["atlas_pages"] = float(len(pages))
+        context.metrics["atlas_regions"] = float(len(regions))
+
+    def _render_card_art(
+        self,
+        context: "ModOrchestrator.BuildContext",
+        card_digests: Dict[str, str],
+    ) -> Dict[str, Dict[str, Path]]:
+        sources = {card_digests[card.card_id]: card.image_path for card in context.project.cards if card.image_path}
+        try:
+            batch = self.card_art_pipeline().render(sources, context.options.card_art_workers)
+        except (CardArtPipeline.PillowUnavailableError, CardArtPipeline.ImageProcessingError) as exc:
+            raise ModOrchestrator.BuildError(str(exc)) from exc
+        context.metrics["card_art_resized"] = float(batch.resized)
+        context.metrics["card_art_reused"] = float(batch.reused)
+        return batch.outputs
+
+    def _write_entry_class(self, context: "ModOrchestrator.BuildContext") -> None:
+        project = context.project
         metadata = project.metadata
-        package_dir = java_root / Path(metadata.package.replace(".", "/"))
-        package_dir.mkdir(parents=True, exist_ok=True)
+        package_dir = context.java_root / Path(metadata.package.replace(".", "/"))
+        card_registrations = self._write_card_registrations(context, package_dir)
+        languages = self._languages(project)
+        keyword_registrations: List[str]
+        if project.keywords and len(languages) > 1:
+            keyword_registrations = [
+                self._template_engine.render(
+                    ModOrchestrator.KEYWORD_FILE_TEMPLATE,
+                    {"keywords_strings_path": self._strings_path_expression(metadata, languages, "keywords.json")},
+                ).rstrip("\n")
+            ]
+        else:
+            keyword_template = self._template_engine.get_template(ModOrchestrator.KEYWORD_TEMPLATE)
+            keyword_registrations = [
+                keyword_template.render(
+                    {
+                        "proper_name": keyword.proper_name,
+                        "names": ", ".join(f"\"{name}\"" for name in keyword.names),
+                        "description": keyword.description,
+                    }
+                ).rstrip("\n")
+                for keyword in project.keywords
+            ]
+        outdented = len(card_registrations) > 1 or len(keyword_registrations) > 1
+        template_name = ModOrchestrator.ENTRY_TEMPLATE_OUTDENTED if outdented else ModOrchestrator.ENTRY_TEMPLATE
+        first_indent = " " * (12 if outdented else 8)
+        if len(languages) > 1 and keyword_registrations:
+            keyword_registrations = [textwrap.indent(keyword_registrations[0], first_indent).lstrip(" ")]
+        entry_source = self._template_engine.render(
+            template_name,
+            {
+                "package": metadata.package,
+                "entry_class": metadata.entry_class,
+                "mod_id": metadata.mod_id,
+                "cards_strings_path": self._strings_path_expression(metadata, languages, "cards.json"),
+                "card_registrations": first_indent
+                + os.linesep.join(card_registrations or ["// No cards registered."]),
+                "keyword_registrations": first_indent
+                + os.linesep.join(keyword_registrations or ["// No keywords registered."]),
+            },
+        )
+        entry_path = package_dir / f"{metadata.entry_class}.java"
+        self._emit_file(context, entry_path, entry_source.encode("utf-8"))
+
+    def _write_card_registrations(self, context: "ModOrchestrator.BuildContext", package_dir: Path) -> List[str]:
+        """Return the statements ``receiveEditCards`` runs, writing chunk helpers or the card table they call.
+
+        ``inline`` registers every card in the entry class. ``chunked`` moves the calls into
+        helper classes of ``registration_chunk_size`` cards each, so no method or constant
+        pool grows with the project. ``table`` lists the card classes in a resource that a
+        single helper instantiates reflectively. ``auto`` inlines small projects and chunks
+        larger ones.
+        """
+
+        project = context.project
+        metadata = project.metadata
+        options = context.options
         cards_package = f"{metadata.package}.cards"
-        card_registrations = []
-        for card in project.cards:
-            card_registrations.append(
-                f"        BaseMod.addCard(new {cards_package}.{card.class_name()}());"
+        if project.card_stream is not None:
+            class_names = context.streamed_classes
+        else:
+            class_names = [card.class_name() for card in project.cards]
+        if options.card_implementation == ModOrchestrator.CARDS_AS_TABLE and class_names:
+            return [f"{cards_package}.CardTable.registerAll();"]
+        chunk_size = max(1, options.registration_chunk_size)
+        mode = options.card_registration
+        if mode == ModOrchestrator.REGISTRATION_AUTO:
+            inline = len(class_names) <= chunk_size
+            mode = ModOrchestrator.REGISTRATION_INLINE if inline else ModOrchestrator.REGISTRATION_CHUNKED
+        calls = [f"BaseMod.addCard(new {cards_package}.{class_name}());" for class_name in class_names]
+        if mode == ModOrchestrator.REGISTRATION_INLINE or not class_names:
+            return calls
+        if mode == ModOrchestrator.REGISTRATION_CHUNKED:
+            registrations: List[str] = []
+            for index, start in enumerate(range(0, len(calls), chunk_size)):
+                class_name = f"{metadata.entry_class}Cards{index}"
+                source = self._template_engine.render(
+                    ModOrchestrator.CARD_REGISTRY_TEMPLATE,
+                    {
+                        "package": metadata.package,
+                        "class_name": class_name,
+                        "card_registrations": "\n".join(" " * 8 + call for call in calls[start : start + chunk_size]),
+                    },
+                )
+                self._emit_file(context, package_dir / f"{class_name}.java", source.encode("utf-8"))
+                registrations.append(f"{class_name}.register();")
+            return registrations
+        if mode == ModOrchestrator.REGISTRATION_TABLE:
+            table_path = f"{metadata.mod_id}Resources/registration/cards.txt"
+            table = "".join(f"{class_name}\n" for class_name in class_names)
+            self._emit_file(context, context.resource_root / table_path, table.encode("utf-8"))
+            class_name = f"{metadata.entry_class}CardTable"
+            source = self._template_engine.render(
+                ModOrchestrator.CARD_TABLE_TEMPLATE,
+                {
+                    "package": metadata.package,
+                    "class_name": class_name,
+                    "table_path": table_path,
+                    "cards_package": cards_package,
+                },
+            )
+            self._emit_file(context, package_dir / f"{class_name}.java", source.encode("utf-8"))
+            return [f"{class_name}.register();"]
+        raise ModOrchestrator.SpecificationError(f"Unknown card registration mode '{options.card_registration}'")
+
+    def _write_card_classes(self, context: "ModOrchestrator.BuildContext") -> None:
+        project = context.project
+        if not project.cards:
+            return
+        metadata = project.metadata
+        cards_package_dir = context.java_root / Path(f"{metadata.package}.cards".replace(".", "/"))
+        if context.memory is None:
+            cards_package_dir.mkdir(parents=True, exist_ok=True)
+        started = time.perf_counter()
+        template = self._template_engine.get_template(ModOrchestrator.CARD_TEMPLATE)
+        if context.card_atlas:
+            atlas_source = self._template_engine.render(
+                ModOrchestrator.CARD_ATLAS_TEMPLATE,
+                {"package_name": f"{metadata.package}.cards", "atlas_path": context.card_atlas},
             )
-        keyword_registrations = []
-        for keyword in project.keywords:
-            names_literal = ", ".join(f"\"{name}\"" for name in keyword.names)
-            keyword_registrations.append(
-                textwrap.dedent(
-                    f"""
-                    BaseMod.addKeyword("{keyword.proper_name}", new String[]{{{names_literal}}}, "{keyword.description}");
-                    """
-                ).strip()
+            self._emit_file(context, cards_package_dir / "CardAtlas.java", atlas_source.encode("utf-8"))
+        atlas = bool(context.card_atlas)
+        options = context.options
+        if options.card_implementation == ModOrchestrator.CARDS_AS_TABLE:
+            self._write_card_table(context, cards_package_dir, atlas)
+            return
+        if options.card_implementation != ModOrchestrator.CARDS_AS_CLASSES:
+            raise ModOrchestrator.SpecificationError(
+                f"Unknown card implementation '{options.card_implementation}'"
             )
-        entry_source = textwrap.dedent(
-            f"""
-            package {metadata.package};
+        chunk_size = max(1, options.codegen_chunk_size)
+        chunks = [project.cards[index : index + chunk_size] for index in range(0, len(project.cards), chunk_size)]
+        if options.parallel_codegen and len(chunks) > 1:
+            workers = max(1, min(options.codegen_workers or os.cpu_count() or 1, len(chunks)))
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            with pool, ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stsm-emit") as writers:
+                rendered = pool.map(
+                    ModOrchestrator._render_card_chunk,
+                    [metadata] * len(chunks),
+                    chunks,
+                    [template] * len(chunks),
+                    [context.image_paths] * len(chunks),
+                    [atlas] * len(chunks),
+                )
+                writes = [
+                    writers.submit(context.profiler.bind(self._emit_card_batch), context, cards_package_dir, batch)
+                    for batch in rendered
+                ]
+                for write in writes:
+                    write.result()
+        else:
+            for chunk in chunks:
+                rendered_chunk = ModOrchestrator._render_card_chunk(
+                    metadata, chunk, template, context.image_paths, atlas
+                )
+                self._emit_card_batch(context, cards_package_dir, rendered_chunk)
+        elapsed = time.perf_counter() - started
+        rate = len(project.cards) / elapsed if elapsed > 0 else float(len(project.cards))
+        context.metrics["card_classes"] = float(len(project.cards))
+        context.metrics["card_codegen_seconds"] = elapsed
+        context.metrics["cards_per_second"] = rate
+        self._logger.info("Generated %d card classes in %.3fs (%.0f cards/s)", len(project.cards), elapsed, rate)
 
-            import basemod.BaseMod;
-            import basemod.interfaces.EditCardsSubscriber;
-            import basemod.interfaces.EditStringsSubscriber;
-            import basemod.interfaces.PostInitializeSubscriber;
-            import com.evacipated.cardcrawl.modthespire.lib.SpireInitializer;
-            import com.megacrit.cardcrawl.localization.CardStrings;
+    def _write_card_table(
+        self,
+        context: "ModOrchestrator.BuildContext",
+        cards_package_dir: Path,
+        atlas: bool,
+        table: Optional[bytes] = None,
+    ) -> None:
+        """Emit ``TableCard``, its ``CardTable`` factory and the binary table holding every card's stats."""
 
-            @SpireInitializer
-            public class {metadata.entry_class} implements EditCardsSubscriber, EditStringsSubscriber, PostInitializeSubscriber {{
-                public {metadata.entry_class}() {{
-                    BaseMod.subscribe(this);
-                }}
+        metadata = context.project.metadata
+        table_path = f"{metadata.mod_id}Resources/cards/cards.bin"
+        if table is None:
+            table = self._encode_card_table(metadata, context.project.cards, context.image_paths)
+        self._emit_file(context, context.resource_root / table_path, table)
+        package_name = f"{metadata.package}.cards"
+        card_source = self._template_engine.render(
+            ModOrchestrator.TABLE_CARD_TEMPLATE,
+            {"package_name": package_name, "atlas_members": ModOrchestrator._CARD_ATLAS_MEMBERS if atlas else ""},
+        )
+        self._emit_file(context, cards_package_dir / "TableCard.java", card_source.encode("utf-8"))
+        factory_source = self._template_engine.render(
+            ModOrchestrator.CARD_FACTORY_TEMPLATE,
+            {
+                "package_name": package_name,
+                "table_path": table_path,
+                "table_magic": f"0x{ModOrchestrator.CARD_TABLE_MAGIC:08X}",
+                "table_version": ModOrchestrator.CARD_TABLE_VERSION,
+            },
+        )
+        self._emit_file(context, cards_package_dir / "CardTable.java", factory_source.encode("utf-8"))
+        context.metrics["card_classes"] = 1.0
+        context.metrics["card_table_bytes"] = float(len(table))
 
-                public static void initialize() {{
-                    new {metadata.entry_class}();
-                }}
+    @staticmethod
+    def _encode_card_table(
+        metadata: "ModOrchestrator.ModMetadata",
+        cards: List["ModOrchestrator.CardDefinition"],
+        image_paths: Optional[Dict[str, str]] = None,
+    ) -> bytes:
+        """Serialise card stats in the big-endian layout ``CardTable`` reads with ``DataInputStream``.
 
-                @Override
-                public void receiveEditCards() {{
-            {os.linesep.join(card_registrations) if card_registrations else "        // No cards registered."}
-                }}
+        Strings are an int byte length followed by UTF-8; every other field is an int.
+        """
 
-                @Override
-                public void receiveEditStrings() {{
-                    BaseMod.loadCustomStringsFile(
-                        CardStrings.class,
-                        "{project.metadata.mod_id}Resources/localization/eng/cards.json"
-                    );
-                }}
+        image_paths = image_paths or {}
+        buffer = bytearray(ModOrchestrator._card_table_header(len(cards)))
+        for card in cards:
+            buffer += ModOrchestrator._encode_card_row(metadata, card, image_paths.get(card.card_id))
+        return bytes(buffer)
 
-                @Override
-                public void receivePostInitialize() {{
-            {os.linesep.join(f"        {line}" for line in keyword_registrations) if keyword_registrations else "        // No keywords registered."}
-                }}
-            }}
-            """
-        ).strip() + "\n"
-        entry_path = package_dir / f"{metadata.entry_class}.java"
-        with entry_path.open("w", encoding="utf-8") as handle:
-            handle.write(entry_source)
+    @staticmethod
+    def _card_table_header(count: int) -> bytes:
+        return struct.pack(">iii", ModOrchestrator.CARD_TABLE_MAGIC, ModOrchestrator.CARD_TABLE_VERSION, count)
 
-    def _write_card_classes(self, java_root: Path, project: "ModOrchestrator.ModProject") -> None:
-        if not project.cards:
-            return
+    @staticmethod
+    def _encode_card_row(
+        metadata: "ModOrchestrator.ModMetadata",
+        card: "ModOrchestrator.CardDefinition",
+        image_path: Optional[str] = None,
+    ) -> bytes:
+        row = bytearray()
+        for text in (
+            f"{metadata.mod_id}:{card.card_id}",
+            card.name,
+            image_path or card.resource_image_path(metadata.mod_id),
+            card.description,
+            card.card_type.upper(),
+            card.card_color.upper(),
+            card.rarity.upper(),
+            card.target.upper(),
+        ):
+            encoded = text.encode("utf-8")
+            row += struct.pack(">i", len(encoded)) + encoded
+        row += struct.pack(
+            ">7i",
+            card.cost,
+            card.base_damage,
+            card.base_block,
+            card.base_magic,
+            card.upgrade_damage,
+            card.upgrade_block,
+            card.upgrade_magic,
+        )
+        return bytes(row)
+
+    def _open_output(self, context: "ModOrchestrator.BuildContext", path: Path) -> "ModOrchestrator.StreamedOutput":
+        output = ModOrchestrator.StreamedOutput(path)
+        if context.memory is not None:
+            output.buffer = bytearray()
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            output.handle = output.partial_path.open("wb")
+        return output
+
+    def _close_output(self, context: "ModOrchestrator.BuildContext", output: "ModOrchestrator.StreamedOutput") -> bool:
+        """Claim a streamed output; it only replaces the previous file when its digest changed."""
+
+        if output.handle is not None:
+            output.handle.close()
+        changed = self._claim_output(context, output.path, output.digest.hexdigest())
+        if output.buffer is not None:
+            if changed:
+                self._store(context, output.path, bytes(output.buffer))
+            return changed
+        if changed:
+            os.replace(output.partial_path, output.path)
+            context.profiler.record_write(output.size)
+        else:
+            output.partial_path.unlink()
+        return changed
+
+    def _abort_output(self, output: "ModOrchestrator.StreamedOutput") -> None:
+        if output.handle is not None:
+            output.handle.close()
+            output.partial_path.unlink(missing_ok=True)
+
+    def _stream_cards(self, context: "ModOrchestrator.BuildContext") -> None:
+        """Consume ``project.card_stream`` once, handling each card as it arrives.
+
+        Every card is validated, appended to each language's ``cards.json``, has its art staged
+        and is rendered in chunks of ``codegen_chunk_size`` (on worker processes with
+        ``parallel_codegen``, at most a few chunks in flight). Only class names, ids and art digests are retained, so
+        memory stays bounded by the chunk size rather than the catalogue size.
+        """
+
+        project = context.project
         metadata = project.metadata
-        cards_package_dir = java_root / Path(f"{metadata.package}.cards".replace(".", "/"))
-        cards_package_dir.mkdir(parents=True, exist_ok=True)
-        for card in project.cards:
-            source = self._render_card_source(project, card)
-            file_path = cards_package_dir / f"{card.class_name()}.java"
-            with file_path.open("w", encoding="utf-8") as handle:
-                handle.write(source)
+        options = context.options
+        if options.card_art_variants or options.pack_card_atlas:
+            raise ModOrchestrator.SpecificationError(
+                "Streamed card sources do not support card art variants or atlas packing"
+            )
+        if options.card_implementation not in (ModOrchestrator.CARDS_AS_CLASSES, ModOrchestrator.CARDS_AS_TABLE):
+            raise ModOrchestrator.SpecificationError(
+                f"Unknown card implementation '{options.card_implementation}'"
+            )
+        table_mode = options.card_implementation == ModOrchestrator.CARDS_AS_TABLE
+        cards_package_dir = context.java_root / Path(f"{metadata.package}.cards".replace(".", "/"))
+        if context.memory is None:
+            cards_package_dir.mkdir(parents=True, exist_ok=True)
+        template = self._template_engine.get_template(ModOrchestrator.CARD_TEMPLATE)
+        translations = {translation.language: translation for translation in project.translations}
+        localizations: List[Tuple[Optional[ModOrchestrator.Translation], ModOrchestrator.StringsEncoder, Any]] = []
+        for language in self._languages(project):
+            encoder = ModOrchestrator.StringsEncoder("cards", options.compact_localization)
+            output = self._open_output(context, self._localization_dir(context, language) / "cards.json")
+            output.write(encoder.header())
+            localizations.append((translations.get(language), encoder, output))
+        chunk_size = max(1, options.codegen_chunk_size)
+        workers = max(1, options.codegen_workers or os.cpu_count() or 1)
+        pool: Optional[ProcessPoolExecutor] = None
+        if options.parallel_codegen and not table_mode:
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        in_flight: List[Any] = []
+        seen_ids: Set[str] = set()
+        seen_classes: Dict[str, str] = {}
+        violations: List[ProjectValidator.Violation] = []
+        staged: Dict[str, str] = {}
+        table_rows = bytearray()
+        chunk: List[ModOrchestrator.CardDefinition] = []
+        chunk_images: Dict[str, str] = {}
+        duplicates = 0
+        started = time.perf_counter()
+
+        def flush() -> None:
+            nonlocal chunk, chunk_images
+            if not chunk:
+                return
+            if pool is None:
+                rendered = ModOrchestrator._render_card_chunk(metadata, chunk, template, chunk_images)
+                self._emit_card_batch(context, cards_package_dir, rendered)
+            else:
+                while len(in_flight) >= workers * 2:
+                    self._emit_card_batch(context, cards_package_dir, in_flight.pop(0).result())
+                in_flight.append(
+                    pool.submit(ModOrchestrator._render_card_chunk, metadata, chunk, template, chunk_images)
+                )
+            chunk, chunk_images = [], {}
+
+        try:
+            for card in project.card_stream or ():
+                # Invalid rows are skipped so the rest of the stream is still checked; the
+                # build fails with every violation once the stream is exhausted.
+                row_violations = self._validator.card_violations(card, seen_ids, seen_classes)
+                if row_violations or violations:
+                    violations.extend(row_violations)
+                    continue
+                class_name = card.class_name()
+                for translation, encoder, output in localizations:
+                    output.write(encoder.item(self._card_strings(card, translation), card.card_id))
+                image_path: Optional[str] = None
+                if card.image_path is not None:
+                    digest = self._source_digest(context, card.image_path)
+                    resource_path = card.resource_image_path(metadata.mod_id)
+                    shared = staged.get(digest)
+                    if options.deduplicate_assets and shared is not None and shared != resource_path:
+                        image_path = shared
+                        duplicates += 1
+                    else:
+                        self._emit_copy(context, card.image_path, context.resource_root / resource_path, digest)
+                        staged.setdefault(digest, resource_path)
+                context.streamed_classes.append(class_name)
+                if table_mode:
+                    table_rows += ModOrchestrator._encode_card_row(metadata, card, image_path)
+                    continue
+                chunk.append(card)
+                if image_path is not None:
+                    chunk_images[card.card_id] = image_path
+                if len(chunk) >= chunk_size:
+                    flush()
+            if violations:
+                report = ProjectValidator.Report(violations, len(seen_ids))
+                raise ModOrchestrator.ValidationError(report.summary(), violations)
+            flush()
+            for future in in_flight:
+                self._emit_card_batch(context, cards_package_dir, future.result())
+            for _, encoder, output in localizations:
+                output.write(encoder.footer())
+        except BaseException:
+            for _, _, output in localizations:
+                self._abort_output(output)
+            raise
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+        for _, _, output in localizations:
+            self._close_output(context, output)
+
+        count = len(context.streamed_classes)
+        if table_mode and count:
+            table = ModOrchestrator._card_table_header(count) + bytes(table_rows)
+            self._write_card_table(context, cards_package_dir, atlas=False, table=table)
+        elapsed = time.perf_counter() - started
+        context.metrics["assets_deduplicated"] = context.metrics.get("assets_deduplicated", 0.0) + duplicates
+        context.metrics["streamed_cards"] = float(count)
+        context.metrics["card_codegen_seconds"] = elapsed
+        self._logger.info("Streamed %d cards in %.3fs", count, elapsed)
+
+    def _emit_card_batch(
+        self,
+        context: "ModOrchestrator.BuildContext",
+        directory: Path,
+        batch: List[Tuple[str, bytes, str]],
+    ) -> None:
+        for file_name, payload, digest in batch:
+            path = directory / file_name
+            if self._claim_output(context, path, digest):
+                self._store(context, path, payload)
+
+    @staticmethod
+    def _render_card_chunk(
+        metadata: "ModOrchestrator.ModMetadata",
+        cards: List["ModOrchestrator.CardDefinition"],
+        template: TemplateEngine.CompiledTemplate,
+        image_paths: Optional[Dict[str, str]] = None,
+        atlas: bool = False,
+    ) -> List[Tuple[str, bytes, str]]:
+        """Render and hash a batch of card classes; runs in codegen worker processes."""
+
+        image_paths = image_paths or {}
+        rendered: List[Tuple[str, bytes, str]] = []
+        for card in cards:
+            image_path = image_paths.get(card.card_id)
+            payload = ModOrchestrator._render_card(metadata, card, template, image_path, atlas).encode("utf-8")
+            rendered.append((f"{card.class_name()}.java", payload, hashlib.sha256(payload).hexdigest()))
+        return rendered
 
     def _render_card_source(
         self,
         project: "ModOrchestrator.ModProject",
         card: "ModOrchestrator.CardDefinition",
     ) -> str:
-        metadata = project.metadata
-        package_name = f"{metadata.package}.cards"
-        image_path = card.resource_image_path(metadata.mod_id)
+        template = self._template_engine.get_template(ModOrchestrator.CARD_TEMPLATE)
+        return ModOrchestrator._render_card(project.metadata, card, template)
+
+    @staticmethod
+    def _render_card(
+        metadata: "ModOrchestrator.ModMetadata",
+        card: "ModOrchestrator.CardDefinition",
+        template: Optional[TemplateEngine.CompiledTemplate] = None,
+        image_path: Optional[str] = None,
+        atlas: bool = False,
+    ) -> str:
         use_statements: List[str] = []
         if card.base_damage > 0:
             use_statements.append(
@@ -322,7 +2390,6 @@ class ModOrchestrator:
             use_statements.append("addToBot(new GainBlockAction(p, p, this.block));")
         if not use_statements:
             use_statements.append("// No primary effect defined in GUI specification.")
-        use_body = textwrap.indent(os.linesep.join(use_statements), " " * 12)
 
         upgrade_statements: List[str] = []
         if card.upgrade_damage:
@@ -333,103 +2400,266 @@ class ModOrchestrator:
             upgrade_statements.append(f"upgradeMagicNumber({card.upgrade_magic});")
         if not upgrade_statements:
             upgrade_statements.append("// No upgrade deltas configured.")
-        upgrade_body = textwrap.indent(os.linesep.join(upgrade_statements), " " * 12)
-
-        source = textwrap.dedent(
-            f"""
-            package {package_name};
 
-            import basemod.abstracts.CustomCard;
-            import com.megacrit.cardcrawl.actions.AbstractGameAction;
-            import com.megacrit.cardcrawl.actions.common.DamageAction;
-            import com.megacrit.cardcrawl.actions.common.GainBlockAction;
-            import com.megacrit.cardcrawl.cards.AbstractCard;
-            import com.megacrit.cardcrawl.cards.DamageInfo;
-            import com.megacrit.cardcrawl.characters.AbstractPlayer;
-            import com.megacrit.cardcrawl.monsters.AbstractMonster;
+        template = template or TEMPLATE_ENGINE.get_template(ModOrchestrator.CARD_TEMPLATE)
+        return template.render(
+            {
+                "package_name": f"{metadata.package}.cards",
+                "class_name": card.class_name(),
+                "mod_id": metadata.mod_id,
+                "card_id": card.card_id,
+                "cost": card.cost,
+                "base_damage": card.base_damage,
+                "base_block": card.base_block,
+                "base_magic": card.base_magic,
+                "name": card.name,
+                "image_path": image_path or card.resource_image_path(metadata.mod_id),
+                "description": card.description,
+                "card_type": card.card_type.upper(),
+                "card_color": card.card_color.upper(),
+                "rarity": card.rarity.upper(),
+                "target": card.target.upper(),
+                "use_body": os.linesep.join(use_statements),
+                "upgrade_body": os.linesep.join(upgrade_statements),
+                "atlas_members": ModOrchestrator._CARD_ATLAS_MEMBERS if atlas else "",
+            }
+        )
 
-            public class {card.class_name()} extends CustomCard {{
-                public static final String ID = "{metadata.mod_id}:{card.card_id}";
-                private static final int COST = {card.cost};
-                private static final int DAMAGE = {card.base_damage};
-                private static final int BLOCK = {card.base_block};
-                private static final int MAGIC = {card.base_magic};
+    def _compile_project(self, context: "ModOrchestrator.BuildContext") -> Path:
+        project = context.project
+        java_root = context.java_root
+        classes_dir = context.classes_dir
+        backend = context.options.compiler_backend
+        jar_path = context.project_root / "build" / f"{project.metadata.mod_id}.jar"
+        if context.memory is not None:
+            self._compile_in_memory(context, jar_path, backend)
+            return jar_path
+        classes_dir.mkdir(parents=True, exist_ok=True)
+        java_files = sorted(java_root.rglob("*.java"))
+        if not java_files:
+            raise ModOrchestrator.BuildError("No Java source files generated; cannot compile mod")
+        javac = self._locate_javac() if backend == JavaCompilerService.SUBPROCESS else ""
+        classpath = self._compose_classpath(project)
+        compiler_identity = javac or f"{backend}:{self._logic.runtime_config.java_home}"
+        context.manifest.toolchain = self._toolchain_fingerprint(compiler_identity, classpath)
 
-                public {card.class_name()}() {{
-                    super(
-                        ID,
-                        "{card.name}",
-                        "{image_path}",
-                        COST,
-                        "{card.description}",
-                        CardType.{card.card_type.upper()},
-                        CardColor.{card.card_color.upper()},
-                        CardRarity.{card.rarity.upper()},
-                        CardTarget.{card.target.upper()}
-                    );
-                    baseDamage = DAMAGE;
-                    baseBlock = BLOCK;
-                    baseMagicNumber = MAGIC;
-                    magicNumber = baseMagicNumber;
-                }}
+        pending = self._select_sources_to_compile(context, java_files)
+        if not pending and not context.changed_outputs and not context.removed_outputs and jar_path.exists():
+            self._logger.info("No changes detected; reusing %s", jar_path)
+            context.manifest.packaging = context.previous_manifest.packaging
+            return jar_path
 
-                @Override
-                public void use(AbstractPlayer p, AbstractMonster m) {{
-{use_body}
-                }}
+        if pending:
+            classpath_entries = [entry for entry in classpath.split(os.pathsep) if entry]
+            if len(pending) < len(java_files):
+                classpath_entries.insert(0, str(classes_dir))
+            if context.options.sharded_compile:
+                self._compile_sharded(context, pending, classpath_entries, backend, javac)
+            else:
+                self._run_compiler(context, pending, classpath_entries, backend, javac)
 
-                @Override
-                public void upgrade() {{
-                    if (!upgraded) {{
-                        upgradeName();
-{upgrade_body}
-                    }}
-                }}
+        manifest_path = classes_dir / "META-INF" / "MANIFEST.MF"
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_bytes(ModOrchestrator.JAR_MANIFEST)
+        entries = [JarWriter.Entry.from_file(JarWriter.MANIFEST_NAME, manifest_path)]
+        entries.extend(
+            entry
+            for entry in JarWriter.directory_entries(context.classes_dir)
+            if entry.name != JarWriter.MANIFEST_NAME
+        )
+        entries.extend(JarWriter.directory_entries(context.resource_root))
+        self._package_jar(context, jar_path, entries)
+        return jar_path
 
-                @Override
-                public AbstractCard makeCopy() {{
-                    return new {card.class_name()}();
-                }}
-            }}
-            """
-        ).strip() + "\n"
-        return source
+    def _compile_in_memory(self, context: "ModOrchestrator.BuildContext", jar_path: Path, backend: str) -> None:
+        """Compile the sources held in ``context.memory`` and package the jar straight from memory."""
 
-    def _compile_project(self, project_root: Path, project: "ModOrchestrator.ModProject") -> Path:
-        java_root = project_root / "src" / "main" / "java"
-        resource_root = project_root / "src" / "main" / "resources"
-        classes_dir = project_root / "build" / "classes"
-        classes_dir.mkdir(parents=True, exist_ok=True)
-        java_files = sorted(str(path) for path in java_root.rglob("*.java"))
-        if not java_files:
+        memory = context.memory if context.memory is not None else {}
+        java_prefix = context.relative(context.java_root) + "/"
+        resource_prefix = context.relative(context.resource_root) + "/"
+        classes_prefix = context.relative(context.classes_dir) + "/"
+        source_texts = {
+            relative[len(java_prefix) :]: payload.decode("utf-8")
+            for relative, payload in sorted(memory.items())
+            if relative.startswith(java_prefix) and relative.endswith(".java") and isinstance(payload, bytes)
+        }
+        if not source_texts:
             raise ModOrchestrator.BuildError("No Java source files generated; cannot compile mod")
-        javac = self._locate_javac()
-        classpath = self._compose_classpath(project)
-        command = [javac, "-encoding", "UTF-8", "-d", str(classes_dir)]
-        if self._supports_release_flag(javac):
-            command.extend(["--release", "8"])
-        if classpath:
-            command.extend(["-cp", classpath])
-        command.extend(java_files)
-        completed = subprocess.run(command, check=False, capture_output=True, text=True)
-        if completed.returncode != 0:
+        javac = self._locate_javac() if backend == JavaCompilerService.SUBPROCESS else ""
+        classpath = self._compose_classpath(context.project)
+        compiler_identity = javac or f"{backend}:{self._logic.runtime_config.java_home}"
+        context.manifest.toolchain = self._toolchain_fingerprint(compiler_identity, classpath)
+        classpath_entries = [entry for entry in classpath.split(os.pathsep) if entry]
+        result = self._run_compiler(context, [], classpath_entries, backend, javac, source_texts)
+        with context.lock:
+            for name, payload in result.classes.items():
+                memory[classes_prefix + name] = payload
+            memory[classes_prefix + JarWriter.MANIFEST_NAME] = ModOrchestrator.JAR_MANIFEST
+
+        entries = [JarWriter.Entry(JarWriter.MANIFEST_NAME, data=ModOrchestrator.JAR_MANIFEST)]
+        for prefix in (classes_prefix, resource_prefix):
+            for relative in sorted(name for name in memory if name.startswith(prefix)):
+                name = relative[len(prefix) :]
+                if name == JarWriter.MANIFEST_NAME and prefix == classes_prefix:
+                    continue
+                payload = memory[relative]
+                if isinstance(payload, Path):
+                    entries.append(JarWriter.Entry.from_file(name, payload))
+                else:
+                    entries.append(JarWriter.Entry(name, data=payload))
+        context.metrics["files_in_memory"] = float(len(memory))
+        self._package_jar(context, jar_path, entries)
+
+    def _package_jar(
+        self,
+        context: "ModOrchestrator.BuildContext",
+        jar_path: Path,
+        entries: List[JarWriter.Entry],
+    ) -> None:
+        """Stream compiled classes and resources into the jar, manifest first as ``JarInputStream`` expects.
+
+        With ``options.incremental_jar`` an existing jar written with the same settings donates
+        the compressed bytes of every entry whose CRC and size did not change. A clean build
+        reuses the jar it parked in ``context.previous_jar`` before removing the project tree.
+        """
+
+        options = context.options
+        packaging = f"jar-v1:level={options.jar_compression_level}"
+        candidate = context.previous_jar or jar_path
+        previous: Optional[Path] = None
+        if options.incremental_jar and context.previous_manifest.packaging == packaging and candidate.exists():
+            previous = candidate
+        try:
+            writer = JarWriter(
+                workers=options.jar_workers,
+                compression_level=options.jar_compression_level,
+                deterministic=options.deterministic_jar,
+            )
+            summary = writer.write(jar_path, entries, previous)
+        except (OSError, JarWriter.JarError) as exc:
+            raise ModOrchestrator.BuildError(f"Unable to package {jar_path.name}: {exc}") from exc
+        context.manifest.packaging = packaging
+        context.metrics["jar_entries"] = float(summary.entries)
+        context.metrics["jar_reused_entries"] = float(summary.reused)
+        context.metrics["jar_bytes"] = float(summary.bytes_out)
+        context.metrics["jar_seconds"] = summary.seconds
+
+    def _run_compiler(
+        self,
+        context: "ModOrchestrator.BuildContext",
+        sources: List[Path],
+        classpath_entries: List[str],
+        backend: str,
+        javac: str,
+        source_texts: Optional[Dict[str, str]] = None,
+    ) -> JavaCompilerService.CompileResult:
+        request = JavaCompilerService.CompileRequest(
+            sources=sources,
+            classpath=classpath_entries,
+            output_dir=None if source_texts else context.classes_dir,
+            javac=javac,
+            source_texts=dict(source_texts or {}),
+            timeout=context.options.compile_timeout or None,
+            cancel_event=context.cancel,
+        )
+        started = time.perf_counter()
+        try:
+            result = self._compiler_service.compile(request, backend)
+        except JavaCompilerService.CompileCancelledError as exc:
+            raise ModOrchestrator.BuildCancelledError(str(exc), exc.timed_out) from exc
+        except (
+            JavaCompilerService.CompilerUnavailableError,
+            ApplicationLogic.ConfigurationError,
+            ApplicationLogic.JPypeUnavailableError,
+        ) as exc:
+            raise ModOrchestrator.BuildError(str(exc)) from exc
+        elapsed = time.perf_counter() - started
+        source_count = len(sources) + len(request.source_texts)
+        context.profiler.record_compile(backend, source_count, elapsed, result.success)
+        self._logger.info("Compiled %d sources with %s in %.3fs", source_count, backend, elapsed)
+        if not result.success:
             raise ModOrchestrator.BuildError(
-                f"javac failed with exit code {completed.returncode}: {completed.stderr.strip()}"
+                f"javac failed with exit code {result.exit_code}: {result.raw_output}",
+                result.diagnostics,
             )
+        return result
 
-        jar_path = project_root / "build" / f"{project.metadata.mod_id}.jar"
-        manifest_content = "Manifest-Version: 1.0\nCreated-By: STSMODDER ModOrchestrator\n"
-        manifest_path = classes_dir / "META-INF" / "MANIFEST.MF"
-        manifest_path.parent.mkdir(parents=True, exist_ok=True)
-        manifest_path.write_text(manifest_content, encoding="utf-8")
-        with zipfile.ZipFile(jar_path, "w") as handle:
-            for file_path in classes_dir.rglob("*"):
-                if file_path.is_file():
-                    handle.write(file_path, file_path.relative_to(classes_dir))
-            for resource_path in resource_root.rglob("*"):
-                if resource_path.is_file():
-                    handle.write(resource_path, resource_path.relative_to(resource_root))
-        return jar_path
+    def _compile_sharded(
+        self,
+        context: "ModOrchestrator.BuildContext",
+        sources: List[Path],
+        classpath_entries: List[str],
+        backend: str,
+        javac: str,
+    ) -> None:
+        """Compile card classes in concurrent batches, then the remaining sources against their output.
+
+        Generated cards reference only game and BaseMod classes plus the helpers generated next
+        to them (``CardAtlas``, ``TableCard``, ``CardTable``). Those helpers compile first, and
+        every shard sees their classes on its classpath, so the shards stay independent. The
+        entry class references every card and therefore compiles last.
+        """
+
+        cards_dir = context.java_root / Path(f"{context.project.metadata.package}.cards".replace(".", "/"))
+        in_cards = [source for source in sources if source.parent == cards_dir]
+        support = [source for source in in_cards if source.name in ModOrchestrator._CARD_SUPPORT_SOURCES]
+        card_sources = [source for source in in_cards if source.name not in ModOrchestrator._CARD_SUPPORT_SOURCES]
+        remaining = [source for source in sources if source.parent != cards_dir]
+        shard_classpath = list(classpath_entries)
+        if str(context.classes_dir) not in shard_classpath:
+            shard_classpath.insert(0, str(context.classes_dir))
+        if support:
+            self._run_compiler(context, support, shard_classpath, backend, javac)
+        shard_size = max(1, context.options.compile_shard_size)
+        shards = [card_sources[index : index + shard_size] for index in range(0, len(card_sources), shard_size)]
+        workers = context.options.compile_workers or os.cpu_count() or 1
+        workers = max(1, min(workers, len(shards)))
+        if shards:
+            self._logger.info(
+                "Compiling %d card classes in %d shards on %d workers", len(card_sources), len(shards), workers
+            )
+        failures: List[ModOrchestrator.BuildError] = []
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stsm-javac") as executor:
+            futures = [
+                executor.submit(self._run_compiler, context, shard, shard_classpath, backend, javac)
+                for shard in shards
+            ]
+            for future in futures:
+                try:
+                    future.result()
+                except ModOrchestrator.BuildError as exc:
+                    failures.append(exc)
+        for failure in failures:
+            if isinstance(failure, ModOrchestrator.BuildCancelledError):
+                raise failure
+        if failures:
+            diagnostics = [diagnostic for failure in failures for diagnostic in failure.diagnostics]
+            message = "\n".join(str(failure) for failure in failures)
+            raise ModOrchestrator.BuildError(message, diagnostics)
+        if remaining:
+            self._run_compiler(context, remaining, shard_classpath, backend, javac)
+
+    def _select_sources_to_compile(
+        self, context: "ModOrchestrator.BuildContext", java_files: List[Path]
+    ) -> List[Path]:
+        """Return the sources javac must see; everything unless an incremental build can reuse classes."""
+
+        if not context.options.incremental or context.previous_manifest.toolchain != context.manifest.toolchain:
+            return java_files
+        pending: List[Path] = []
+        for source in java_files:
+            relative_source = source.relative_to(context.java_root)
+            class_path = context.classes_dir / relative_source.with_suffix(".class")
+            if context.relative(source) in context.changed_outputs or not class_path.exists():
+                pending.append(source)
+        return pending
+
+    def _toolchain_fingerprint(self, compiler_identity: str, classpath: str) -> str:
+        digest = hashlib.sha256(compiler_identity.encode("utf-8"))
+        for component in filter(None, classpath.split(os.pathsep)):
+            stat = Path(component).stat()
+            digest.update(f"{component}|{stat.st_size}|{stat.st_mtime_ns}".encode("utf-8"))
+        return digest.hexdigest()
 
     def _compose_classpath(self, project: "ModOrchestrator.ModProject") -> str:
         components: List[str] = []
@@ -470,18 +2700,6 @@ class ModOrchestrator:
             )
         return discovered
 
-    def _supports_release_flag(self, javac_path: str) -> bool:
-        try:
-            completed = subprocess.run(
-                [javac_path, "--help"],
-                check=False,
-                capture_output=True,
-                text=True,
-            )
-        except FileNotFoundError as exc:
-            raise ModOrchestrator.BuildError("javac binary not executable") from exc
-        return "--release" in completed.stdout
-
 
 _PLUGIN_MANAGER = PluginManager.get_instance()
 MOD_ORCHESTRATOR = ModOrchestrator(APPLICATION_LOGIC, _PLUGIN_MANAGER)
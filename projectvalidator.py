@@ -0,0 +1,313 @@
+"""Single-pass validation of mod projects against precompiled rules."""
+from __future__ import annotations
+
+import logging
+import os
+import re
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple
+
+from plugin_manager import PluginManager
+
+
+class ProjectValidator:
+    """Checks metadata, cards, keywords and assets in one pass and reports every violation.
+
+    The rules are compiled once per validator: identifier patterns become compiled regular
+    expressions and the game's enums become frozensets, so checking a card costs a handful
+    of lookups. File existence is resolved with one directory listing per parent directory
+    instead of one ``stat`` per file. Projects are read duck-typed, so the validator does not
+    depend on the orchestrator that uses it.
+    """
+
+    CARD_TYPES = frozenset({"ATTACK", "SKILL", "POWER", "STATUS", "CURSE"})
+    CARD_RARITIES = frozenset({"BASIC", "SPECIAL", "COMMON", "UNCOMMON", "RARE", "CURSE"})
+    CARD_TARGETS = frozenset({"ENEMY", "ALL_ENEMY", "SELF", "NONE", "SELF_AND_ENEMY", "ALL"})
+    # Unplayable cards use -2 and X-cost cards -1.
+    MIN_COST = -2
+
+    _CLASS_NAME_SEPARATOR = re.compile(r"[^0-9A-Za-z]+")
+    # Language directories are the lower-cased ``Settings.GameLanguage`` names (eng, zhs, kor, …).
+    _LANGUAGE = re.compile(r"[a-z]{3}")
+    CARD_STRING_KEYS = frozenset({"NAME", "DESCRIPTION", "UPGRADE_DESCRIPTION"})
+    KEYWORD_STRING_KEYS = frozenset({"PROPER_NAME", "NAMES", "DESCRIPTION"})
+
+    @dataclass(frozen=True)
+    class Violation:
+        """One failed rule, located by subject (``metadata``, ``card 'Strike'``, …) and field."""
+
+        subject: str
+        field: str
+        message: str
+
+        def __str__(self) -> str:
+            return f"{self.subject}.{self.field}: {self.message}"
+
+    @dataclass
+    class Report:
+        """Every violation found in a project, in the order the project lists its items."""
+
+        violations: List["ProjectValidator.Violation"] = field(default_factory=list)
+        items_checked: int = 0
+
+        @property
+        def ok(self) -> bool:
+            return not self.violations
+
+        def summary(self, limit: int = 20) -> str:
+            lines = [f"Project has {len(self.violations)} validation error(s):"]
+            lines.extend(f"  {violation}" for violation in self.violations[:limit])
+            if len(self.violations) > limit:
+                lines.append(f"  … and {len(self.violations) - limit} more")
+            return "\n".join(lines)
+
+    Rule = Tuple[str, Callable[[Any], bool], str]
+
+    def __init__(self) -> None:
+        mod_id = re.compile(r"[a-z][a-z0-9_.-]*")
+        package = re.compile(r"[A-Za-z_][0-9A-Za-z_.]*")
+        identifier = re.compile(r"[A-Za-z_][0-9A-Za-z_]*")
+        alphanumeric = re.compile(r"[0-9A-Za-z]")
+        whitespace = re.compile(r"\s")
+        self._metadata_rules: List[ProjectValidator.Rule] = [
+            (
+                "mod_id",
+                lambda value: bool(mod_id.fullmatch(value)),
+                "mod_id must start with a lowercase letter and contain only lowercase letters, numbers, '_', '-' or '.'",
+            ),
+            (
+                "package",
+                lambda value: bool(package.fullmatch(value)),
+                "package name must be a valid Java package identifier",
+            ),
+            (
+                "entry_class",
+                lambda value: bool(identifier.fullmatch(value)),
+                "entry class must be a valid Java identifier",
+            ),
+        ]
+        self._card_rules: List[ProjectValidator.Rule] = [
+            ("card_id", lambda value: bool(alphanumeric.search(value)), "Card ID must contain alphanumeric characters"),
+            ("name", lambda value: bool(value.strip()), "card name must not be empty"),
+            (
+                "card_type",
+                lambda value: value.upper() in ProjectValidator.CARD_TYPES,
+                f"must be one of {', '.join(sorted(ProjectValidator.CARD_TYPES))}",
+            ),
+            (
+                "rarity",
+                lambda value: value.upper() in ProjectValidator.CARD_RARITIES,
+                f"must be one of {', '.join(sorted(ProjectValidator.CARD_RARITIES))}",
+            ),
+            (
+                "target",
+                lambda value: value.upper() in ProjectValidator.CARD_TARGETS,
+                f"must be one of {', '.join(sorted(ProjectValidator.CARD_TARGETS))}",
+            ),
+            ("card_color", lambda value: bool(identifier.fullmatch(value)), "card colour must be a Java identifier"),
+            (
+                "cost",
+                lambda value: ProjectValidator._is_int(value) and value >= ProjectValidator.MIN_COST,
+                f"cost must be an integer of at least {ProjectValidator.MIN_COST}",
+            ),
+        ]
+        for stat in ("base_damage", "base_block", "base_magic"):
+            self._card_rules.append(
+                (stat, lambda value: ProjectValidator._is_int(value) and value >= 0, "must be a non-negative integer")
+            )
+        for stat in ("upgrade_damage", "upgrade_block", "upgrade_magic"):
+            self._card_rules.append((stat, ProjectValidator._is_int, "must be an integer"))
+        self._keyword_rules: List[ProjectValidator.Rule] = [
+            ("proper_name", lambda value: bool(value.strip()), "keyword proper name must not be empty"),
+            ("names", lambda value: bool(value), "keyword needs at least one name"),
+            (
+                "names",
+                lambda value: all(name and not whitespace.search(name) for name in value),
+                "keyword names must be non-empty and contain no whitespace",
+            ),
+        ]
+        self._logger = logging.getLogger("stsm.project_validator")
+        if not self._logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter("[%(asctime)s] %(levelname)s %(name)s: %(message)s")
+            handler.setFormatter(formatter)
+            self._logger.addHandler(handler)
+        self._logger.setLevel(logging.INFO)
+
+    def validate(self, project: Any) -> "ProjectValidator.Report":
+        """Check every rule against ``project`` and return all violations found."""
+
+        started = time.perf_counter()
+        report = ProjectValidator.Report()
+        violations = report.violations
+        violations.extend(self._apply(self._metadata_rules, project.metadata, "metadata"))
+        if getattr(project, "card_stream", None) is not None and project.cards:
+            message = "A project supplies either cards or a card_stream, not both"
+            violations.append(ProjectValidator.Violation("project", "cards", message))
+
+        card_ids: Set[str] = set()
+        class_names: Dict[str, str] = {}
+        images: List[Tuple[str, Path]] = []
+        for card in project.cards:
+            violations.extend(self.card_violations(card, card_ids, class_names, check_image=False))
+            if card.image_path is not None:
+                images.append((f"card '{card.card_id}'", Path(card.image_path)))
+            report.items_checked += 1
+
+        keyword_names: Dict[str, str] = {}
+        for keyword in project.keywords:
+            subject = f"keyword '{keyword.proper_name}'"
+            violations.extend(self._apply(self._keyword_rules, keyword, subject))
+            for name in keyword.names:
+                owner = keyword_names.setdefault(name.lower(), keyword.proper_name)
+                if owner != keyword.proper_name:
+                    message = f"name '{name}' is already used by keyword '{owner}'"
+                    violations.append(ProjectValidator.Violation(subject, "names", message))
+            report.items_checked += 1
+
+        languages: Set[str] = set()
+        keyword_proper_names = {keyword.proper_name for keyword in project.keywords}
+        for translation in getattr(project, "translations", ()):
+            subject = f"translation '{translation.language}'"
+            if not ProjectValidator._LANGUAGE.fullmatch(translation.language):
+                message = "language must be a three-letter game language code such as 'zhs'"
+                violations.append(ProjectValidator.Violation(subject, "language", message))
+            elif translation.language in languages:
+                violations.append(ProjectValidator.Violation(subject, "language", "language is translated twice"))
+            languages.add(translation.language)
+            for field_name, entries, known, keys in (
+                ("cards", translation.cards, card_ids, ProjectValidator.CARD_STRING_KEYS),
+                ("keywords", translation.keywords, keyword_proper_names, ProjectValidator.KEYWORD_STRING_KEYS),
+            ):
+                violations.extend(self._translation_violations(subject, field_name, entries, known, keys))
+            report.items_checked += 1
+
+        targets: Dict[str, Path] = {}
+        for asset in project.assets:
+            subject = f"asset '{asset.source}'"
+            relative = Path(asset.relative_path)
+            if relative.is_absolute() or ".." in relative.parts or not relative.parts:
+                message = "must be a path inside the resources directory"
+                violations.append(ProjectValidator.Violation(subject, "relative_path", message))
+            elif targets.setdefault(relative.as_posix(), asset.source) != asset.source:
+                violations.append(
+                    ProjectValidator.Violation(subject, "relative_path", f"'{asset.relative_path}' is mapped twice")
+                )
+            images.append((subject, Path(asset.source)))
+            report.items_checked += 1
+
+        missing = self.missing_files(path for _, path in images)
+        for subject, path in images:
+            if path in missing:
+                field_name = "source" if subject.startswith("asset") else "image_path"
+                violations.append(ProjectValidator.Violation(subject, field_name, f"'{path}' does not exist"))
+        self._logger.info(
+            "Validated %d items in %.3fs: %d violation(s)",
+            report.items_checked,
+            time.perf_counter() - started,
+            len(violations),
+        )
+        return report
+
+    def card_violations(
+        self,
+        card: Any,
+        card_ids: Set[str],
+        class_names: Dict[str, str],
+        check_image: bool = True,
+    ) -> List["ProjectValidator.Violation"]:
+        """Check one card, recording its id and class name in the caller's running sets.
+
+        Used per row by streaming builds; ``validate`` checks images for all cards at once.
+        """
+
+        subject = f"card '{card.card_id}'"
+        violations = self._apply(self._card_rules, card, subject)
+        if card.card_id in card_ids:
+            message = f"Duplicate card id '{card.card_id}' detected"
+            violations.append(ProjectValidator.Violation(subject, "card_id", message))
+        card_ids.add(card.card_id)
+        if not any(violation.field == "card_id" for violation in violations):
+            class_name = self.class_name(card.card_id)
+            owner = class_names.setdefault(class_name, card.card_id)
+            if owner != card.card_id:
+                violations.append(
+                    ProjectValidator.Violation(
+                        subject, "card_id", f"generates class {class_name}, which card '{owner}' already uses"
+                    )
+                )
+        if check_image and card.image_path is not None and not Path(card.image_path).exists():
+            violations.append(ProjectValidator.Violation(subject, "image_path", f"'{card.image_path}' does not exist"))
+        return violations
+
+    @staticmethod
+    def class_name(card_id: str) -> str:
+        """Mirror ``CardDefinition.class_name`` without raising."""
+
+        segments = ProjectValidator._CLASS_NAME_SEPARATOR.split(card_id)
+        return "".join(segment[:1].upper() + segment[1:] for segment in segments if segment) + "Card"
+
+    @staticmethod
+    def missing_files(paths: Iterable[Path]) -> Set[Path]:
+        """Return the given paths that are not existing files, listing each parent directory once."""
+
+        by_directory: Dict[Path, List[Path]] = defaultdict(list)
+        for path in paths:
+            by_directory[path.parent].append(path)
+        missing: Set[Path] = set()
+        for directory, members in by_directory.items():
+            try:
+                with os.scandir(directory) as entries:
+                    files = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                missing.update(members)
+                continue
+            for path in members:
+                if path.name not in files and not (path.name in ("", ".", "..") and path.is_file()):
+                    missing.add(path)
+        return missing
+
+    @staticmethod
+    def _translation_violations(
+        subject: str,
+        field_name: str,
+        entries: Dict[str, Dict[str, Any]],
+        known: Set[str],
+        keys: frozenset,
+    ) -> List["ProjectValidator.Violation"]:
+        # Streamed card ids are unknown up front; an empty ``known`` only skips the id check.
+        violations: List[ProjectValidator.Violation] = []
+        for name, strings in entries.items():
+            if known and name not in known:
+                violations.append(ProjectValidator.Violation(subject, field_name, f"'{name}' is not defined"))
+            unknown = sorted(set(strings) - keys)
+            if unknown:
+                message = f"'{name}' has unknown string keys {', '.join(unknown)}"
+                violations.append(ProjectValidator.Violation(subject, field_name, message))
+        return violations
+
+    @staticmethod
+    def _is_int(value: Any) -> bool:
+        return isinstance(value, int) and not isinstance(value, bool)
+
+    @staticmethod
+    def _apply(rules: List["ProjectValidator.Rule"], item: Any, subject: str) -> List["ProjectValidator.Violation"]:
+        violations: List[ProjectValidator.Violation] = []
+        for field_name, check, message in rules:
+            value = getattr(item, field_name)
+            try:
+                passed = check(value)
+            except (AttributeError, TypeError):
+                passed = False
+            if not passed:
+                violations.append(ProjectValidator.Violation(subject, field_name, message))
+        return violations
+
+
+PluginManager.get_instance().register_module(__name__, sys.modules[__name__])
+
+__all__ = ["ProjectValidator"]
@@ -0,0 +1,352 @@
+"""Benchmark the mod build pipeline on synthetic projects and compare against stored baselines."""
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import shutil
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from buildprofiler import BuildProfiler  # noqa: E402
+from logic import APPLICATION_LOGIC  # noqa: E402
+from modorchestrator import MOD_ORCHESTRATOR, ModOrchestrator  # noqa: E402
+from scripts.create_fake_basemod_jar import create_stub_dependencies  # noqa: E402
+
+BASELINE_FORMAT = 1
+DEFAULT_SCALES = "10,100,1000,10000,50000"
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One synthetic project shape."""
+
+    cards: int
+    images: bool = False
+    keywords: bool = False
+
+    @property
+    def name(self) -> str:
+        flags = ("+images" if self.images else "") + ("+keywords" if self.keywords else "")
+        return f"cards={self.cards}{flags}"
+
+
+def _solid_png(width: int, height: int, rgb: tuple) -> bytes:
+    """Encode a single-colour RGB PNG without needing Pillow."""
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+    row = b"\x00" + bytes(rgb) * width
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(row * height, 6))
+        + chunk(b"IEND", b"")
+    )
+
+
+def synthetic_project(scenario: Scenario, asset_dir: Path) -> ModOrchestrator.ModProject:
+    """Create a project of ``scenario.cards`` attack and skill cards, optionally with art and keywords."""
+
+    metadata = ModOrchestrator.ModMetadata(
+        mod_id="benchmod",
+        name="Benchmark Mod",
+        author="STSMODDER",
+        version="1.0.0",
+        description="Synthetic build benchmark",
+        package="com.stsmodder.bench",
+        entry_class="BenchMod",
+    )
+    cards: List[ModOrchestrator.CardDefinition] = []
+    for index in range(scenario.cards):
+        image_path: Optional[Path] = None
+        if scenario.images:
+            # Every fourth card reuses shared art so deduplication is exercised as well.
+            variant = index if index % 4 else 0
+            image_path = asset_dir / f"card{variant}.png"
+            if not image_path.exists():
+                image_path.parent.mkdir(parents=True, exist_ok=True)
+                colour = (variant % 256, (variant // 256) % 256, (variant // 65536) % 256)
+                image_path.write_bytes(_solid_png(250, 190, colour))
+        cards.append(
+            ModOrchestrator.CardDefinition(
+                card_id=f"BenchCard{index}",
+                name=f"Bench Card {index}",
+                description="Deal !D! damage. Gain !B! Block.",
+                upgrade_description="Deal !D! damage. Gain !B! Block.",
+                card_type="ATTACK" if index % 2 else "SKILL",
+                card_color="COLORLESS",
+                rarity="COMMON",
+                target="ENEMY",
+                cost=index % 4,
+                base_damage=6 if index % 2 else 0,
+                base_block=5 if index % 3 else 0,
+                upgrade_damage=3 if index % 2 else 0,
+                upgrade_block=2 if index % 3 else 0,
+                image_path=image_path,
+            )
+        )
+    keywords: List[ModOrchestrator.KeywordDefinition] = []
+    if scenario.keywords:
+        keywords = [
+            ModOrchestrator.KeywordDefinition(
+                proper_name=f"Bench{index}",
+                names=[f"bench{index}"],
+                description=f"Benchmark keyword {index}.",
+            )
+            for index in range(max(1, scenario.cards // 100))
+        ]
+    return ModOrchestrator.ModProject(metadata=metadata, cards=cards, keywords=keywords)
+
+
+def _peak_rss_mb(children: bool = False) -> float:
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _generate_only(
+    project: ModOrchestrator.ModProject,
+    destination: Path,
+    options: ModOrchestrator.BuildOptions,
+) -> BuildProfiler.Report:
+    """Run every build phase except compilation and packaging."""
+
+    project_root = destination / project.metadata.mod_id
+    if project_root.exists():
+        shutil.rmtree(project_root)
+    profiler = BuildProfiler()
+    context = ModOrchestrator.BuildContext(
+        project=project,
+        project_root=project_root,
+        options=options,
+        previous_manifest=ModOrchestrator.BuildManifest(),
+        profiler=profiler,
+    )
+    if options.in_memory:
+        context.memory = {}
+    graph = MOD_ORCHESTRATOR._build_graph.copy()  # noqa: SLF001
+    graph.remove(ModOrchestrator.PHASE_COMPILE)
+    graph.run(context, options.phase_workers, instrument=profiler.phase)
+    return profiler.report(metrics=context.metrics)
+
+
+def _run_scenario(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Worker entry point; runs in a fresh process so peak memory belongs to one scenario."""
+
+    scenario = Scenario(**payload["scenario"])
+    work_dir = Path(payload["work_dir"])
+    dependencies = payload["dependencies"]
+    if dependencies:
+        # Only this worker process sees the stub configuration; nothing is saved to disk.
+        config = APPLICATION_LOGIC.runtime_config
+        config.modthespire_jar = dependencies["modthespire"]
+        config.basemod_path = dependencies["basemod"]
+        config.desktop_jar_path = dependencies["desktop"]
+        config.stslib_path = ""
+        config.actlikeit_path = ""
+        if payload["java_home"]:
+            config.java_home = payload["java_home"]
+    options = ModOrchestrator.BuildOptions(**payload["options"])
+    started = time.perf_counter()
+    project = synthetic_project(scenario, work_dir / "art" / scenario.name)
+    project_seconds = time.perf_counter() - started
+    destination = work_dir / "build" / scenario.name
+    reports: List[BuildProfiler.Report] = []
+    for _ in range(payload["repeat"]):
+        if payload["generate_only"]:
+            reports.append(_generate_only(project, destination, options))
+        else:
+            reports.append(MOD_ORCHESTRATOR.build_project(project, destination, clean=True, options=options).report)
+    best = min(reports, key=lambda report: report.total_seconds)
+    phases = {record.name: round(record.seconds, 6) for record in best.phases}
+    return {
+        "scenario": scenario.name,
+        "total_seconds": round(best.total_seconds, 6),
+        "project_seconds": round(project_seconds, 6),
+        "phases": phases,
+        "compile_calls": len(best.compiler_calls),
+        "files_written": best.files_written,
+        "bytes_written": best.bytes_written,
+        "jar_bytes": best.jar_bytes,
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "peak_child_rss_mb": round(_peak_rss_mb(children=True), 1),
+    }
+
+
+def run_benchmark(
+    scenarios: List[Scenario],
+    work_dir: Path,
+    options: Dict[str, Any],
+    repeat: int = 1,
+    generate_only: bool = False,
+    java_home: Optional[str] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Build each scenario in its own process and return its results keyed by scenario name."""
+
+    dependencies: Dict[str, str] = {}
+    if not generate_only:
+        stubs = create_stub_dependencies(work_dir / "stubs", java_home)
+        dependencies = {name: str(path) for name, path in stubs.items()}
+    results: Dict[str, Dict[str, Any]] = {}
+    for scenario in scenarios:
+        payload = {
+            "scenario": asdict(scenario),
+            "work_dir": str(work_dir),
+            "dependencies": dependencies,
+            "java_home": java_home or "",
+            "options": options,
+            "repeat": max(1, repeat),
+            "generate_only": generate_only,
+        }
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            results[scenario.name] = pool.submit(_run_scenario, payload).result()
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float,
+    min_seconds: float,
+    min_memory_mb: float,
+) -> List[str]:
+    """Describe every timing or memory figure that exceeds its baseline by more than ``threshold``."""
+
+    regressions: List[str] = []
+
+    def check(label: str, current: float, previous: float, floor: float, unit: str) -> None:
+        if previous <= 0 or current - previous <= floor:
+            return
+        if current > previous * (1 + threshold):
+            change = (current / previous - 1) * 100
+            regressions.append(f"{label}: {previous:.3f}{unit} -> {current:.3f}{unit} (+{change:.0f}%)")
+
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        check(f"{name} total", result["total_seconds"], previous.get("total_seconds", 0.0), min_seconds, "s")
+        for phase, seconds in result["phases"].items():
+            check(f"{name} {phase}", seconds, previous.get("phases", {}).get(phase, 0.0), min_seconds, "s")
+        check(f"{name} peak memory", result["peak_rss_mb"], previous.get("peak_rss_mb", 0.0), min_memory_mb, "MB")
+    return regressions
+
+
+def _option_value(text: str) -> Any:
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return text
+
+
+def _parse_args(argv: Optional[list] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark mod builds of synthetic projects")
+    parser.add_argument("--scales", default=DEFAULT_SCALES, help="Comma-separated card counts")
+    parser.add_argument("--images", action="store_true", help="Give cards generated art")
+    parser.add_argument("--keywords", action="store_true", help="Add one keyword per hundred cards")
+    parser.add_argument("--matrix", action="store_true", help="Run every scale with and without images and keywords")
+    parser.add_argument("--repeat", type=int, default=1, help="Builds per scenario; the fastest is reported")
+    parser.add_argument(
+        "--option",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="BuildOptions field to set, e.g. --option sharded_compile=true",
+    )
+    parser.add_argument("--generate-only", action="store_true", help="Skip compilation and packaging")
+    parser.add_argument("--work-dir", type=Path, default=None, help="Directory for stubs, art and builds")
+    parser.add_argument("--java-home", type=str, default=None, help="Optional JAVA_HOME override")
+    parser.add_argument("--baseline", type=Path, default=None, help="Baseline JSON to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="Write the results into --baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative slowdown (0.25 = 25%%)")
+    parser.add_argument("--min-seconds", type=float, default=0.05, help="Ignore timing changes below this")
+    parser.add_argument("--min-memory-mb", type=float, default=32.0, help="Ignore memory changes below this")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    return parser.parse_args(argv)
+
+
+def _scenarios(args: argparse.Namespace) -> List[Scenario]:
+    scales = [int(value) for value in args.scales.split(",") if value.strip()]
+    if args.matrix:
+        shapes = [(False, False), (True, False), (False, True), (True, True)]
+    else:
+        shapes = [(args.images, args.keywords)]
+    return [Scenario(cards, images, keywords) for cards in scales for images, keywords in shapes]
+
+
+def _print_results(results: Dict[str, Dict[str, Any]]) -> None:
+    for name, result in results.items():
+        print(
+            f"{name}: {result['total_seconds']:.3f}s total, {result['files_written']} files, "
+            f"jar {result['jar_bytes']} bytes, peak {result['peak_rss_mb']:.0f} MB "
+            f"(compiler {result['peak_child_rss_mb']:.0f} MB)"
+        )
+        for phase, seconds in result["phases"].items():
+            print(f"    {phase:<14} {seconds:9.3f}s")
+
+
+def main(argv: Optional[list] = None) -> int:
+    args = _parse_args(argv)
+    known = {option.name for option in fields(ModOrchestrator.BuildOptions)}
+    options: Dict[str, Any] = {}
+    for assignment in args.option:
+        name, _, value = assignment.partition("=")
+        if name not in known:
+            print(f"error: unknown build option '{name}'", file=sys.stderr)
+            return 2
+        options[name] = _option_value(value)
+
+    with tempfile.TemporaryDirectory(prefix="stsm-bench-") as scratch:
+        work_dir = args.work_dir or Path(scratch)
+        try:
+            results = run_benchmark(
+                _scenarios(args), work_dir, options, args.repeat, args.generate_only, args.java_home
+            )
+        except (ModOrchestrator.BuildError, RuntimeError, OSError) as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return 2
+
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+    else:
+        _print_results(results)
+
+    if args.baseline is None:
+        return 0
+    stored: Dict[str, Any] = {"format": BASELINE_FORMAT, "scenarios": {}}
+    if args.baseline.exists():
+        stored = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if args.update_baseline:
+        stored["scenarios"].update(results)
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"Updated baseline {args.baseline}")
+        return 0
+    regressions = compare(results, stored["scenarios"], args.threshold, args.min_seconds, args.min_memory_mb)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+__all__ = ["Scenario", "compare", "main", "run_benchmark", "synthetic_project"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
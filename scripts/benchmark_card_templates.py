@@ -0,0 +1,111 @@
+"""Microbenchmark for the precompiled card template used by ModOrchestrator."""
+from __future__ import annotations
+
+import argparse
+import sys
+import textwrap
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from modorchestrator import MOD_ORCHESTRATOR, ModOrchestrator  # noqa: E402
+from templateengine import TemplateEngine  # noqa: E402
+
+
+def _synthetic_cards(count: int) -> List[ModOrchestrator.CardDefinition]:
+    cards: List[ModOrchestrator.CardDefinition] = []
+    for index in range(count):
+        cards.append(
+            ModOrchestrator.CardDefinition(
+                card_id=f"BenchCard{index}",
+                name=f"Bench Card {index}",
+                description="Deal !D! damage. Gain !B! Block.",
+                upgrade_description="Deal !D! damage. Gain !B! Block.",
+                card_type="ATTACK" if index % 2 else "SKILL",
+                card_color="COLORLESS",
+                rarity="COMMON",
+                target="ENEMY",
+                cost=index % 4,
+                base_damage=6 if index % 2 else 0,
+                base_block=5 if index % 3 else 0,
+                upgrade_damage=3 if index % 2 else 0,
+                upgrade_block=2 if index % 3 else 0,
+            )
+        )
+    return cards
+
+
+def _best_of(repeat: int, action: Callable[[], None]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run_benchmark(card_count: int, repeat: int) -> Dict[str, float]:
+    """Return the best per-card render cost in microseconds for each measured stage."""
+
+    metadata = ModOrchestrator.ModMetadata(
+        mod_id="benchmod",
+        name="Benchmark Mod",
+        author="STSMODDER",
+        version="1.0.0",
+        description="Template benchmark",
+        package="com.stsmodder.bench",
+        entry_class="BenchMod",
+    )
+    project = ModOrchestrator.ModProject(metadata=metadata, cards=_synthetic_cards(card_count))
+    template = MOD_ORCHESTRATOR._template_engine.get_template(ModOrchestrator.CARD_TEMPLATE)  # noqa: SLF001
+    source_text = ModOrchestrator._CARD_TEMPLATE_SOURCE  # noqa: SLF001
+    sample = ModOrchestrator._render_card(metadata, project.cards[0], template)  # noqa: SLF001
+
+    def render_cards() -> None:
+        for card in project.cards:
+            ModOrchestrator._render_card(metadata, card, template)  # noqa: SLF001
+
+    def dedent_per_card() -> None:
+        for _ in project.cards:
+            textwrap.dedent(source_text)
+
+    def compile_per_card() -> None:
+        for _ in project.cards:
+            TemplateEngine.compile(source_text)
+
+    results = {
+        "render_us_per_card": _best_of(repeat, render_cards),
+        "dedent_us_per_card": _best_of(repeat, dedent_per_card),
+        "parse_us_per_card": _best_of(repeat, compile_per_card),
+    }
+    scaled = {name: value / card_count * 1_000_000 for name, value in results.items()}
+    scaled["source_bytes"] = float(len(sample.encode("utf-8")))
+    return scaled
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure the per-card cost of rendering card classes")
+    parser.add_argument("--cards", type=int, default=10000, help="Number of synthetic cards to render")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions; the fastest run is reported")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    results = run_benchmark(args.cards, args.repeat)
+    print(f"cards rendered per run:        {args.cards}")
+    print(f"rendered source size:          {int(results['source_bytes'])} bytes")
+    print(f"precompiled render:            {results['render_us_per_card']:.2f} us/card")
+    print(f"template dedent (avoided):     {results['dedent_us_per_card']:.2f} us/card")
+    print(f"template parse (avoided):      {results['parse_us_per_card']:.2f} us/card")
+
+
+__all__ = ["run_benchmark", "main"]
+
+
+if __name__ == "__main__":
+    main()
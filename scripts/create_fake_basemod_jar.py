@@ -0,0 +1,161 @@
+"""Utility for generating offline BaseMod and ModTheSpire stand-in jars for builds and benchmarks."""
+from __future__ import annotations
+
+import argparse
+import sys
+import textwrap
+from pathlib import Path
+from typing import Dict, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.create_fake_desktop_jar import compile_stub_jar, create_fake_desktop_jar  # noqa: E402
+
+BASEMOD_SOURCES: Dict[str, str] = {
+    "basemod/BaseMod.java": textwrap.dedent(
+        """
+        package basemod;
+
+        import com.megacrit.cardcrawl.cards.AbstractCard;
+
+        public class BaseMod {
+            public static void subscribe(Object subscriber) {
+            }
+
+            public static void addCard(AbstractCard card) {
+            }
+
+            public static void addKeyword(String proper, String[] names, String description) {
+            }
+
+            public static void loadCustomStringsFile(Class<?> stringType, String filepath) {
+            }
+        }
+        """
+    ),
+    "basemod/ReflectionHacks.java": textwrap.dedent(
+        """
+        package basemod;
+
+        public class ReflectionHacks {
+            public static void setPrivateInherited(Object obj, Class<?> objClass, String field, Object newValue) {
+            }
+        }
+        """
+    ),
+    "basemod/abstracts/CustomCard.java": textwrap.dedent(
+        """
+        package basemod.abstracts;
+
+        import com.megacrit.cardcrawl.cards.AbstractCard;
+
+        public abstract class CustomCard extends AbstractCard {
+            public CustomCard(
+                String id,
+                String name,
+                String img,
+                int cost,
+                String rawDescription,
+                CardType type,
+                CardColor color,
+                CardRarity rarity,
+                CardTarget target
+            ) {
+                super(id, name, img, cost, rawDescription, type, color, rarity, target);
+                loadCardImage(img);
+            }
+
+            public void loadCardImage(String img) {
+            }
+        }
+        """
+    ),
+    "basemod/interfaces/EditCardsSubscriber.java": textwrap.dedent(
+        """
+        package basemod.interfaces;
+
+        public interface EditCardsSubscriber {
+            void receiveEditCards();
+        }
+        """
+    ),
+    "basemod/interfaces/EditStringsSubscriber.java": textwrap.dedent(
+        """
+        package basemod.interfaces;
+
+        public interface EditStringsSubscriber {
+            void receiveEditStrings();
+        }
+        """
+    ),
+    "basemod/interfaces/PostInitializeSubscriber.java": textwrap.dedent(
+        """
+        package basemod.interfaces;
+
+        public interface PostInitializeSubscriber {
+            void receivePostInitialize();
+        }
+        """
+    ),
+}
+
+MODTHESPIRE_SOURCES: Dict[str, str] = {
+    "com/evacipated/cardcrawl/modthespire/lib/SpireInitializer.java": textwrap.dedent(
+        """
+        package com.evacipated.cardcrawl.modthespire.lib;
+
+        import java.lang.annotation.ElementType;
+        import java.lang.annotation.Retention;
+        import java.lang.annotation.RetentionPolicy;
+        import java.lang.annotation.Target;
+
+        @Retention(RetentionPolicy.RUNTIME)
+        @Target(ElementType.TYPE)
+        public @interface SpireInitializer {
+        }
+        """
+    ),
+}
+
+
+def create_stub_dependencies(output_dir: Path, java_home: Optional[str] = None) -> Dict[str, Path]:
+    """Write ``desktop-1.0.jar``, ``BaseMod.jar`` and ``ModTheSpire.jar`` stand-ins, reusing existing ones.
+
+    The stubs only declare the members generated mods reference, which is enough to compile
+    and package a mod without downloading the real jars.
+    """
+
+    output_dir = Path(output_dir).expanduser().resolve()
+    desktop = output_dir / "desktop-1.0.jar"
+    if not desktop.exists():
+        create_fake_desktop_jar(desktop, java_home)
+    basemod = output_dir / "BaseMod.jar"
+    if not basemod.exists():
+        compile_stub_jar(BASEMOD_SOURCES, basemod, java_home, classpath=[desktop])
+    modthespire = output_dir / "ModTheSpire.jar"
+    if not modthespire.exists():
+        compile_stub_jar(MODTHESPIRE_SOURCES, modthespire, java_home)
+    return {"desktop": desktop, "basemod": basemod, "modthespire": modthespire}
+
+
+def _parse_args(argv: Optional[list] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate stand-in desktop, BaseMod and ModTheSpire jars")
+    parser.add_argument("output_dir", type=Path, help="Directory receiving the stub jars")
+    parser.add_argument("--java-home", type=str, default=None, help="Optional JAVA_HOME override")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list] = None) -> int:
+    args = _parse_args(argv)
+    for name, path in create_stub_dependencies(args.output_dir, args.java_home).items():
+        print(f"{name}: {path}")
+    return 0
+
+
+__all__ = ["BASEMOD_SOURCES", "MODTHESPIRE_SOURCES", "create_stub_dependencies", "main"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,13 +2,14 @@
 from __future__ import annotations
 
 import argparse
+import os
 import shutil
 import subprocess
 import tempfile
 import textwrap
 import zipfile
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence
 
 STUB_SOURCES: Dict[str, str] = {
     "com/megacrit/cardcrawl/cards/AbstractCard.java": textwrap.dedent(
@@ -160,6 +161,17 @@ STUB_SOURCES: Dict[str, str] = {
         }
         """
     ),
+    "com/megacrit/cardcrawl/core/Settings.java": textwrap.dedent(
+        """
+        package com.megacrit.cardcrawl.core;
+
+        public class Settings {
+            public enum GameLanguage { ENG, DEU, FRA, ITA, JPN, KOR, POL, PTB, RUS, SPA, TUR, UKR, ZHS, ZHT }
+
+            public static GameLanguage language = GameLanguage.ENG;
+        }
+        """
+    ),
     "com/megacrit/cardcrawl/localization/CardStrings.java": textwrap.dedent(
         """
         package com.megacrit.cardcrawl.localization;
@@ -182,6 +194,115 @@ STUB_SOURCES: Dict[str, str] = {
         }
         """
     ),
+    "com/badlogic/gdx/Gdx.java": textwrap.dedent(
+        """
+        package com.badlogic.gdx;
+
+        public class Gdx {
+            public static Files files;
+        }
+        """
+    ),
+    "com/badlogic/gdx/Files.java": textwrap.dedent(
+        """
+        package com.badlogic.gdx;
+
+        import com.badlogic.gdx.files.FileHandle;
+
+        public interface Files {
+            FileHandle internal(String path);
+        }
+        """
+    ),
+    "com/badlogic/gdx/files/FileHandle.java": textwrap.dedent(
+        """
+        package com.badlogic.gdx.files;
+
+        public class FileHandle {
+            public String readString(String charset) {
+                return "";
+            }
+        }
+        """
+    ),
+    "com/google/gson/Gson.java": textwrap.dedent(
+        """
+        package com.google.gson;
+
+        public class Gson {
+            public <T> T fromJson(String json, Class<T> classOfT) {
+                return null;
+            }
+
+            public <T> T fromJson(JsonElement json, Class<T> classOfT) {
+                return null;
+            }
+        }
+        """
+    ),
+    "com/google/gson/JsonElement.java": textwrap.dedent(
+        """
+        package com.google.gson;
+
+        public abstract class JsonElement {
+            public JsonObject getAsJsonObject() {
+                return (JsonObject) this;
+            }
+
+            public String getAsString() {
+                return null;
+            }
+        }
+        """
+    ),
+    "com/google/gson/JsonObject.java": textwrap.dedent(
+        """
+        package com.google.gson;
+
+        public class JsonObject extends JsonElement {
+            public JsonElement get(String memberName) {
+                return null;
+            }
+
+            public JsonArray getAsJsonArray(String memberName) {
+                return null;
+            }
+        }
+        """
+    ),
+    "com/google/gson/JsonArray.java": textwrap.dedent(
+        """
+        package com.google.gson;
+
+        import java.util.Collections;
+        import java.util.Iterator;
+
+        public class JsonArray extends JsonElement implements Iterable<JsonElement> {
+            public Iterator<JsonElement> iterator() {
+                return Collections.<JsonElement>emptyList().iterator();
+            }
+        }
+        """
+    ),
+    "com/badlogic/gdx/graphics/g2d/TextureAtlas.java": textwrap.dedent(
+        """
+        package com.badlogic.gdx.graphics.g2d;
+
+        import com.badlogic.gdx.files.FileHandle;
+
+        public class TextureAtlas {
+            public static class AtlasRegion {
+            }
+
+            public TextureAtlas(FileHandle packFile) {
+            }
+
+            public AtlasRegion findRegion(String name) {
+                return null;
+            }
+        }
+        """
+    ),
 }
 
 
@@ -207,11 +328,22 @@ def _supports_release_flag(javac_path: str) -> bool:
 
 
 def create_fake_desktop_jar(output_path: Path, java_home: Optional[str] = None) -> Path:
+    return compile_stub_jar(STUB_SOURCES, output_path, java_home)
+
+
+def compile_stub_jar(
+    sources: Dict[str, str],
+    output_path: Path,
+    java_home: Optional[str] = None,
+    classpath: Sequence[Path] = (),
+) -> Path:
+    """Compile ``sources`` (relative path -> Java source) against ``classpath`` into a jar at ``output_path``."""
+
     output_path = Path(output_path).expanduser().resolve()
     with tempfile.TemporaryDirectory() as tmp_dir:
         src_root = Path(tmp_dir) / "src"
         classes_root = Path(tmp_dir) / "classes"
-        for relative_path, source in STUB_SOURCES.items():
+        for relative_path, source in sources.items():
             file_path = src_root / relative_path
             file_path.parent.mkdir(parents=True, exist_ok=True)
             file_path.write_text(source, encoding="utf-8")
@@ -219,6 +351,8 @@ def create_fake_desktop_jar(output_path: Path, java_home: Optional[str] = None)
         compile_command = [javac, "-encoding", "UTF-8", "-d", str(classes_root)]
         if _supports_release_flag(javac):
             compile_command.extend(["--release", "8"])
+        if classpath:
+            compile_command.extend(["-classpath", os.pathsep.join(str(Path(entry).resolve()) for entry in classpath)])
         compile_command.extend(str(path) for path in src_root.rglob("*.java"))
         subprocess.run(compile_command, check=True)
         manifest_path = classes_root / "META-INF" / "MANIFEST.MF"
@@ -244,7 +378,7 @@ def main() -> None:
     create_fake_desktop_jar(args.output, args.java_home)
 
 
-__all__ = ["create_fake_desktop_jar", "main"]
+__all__ = ["compile_stub_jar", "create_fake_desktop_jar", "main"]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,65 @@
+"""Compare two jars entry by entry from their central directories."""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from jartools import JarDiff, JarReader  # noqa: E402
+
+
+def _parse_args(argv: Optional[list] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Report added, removed and changed jar entries using CRCs; exits 1 when the jars differ"
+    )
+    parser.add_argument("left", type=Path, help="Baseline jar")
+    parser.add_argument("right", type=Path, help="Jar to compare against the baseline")
+    parser.add_argument("--json", action="store_true", help="Print the comparison as JSON")
+    parser.add_argument("--quiet", action="store_true", help="Print nothing; only set the exit status")
+    parser.add_argument(
+        "--strict", action="store_true", help="Also treat timestamp, permission or compression changes as differences"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list] = None) -> int:
+    args = _parse_args(argv)
+    try:
+        result = JarDiff.compare(args.left, args.right)
+    except JarReader.FormatError as exc:
+        print(str(exc), file=sys.stderr)
+        return 2
+    differs = not result.identical or (args.strict and bool(result.metadata_changed))
+    if args.quiet:
+        return 1 if differs else 0
+    if args.json:
+        print(json.dumps({**asdict(result), "identical": result.identical}, indent=2))
+        return 1 if differs else 0
+    for name in result.added:
+        print(f"+ {name}")
+    for name in result.removed:
+        print(f"- {name}")
+    for name in result.changed:
+        print(f"M {name}")
+    if args.strict:
+        for name in result.metadata_changed:
+            print(f"T {name}")
+    print(
+        f"{len(result.added)} added, {len(result.removed)} removed, {len(result.changed)} changed, "
+        f"{result.unchanged} unchanged ({len(result.metadata_changed)} with metadata-only changes)"
+    )
+    return 1 if differs else 0
+
+
+__all__ = ["main"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Inspect or prune the ModOrchestrator artifact cache."""
+from __future__ import annotations
+
+import argparse
+import datetime
+import sys
+from pathlib import Path
+from typing import Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from artifactcache import ArtifactCache  # noqa: E402
+from logic import APPLICATION_LOGIC  # noqa: E402
+
+
+def _open_cache(root: Optional[Path], max_mb: Optional[int]) -> ArtifactCache:
+    config = APPLICATION_LOGIC.runtime_config
+    if root is None:
+        root = Path(config.artifact_cache_dir) if config.artifact_cache_dir else ArtifactCache.default_root()
+    limit_mb = config.artifact_cache_max_mb if max_mb is None else max_mb
+    return ArtifactCache(root, int(limit_mb) * 1024 * 1024)
+
+
+def _format_size(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if value < 1024 or unit == "GiB":
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
+
+def _format_time(timestamp: float) -> str:
+    return datetime.datetime.fromtimestamp(timestamp).isoformat(sep=" ", timespec="seconds")
+
+
+def _parse_args(argv: Optional[list] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Inspect or prune the mod artifact cache")
+    parser.add_argument("--root", type=Path, default=None, help="Cache directory (defaults to runtime configuration)")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    subcommands.add_parser("list", help="List cached artifacts, most recently used first")
+    subcommands.add_parser("stats", help="Show entry count and total size")
+    prune = subcommands.add_parser("prune", help="Evict least recently used artifacts")
+    prune.add_argument("--max-mb", type=int, default=None, help="Size limit to prune down to")
+    remove = subcommands.add_parser("remove", help="Remove one artifact by key")
+    remove.add_argument("key")
+    subcommands.add_parser("clear", help="Remove every cached artifact")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list] = None) -> int:
+    args = _parse_args(argv)
+    cache = _open_cache(args.root, getattr(args, "max_mb", None))
+    if args.command == "list":
+        for entry in cache.entries():
+            print(
+                f"{entry.key[:16]}  {entry.mod_id:<24} {_format_size(entry.size):>10}  "
+                f"last used {_format_time(entry.last_access)}"
+            )
+    elif args.command == "stats":
+        entries = cache.entries()
+        total = sum(entry.size for entry in entries)
+        print(f"root:    {cache.root}")
+        print(f"entries: {len(entries)}")
+        print(f"size:    {_format_size(total)} of {_format_size(cache.max_bytes)}")
+    elif args.command == "prune":
+        removed = cache.prune()
+        print(f"Evicted {len(removed)} artifacts ({_format_size(sum(entry.size for entry in removed))})")
+    elif args.command == "remove":
+        matches = [entry.key for entry in cache.entries() if entry.key.startswith(args.key)]
+        if len(matches) != 1:
+            print(f"Key prefix '{args.key}' matched {len(matches)} artifacts", file=sys.stderr)
+            return 1
+        cache.remove(matches[0])
+        print(f"Removed {matches[0]}")
+    elif args.command == "clear":
+        print(f"Removed {cache.clear()} artifacts")
+    return 0
+
+
+__all__ = ["main"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
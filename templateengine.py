@@ -0,0 +1,138 @@
+"""Precompiled source templates used by the mod export pipeline."""
+from __future__ import annotations
+
+import logging
+import re
+import textwrap
+import threading
+from typing import Any, Dict, List, Mapping, Tuple
+
+from plugin_manager import PluginManager
+
+
+class TemplateEngine:
+    """Registry of templates parsed once into literal segments and named slots.
+
+    Templates use ``${slot}`` placeholders and ``$$`` for a literal dollar sign. Rendering
+    only concatenates the stored segments with the supplied slot values, so the per-render
+    cost is independent of template size apart from the final join.
+    """
+
+    _PLACEHOLDER = re.compile(r"\$(?:\{(?P<slot>[A-Za-z_][A-Za-z0-9_]*)\}|(?P<escape>\$))")
+
+    class TemplateError(Exception):
+        """Raised when a template is malformed, missing or rendered with missing slots."""
+
+    class CompiledTemplate:
+        """Template split into literal segments interleaved with slot names."""
+
+        __slots__ = ("name", "kind", "segments", "slot_positions")
+
+        def __init__(self, name: str, kind: str, segments: List[str], slot_positions: List[Tuple[int, str]]) -> None:
+            self.name = name
+            self.kind = kind
+            self.segments = segments
+            self.slot_positions = slot_positions
+
+        @property
+        def slots(self) -> Tuple[str, ...]:
+            return tuple(dict.fromkeys(slot for _, slot in self.slot_positions))
+
+        def render(self, values: Mapping[str, Any]) -> str:
+            parts = list(self.segments)
+            try:
+                for position, slot in self.slot_positions:
+                    parts[position] = str(values[slot])
+            except KeyError as exc:
+                raise TemplateEngine.TemplateError(
+                    f"Template '{self.name}' requires a value for slot {exc.args[0]!r}"
+                ) from exc
+            return "".join(parts)
+
+    def __init__(self, plugin_manager: PluginManager) -> None:
+        self._plugin_manager = plugin_manager
+        self._logger = logging.getLogger("stsm.template_engine")
+        if not self._logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter("[%(asctime)s] %(levelname)s %(name)s: %(message)s")
+            handler.setFormatter(formatter)
+            self._logger.addHandler(handler)
+        self._logger.setLevel(logging.INFO)
+        self._templates: Dict[str, TemplateEngine.CompiledTemplate] = {}
+        self._lock = threading.RLock()
+        self._plugin_manager.register_module(__name__, __import__(__name__))
+        self._plugin_manager.register_symbol("templateengine.engine", self)
+
+    @classmethod
+    def compile(
+        cls,
+        text: str,
+        name: str = "<inline>",
+        kind: str = "custom",
+        dedent: bool = True,
+    ) -> "TemplateEngine.CompiledTemplate":
+        """Parse ``text`` into a reusable template; ``dedent`` strips common indentation and surrounding blank lines."""
+
+        if dedent:
+            text = textwrap.dedent(text).strip() + "\n"
+        segments: List[str] = []
+        slot_positions: List[Tuple[int, str]] = []
+        literal: List[str] = []
+        cursor = 0
+        for match in cls._PLACEHOLDER.finditer(text):
+            literal.append(text[cursor : match.start()])
+            cursor = match.end()
+            if match.group("escape"):
+                literal.append("$")
+                continue
+            segments.append("".join(literal))
+            literal = []
+            slot_positions.append((len(segments), match.group("slot")))
+            segments.append("")
+        literal.append(text[cursor:])
+        remainder = "".join(literal)
+        if "${" in remainder:
+            raise TemplateEngine.TemplateError(f"Template '{name}' contains a malformed placeholder")
+        segments.append(remainder)
+        return TemplateEngine.CompiledTemplate(name, kind, segments, slot_positions)
+
+    def register_template(
+        self,
+        name: str,
+        text: str,
+        kind: str = "custom",
+        replace: bool = False,
+        dedent: bool = True,
+    ) -> "TemplateEngine.CompiledTemplate":
+        """Compile and store a template, e.g. ``register_template("relic.basic", source, kind="relic")``."""
+
+        if not name:
+            raise ValueError("Template name cannot be empty")
+        compiled = self.compile(text, name=name, kind=kind, dedent=dedent)
+        with self._lock:
+            if name in self._templates and not replace:
+                raise TemplateEngine.TemplateError(f"Template '{name}' is already registered")
+            self._templates[name] = compiled
+        self._logger.debug("Registered %s template %s with slots %s", kind, name, compiled.slots)
+        return compiled
+
+    def get_template(self, name: str) -> "TemplateEngine.CompiledTemplate":
+        with self._lock:
+            if name not in self._templates:
+                raise TemplateEngine.TemplateError(f"Template '{name}' is not registered")
+            return self._templates[name]
+
+    def render(self, name: str, values: Mapping[str, Any]) -> str:
+        return self.get_template(name).render(values)
+
+    def templates(self, kind: str = "") -> List[str]:
+        with self._lock:
+            return sorted(name for name, template in self._templates.items() if not kind or template.kind == kind)
+
+
+TEMPLATE_ENGINE = TemplateEngine(PluginManager.get_instance())
+
+__all__ = [
+    "TemplateEngine",
+    "TEMPLATE_ENGINE",
+]
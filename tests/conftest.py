@@ -1,9 +1,46 @@
-"""Pytest configuration injecting the repository root into sys.path."""
+"""Pytest configuration injecting the repository root into sys.path and sharing project factories."""
 from __future__ import annotations
 
 import sys
 from pathlib import Path
+from typing import Any
 
 ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+from modorchestrator import ModOrchestrator  # noqa: E402
+
+
+def make_card(index: int, **overrides: Any) -> ModOrchestrator.CardDefinition:
+    """Create the simple attack card ``Card<index>``; keyword arguments replace any field."""
+
+    values: dict[str, Any] = {
+        "card_id": f"Card{index}",
+        "name": f"Card {index}",
+        "description": "Deal damage.",
+        "upgrade_description": "Deal more damage.",
+        "card_type": "ATTACK",
+        "card_color": "COLORLESS",
+        "rarity": "COMMON",
+        "target": "ENEMY",
+        "cost": 1,
+        "base_damage": 6,
+    }
+    values.update(overrides)
+    return ModOrchestrator.CardDefinition(**values)
+
+
+def make_project(mod_id: str, package: str, card_count: int) -> ModOrchestrator.ModProject:
+    """Create a project with ``card_count`` simple attack cards."""
+
+    metadata = ModOrchestrator.ModMetadata(
+        mod_id=mod_id,
+        name=f"{mod_id} test mod",
+        author="Best Bud",
+        version="1.0.0",
+        description="Integration test mod built by ModOrchestrator",
+        package=package,
+        entry_class="GeneratedMod",
+    )
+    return ModOrchestrator.ModProject(metadata=metadata, cards=[make_card(index) for index in range(card_count)])
@@ -0,0 +1,67 @@
+"""Tests for the content-addressed artifact cache."""
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+from artifactcache import ArtifactCache
+
+
+def _key(label: str) -> str:
+    return hashlib.sha256(label.encode("utf-8")).hexdigest()
+
+
+def _artifact(path: Path, size: int) -> Path:
+    path.write_bytes(os.urandom(size))
+    return path
+
+
+class TestArtifactCache:
+    """Validate storage, lookup and LRU eviction."""
+
+    def test_store_and_lookup_roundtrip(self, tmp_path: Path) -> None:
+        cache = ArtifactCache(tmp_path / "cache")
+        source = _artifact(tmp_path / "mod.jar", 128)
+        stored = cache.store(_key("a"), source, "buddymod")
+        assert stored.read_bytes() == source.read_bytes()
+        assert cache.lookup(_key("a")) == stored
+        assert cache.lookup(_key("missing")) is None
+        [entry] = cache.entries()
+        assert entry.mod_id == "buddymod"
+        assert entry.size == 128
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        cache = ArtifactCache(tmp_path / "cache", max_bytes=250)
+        source = _artifact(tmp_path / "mod.jar", 100)
+        cache.store(_key("old"), source, "mod")
+        cache.store(_key("recent"), source, "mod")
+        assert cache.lookup(_key("old")) is not None
+        cache.store(_key("newest"), source, "mod")
+        remaining = {entry.key for entry in cache.entries()}
+        assert remaining == {_key("old"), _key("newest")}
+
+    def test_prune_and_clear(self, tmp_path: Path) -> None:
+        cache = ArtifactCache(tmp_path / "cache")
+        source = _artifact(tmp_path / "mod.jar", 64)
+        for label in ("one", "two", "three"):
+            cache.store(_key(label), source, "mod")
+        removed = cache.prune(max_bytes=64)
+        assert len(removed) == 2
+        assert cache.clear() == 1
+        assert cache.entries() == []
+
+    def test_rejects_malformed_keys(self, tmp_path: Path) -> None:
+        cache = ArtifactCache(tmp_path / "cache")
+        with pytest.raises(ArtifactCache.CacheError):
+            cache.lookup("../../etc/passwd")
+
+    def test_skips_artifacts_larger_than_the_limit(self, tmp_path: Path) -> None:
+        cache = ArtifactCache(tmp_path / "cache", max_bytes=100)
+        kept = cache.store(_key("small"), _artifact(tmp_path / "small.jar", 60), "mod")
+        assert cache.store(_key("large"), _artifact(tmp_path / "large.jar", 101), "mod") is None
+        assert cache.lookup(_key("large")) is None
+        assert [entry.key for entry in cache.entries()] == [_key("small")]
+        assert kept is not None and kept.exists()
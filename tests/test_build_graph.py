@@ -0,0 +1,92 @@
+"""Tests for the build phase graph."""
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from buildgraph import BuildGraph
+
+
+def _recorder(log: list[str], name: str, barrier: threading.Barrier | None = None):
+    def action(context: object) -> None:
+        if barrier is not None:
+            barrier.wait(timeout=5)
+        log.append(name)
+
+    return action
+
+
+class TestBuildGraph:
+    """Validate planning, concurrent execution and failure handling."""
+
+    def test_plan_groups_independent_phases_into_waves(self) -> None:
+        log: list[str] = []
+        graph = BuildGraph(
+            [
+                BuildGraph.Phase("metadata", _recorder(log, "metadata")),
+                BuildGraph.Phase("assets", _recorder(log, "assets")),
+                BuildGraph.Phase("cards", _recorder(log, "cards"), requires=("assets",)),
+                BuildGraph.Phase("compile", _recorder(log, "compile"), requires=("metadata", "cards")),
+            ]
+        )
+        graph.add(BuildGraph.Phase("relics", _recorder(log, "relics"), before=("compile",)))
+        assert graph.plan() == [["metadata", "assets", "relics"], ["cards"], ["compile"]]
+
+    def test_ready_phases_run_concurrently(self) -> None:
+        log: list[str] = []
+        barrier = threading.Barrier(2)
+        graph = BuildGraph(
+            [
+                BuildGraph.Phase("left", _recorder(log, "left", barrier)),
+                BuildGraph.Phase("right", _recorder(log, "right", barrier)),
+                BuildGraph.Phase("join", _recorder(log, "join"), requires=("left", "right")),
+            ]
+        )
+        completed = graph.run(context=None)
+        assert sorted(completed[:2]) == ["left", "right"]
+        assert completed[2] == "join"
+        assert log[-1] == "join"
+
+    def test_failure_stops_dependents_and_is_reraised(self) -> None:
+        log: list[str] = []
+
+        def broken(context: object) -> None:
+            raise ValueError("boom")
+
+        graph = BuildGraph(
+            [
+                BuildGraph.Phase("broken", broken),
+                BuildGraph.Phase("sibling", _recorder(log, "sibling")),
+                BuildGraph.Phase("after", _recorder(log, "after"), requires=("broken", "sibling")),
+            ]
+        )
+        with pytest.raises(ValueError, match="boom"):
+            graph.run(context=None)
+        assert "after" not in log
+
+    def test_finished_phases_are_reported_on_the_calling_thread(self) -> None:
+        reported: list[tuple[str, int]] = []
+
+        def broken(context: object) -> None:
+            raise ValueError("boom")
+
+        graph = BuildGraph(
+            [
+                BuildGraph.Phase("left", _recorder([], "left")),
+                BuildGraph.Phase("right", broken),
+            ]
+        )
+        with pytest.raises(ValueError, match="boom"):
+            graph.run(context=None, on_finished=lambda name: reported.append((name, threading.get_ident())))
+        assert sorted(reported) == [("left", threading.get_ident()), ("right", threading.get_ident())]
+
+    def test_rejects_cycles_unknown_and_duplicate_phases(self) -> None:
+        noop = _recorder([], "noop")
+        graph = BuildGraph([BuildGraph.Phase("a", noop, requires=("b",)), BuildGraph.Phase("b", noop, requires=("a",))])
+        with pytest.raises(BuildGraph.GraphError, match="cycle"):
+            graph.plan()
+        with pytest.raises(BuildGraph.GraphError, match="unknown"):
+            BuildGraph([BuildGraph.Phase("a", noop, requires=("missing",))]).plan()
+        with pytest.raises(BuildGraph.GraphError, match="already registered"):
+            graph.add(BuildGraph.Phase("a", noop))
@@ -0,0 +1,47 @@
+"""Tests for build phase profiling."""
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from buildgraph import BuildGraph
+from buildprofiler import BuildProfiler
+
+
+class TestBuildProfiler:
+    """Validate phase timing, write attribution and the structured report."""
+
+    def test_writes_are_attributed_to_the_running_phase(self) -> None:
+        finished: list[str] = []
+        profiler = BuildProfiler(on_phase=lambda record: finished.append(record.name))
+        with profiler.phase("assets"):
+            profiler.record_write(10)
+            helper = threading.Thread(target=profiler.bind(profiler.record_write), args=(5,))
+            helper.start()
+            helper.join()
+        with profiler.phase("compile"):
+            profiler.record_compile("subprocess", 3, 0.25, True)
+        profiler.record_write(1)
+
+        report = profiler.report(jar_bytes=4096)
+        assert finished == ["assets", "compile"]
+        assets = report.phase("assets")
+        assert (assets.files_written, assets.bytes_written) == (2, 15)
+        assert report.phase(BuildProfiler.UNATTRIBUTED).bytes_written == 1
+        assert (report.files_written, report.bytes_written, report.jar_bytes) == (3, 16, 4096)
+        assert report.compiler_calls == [BuildProfiler.CompilerCall("compile", "subprocess", 3, 0.25, True)]
+        assert report.to_dict()["phases"][0]["name"] == "assets"
+
+    def test_failed_phase_is_reported_with_its_error(self) -> None:
+        records: list[BuildProfiler.PhaseRecord] = []
+        profiler = BuildProfiler(on_phase=records.append)
+
+        def broken(context: object) -> None:
+            raise RuntimeError("javac exploded")
+
+        graph = BuildGraph([BuildGraph.Phase("compile", broken)])
+        with pytest.raises(RuntimeError):
+            graph.run(context=None, instrument=profiler.phase)
+        assert [(record.name, record.error) for record in records] == [("compile", "javac exploded")]
+        assert records[0].seconds >= 0
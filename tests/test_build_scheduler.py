@@ -0,0 +1,157 @@
+"""Tests for the build scheduler in front of the ModOrchestrator."""
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+
+from buildscheduler import BuildScheduler
+from conftest import make_project
+from javacompiler import JAVA_COMPILER_SERVICE, JavaCompilerService
+from logic import APPLICATION_LOGIC
+from modorchestrator import MOD_ORCHESTRATOR, ModOrchestrator
+from plugin_manager import PluginManager
+
+
+class GatedCompiler:
+    """Stub backend that records each compile and holds it until ``gate`` opens or it is cancelled."""
+
+    def __init__(self) -> None:
+        self.gate = threading.Event()
+        self.started = threading.Semaphore(0)
+        self.calls: List[str] = []
+        self.active: List[str] = []
+        self.overlapping_roots = False
+        self._lock = threading.Lock()
+
+    def version(self, javac: str = "") -> str:
+        return "gated"
+
+    def compile(self, request: JavaCompilerService.CompileRequest) -> JavaCompilerService.CompileResult:
+        root = str(request.output_dir.parent.parent)
+        with self._lock:
+            self.overlapping_roots = self.overlapping_roots or root in self.active
+            self.calls.append(Path(root).name)
+            self.active.append(root)
+        self.started.release()
+        try:
+            while not self.gate.wait(0.01):
+                if request.cancel_event is not None and request.cancel_event.is_set():
+                    raise JavaCompilerService.CompileCancelledError("javac was cancelled")
+        finally:
+            with self._lock:
+                self.active.remove(root)
+        for source in request.sources:
+            (request.output_dir / f"{source.stem}.class").write_bytes(b"\xca\xfe\xba\xbe")
+        return JavaCompilerService.CompileResult(success=True, backend="gated")
+
+
+@pytest.fixture()
+def gated_compiler() -> Iterator[GatedCompiler]:
+    original = APPLICATION_LOGIC.runtime_config.to_dict()
+    APPLICATION_LOGIC.update_configuration(
+        java_home="",
+        modthespire_jar="",
+        basemod_path="",
+        stslib_path="",
+        actlikeit_path="",
+        desktop_jar_path="",
+    )
+    compiler = GatedCompiler()
+    JAVA_COMPILER_SERVICE.register_backend("gated", compiler)
+    try:
+        yield compiler
+    finally:
+        compiler.gate.set()
+        JAVA_COMPILER_SERVICE._backends.pop("gated")  # noqa: SLF001
+        APPLICATION_LOGIC.update_configuration(**original)
+
+
+def _project(mod_id: str, card_count: int = 1) -> ModOrchestrator.ModProject:
+    return make_project(mod_id, f"com.buddy.{mod_id}", card_count)
+
+
+OPTIONS = ModOrchestrator.BuildOptions(compiler_backend="gated")
+
+
+class TestBuildScheduler:
+    """Validate merging, priorities, per-root exclusion and cancellation."""
+
+    def test_identical_requests_merge_and_priorities_order_the_queue(
+        self, tmp_path: Path, gated_compiler: GatedCompiler
+    ) -> None:
+        scheduler = BuildScheduler(MOD_ORCHESTRATOR, PluginManager(), workers=1)
+        try:
+            running = scheduler.submit(_project("alpha"), tmp_path, options=OPTIONS)
+            assert gated_compiler.started.acquire(timeout=10)
+            joined = scheduler.submit(_project("alpha"), tmp_path, options=OPTIONS)
+            low = scheduler.submit(_project("beta"), tmp_path, options=OPTIONS, priority=BuildScheduler.PRIORITY_LOW)
+            normal = scheduler.submit(_project("gamma"), tmp_path, options=OPTIONS)
+            urgent = scheduler.submit(
+                _project("beta"), tmp_path, options=OPTIONS, priority=BuildScheduler.PRIORITY_HIGH
+            )
+            assert (joined.merged, urgent.merged, low.merged) == (True, True, False)
+            status = scheduler.status()
+            assert (status.queued, status.running, status.merged) == (2, 1, 2)
+
+            gated_compiler.gate.set()
+            assert running.result(timeout=10) is joined.result(timeout=10)
+            assert low.result(timeout=10) is urgent.result(timeout=10)
+            assert normal.result(timeout=10).jar_path.exists()
+        finally:
+            scheduler.shutdown()
+        assert gated_compiler.calls == ["alpha", "beta", "gamma"]
+        assert scheduler.status().completed == 3
+
+    def test_same_root_waits_while_other_roots_proceed(self, tmp_path: Path, gated_compiler: GatedCompiler) -> None:
+        scheduler = BuildScheduler(MOD_ORCHESTRATOR, PluginManager(), workers=2)
+        try:
+            first = scheduler.submit(_project("shared", 1), tmp_path, options=OPTIONS)
+            assert gated_compiler.started.acquire(timeout=10)
+            edited = scheduler.submit(_project("shared", 2), tmp_path, options=OPTIONS)
+            other = scheduler.submit(_project("other"), tmp_path, options=OPTIONS)
+            assert gated_compiler.started.acquire(timeout=10)
+            assert not edited.merged
+            assert edited.state == BuildScheduler.QUEUED
+            assert scheduler.status().running_roots == sorted(
+                [str(tmp_path.resolve() / "other"), str(tmp_path.resolve() / "shared")]
+            )
+            gated_compiler.gate.set()
+            for ticket in (first, edited, other):
+                ticket.result(timeout=10)
+        finally:
+            scheduler.shutdown()
+        assert gated_compiler.calls == ["shared", "other", "shared"]
+        assert not gated_compiler.overlapping_roots
+        assert str(tmp_path.resolve() / "shared") not in ModOrchestrator._ROOT_LOCKS  # noqa: SLF001
+        assert len(list((tmp_path / "shared" / "src").rglob("Card*.java"))) == 2
+
+    def test_cancelling_every_request_stops_the_running_compiler(
+        self, tmp_path: Path, gated_compiler: GatedCompiler
+    ) -> None:
+        scheduler = BuildScheduler(MOD_ORCHESTRATOR, PluginManager(), workers=1)
+        try:
+            first = scheduler.submit(_project("stopped"), tmp_path, options=OPTIONS)
+            assert gated_compiler.started.acquire(timeout=10)
+            second = scheduler.submit(_project("stopped"), tmp_path, options=OPTIONS)
+            queued = scheduler.submit(_project("dropped"), tmp_path, options=OPTIONS)
+
+            assert queued.cancel()
+            assert queued.state == BuildScheduler.CANCELLED
+            assert first.cancel()
+            assert first.state == BuildScheduler.CANCELLED
+            assert second.state == BuildScheduler.RUNNING
+            assert second.cancel()
+            with pytest.raises(ModOrchestrator.BuildCancelledError):
+                second.result(timeout=10)
+            with pytest.raises(ModOrchestrator.BuildCancelledError):
+                queued.result(timeout=10)
+        finally:
+            scheduler.shutdown()
+        assert gated_compiler.calls == ["stopped"]
+        assert not (tmp_path / "stopped" / "build" / "build-manifest.json").exists()
+        assert not second.cancel()
+        with pytest.raises(BuildScheduler.SchedulerClosedError):
+            scheduler.submit(_project("late"), tmp_path, options=OPTIONS)
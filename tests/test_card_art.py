@@ -0,0 +1,55 @@
+"""Tests for card-art variant generation."""
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from cardart import CardArtPipeline
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _source_image(path: Path, size: tuple[int, int], colour: tuple[int, int, int, int]) -> str:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new("RGBA", size, colour).save(path, format="PNG")
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+class TestCardArtPipeline:
+    """Validate resizing, cache reuse and variant naming."""
+
+    def test_renders_every_variant_at_its_exact_size(self, tmp_path: Path) -> None:
+        pipeline = CardArtPipeline(tmp_path / "cache")
+        digest = _source_image(tmp_path / "art" / "strike.png", (1024, 1024), (200, 10, 10, 255))
+        batch = pipeline.render({digest: tmp_path / "art" / "strike.png"})
+        assert batch.resized == 2
+        assert set(batch.outputs[digest]) == {"", "_p"}
+        with Image.open(batch.outputs[digest][""]) as small:
+            assert small.size == (250, 190)
+        with Image.open(batch.outputs[digest]["_p"]) as portrait:
+            assert portrait.size == (500, 380)
+
+    def test_reuses_cached_variants_and_resizes_new_art(self, tmp_path: Path) -> None:
+        pipeline = CardArtPipeline(tmp_path / "cache")
+        first = _source_image(tmp_path / "art" / "a.png", (600, 400), (0, 0, 255, 255))
+        pipeline.render({first: tmp_path / "art" / "a.png"})
+        second = _source_image(tmp_path / "art" / "b.png", (600, 400), (0, 255, 0, 255))
+        batch = pipeline.render({first: tmp_path / "art" / "a.png", second: tmp_path / "art" / "b.png"}, workers=1)
+        assert batch.reused == 2
+        assert batch.resized == 2
+
+    def test_undecodable_source_is_reported(self, tmp_path: Path) -> None:
+        broken = tmp_path / "broken.png"
+        broken.write_bytes(b"not an image")
+        with pytest.raises(CardArtPipeline.ImageProcessingError):
+            CardArtPipeline(tmp_path / "cache").render({"ab" * 32: broken})
+
+    def test_variant_path_inserts_suffix_before_extension(self) -> None:
+        assert CardArtPipeline.variant_path("modResources/images/cards/Strike.png", "_p") == (
+            "modResources/images/cards/Strike_p.png"
+        )
+        assert CardArtPipeline.variant_path("modResources/images/cards/Strike.png", "") == (
+            "modResources/images/cards/Strike.png"
+        )
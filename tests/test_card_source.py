@@ -0,0 +1,67 @@
+"""Tests for streaming card catalogue readers."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from cardsource import CardSource
+from modorchestrator import ModOrchestrator
+
+
+class TestCardSource:
+    """Validate JSONL and CSV parsing into card definitions."""
+
+    def test_jsonl_and_csv_rows_become_cards(self, tmp_path: Path) -> None:
+        rows = [
+            {
+                "card_id": "Strike",
+                "name": "Strike",
+                "description": "Deal !D! damage.",
+                "upgrade_description": "Deal !D! damage.",
+                "card_type": "ATTACK",
+                "card_color": "RED",
+                "rarity": "BASIC",
+                "target": "ENEMY",
+                "cost": 1,
+                "base_damage": 6,
+                "image_path": "art/strike.png",
+            },
+            {
+                "card_id": "Defend",
+                "name": "Defend",
+                "description": "Gain !B! block.",
+                "upgrade_description": "Gain !B! block.",
+                "card_type": "SKILL",
+                "card_color": "RED",
+                "rarity": "BASIC",
+                "target": "SELF",
+                "cost": "1",
+                "base_block": "5",
+            },
+        ]
+        jsonl = tmp_path / "cards.jsonl"
+        jsonl.write_text("\n".join(json.dumps(row) for row in rows) + "\n\n", encoding="utf-8")
+        header = list(rows[0]) + ["base_block"]
+        csv_lines = [",".join(header)]
+        for row in rows:
+            csv_lines.append(",".join(str(row.get(name, "")) for name in header))
+        catalogue = tmp_path / "cards.csv"
+        catalogue.write_text("\n".join(csv_lines) + "\n", encoding="utf-8")
+
+        for path in (jsonl, catalogue):
+            strike, defend = list(CardSource.open(path))
+            assert strike.image_path == tmp_path / "art" / "strike.png"
+            assert (strike.cost, strike.base_damage, strike.base_block) == (1, 6, 0)
+            assert defend == ModOrchestrator.CardDefinition(**{**rows[1], "cost": 1, "base_block": 5})
+
+    def test_bad_rows_report_their_line(self, tmp_path: Path) -> None:
+        catalogue = tmp_path / "cards.jsonl"
+        catalogue.write_text('{"card_id": "A"}\n', encoding="utf-8")
+        with pytest.raises(CardSource.RowError, match=r"cards.jsonl:1: missing card fields .*cost"):
+            list(CardSource.open(catalogue))
+        with pytest.raises(ModOrchestrator.SpecificationError, match="unknown card fields colour"):
+            CardSource.card_from_row({"colour": "RED"})
+        with pytest.raises(CardSource.RowError, match="Unsupported card catalogue"):
+            CardSource.open(tmp_path / "cards.xlsx")
@@ -0,0 +1,119 @@
+"""Tests for the columnar card store."""
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+
+import pytest
+
+from cardstore import CardStore
+from conftest import make_card
+from modorchestrator import MOD_ORCHESTRATOR, ModOrchestrator
+
+
+def _card(index: int, rarity: str, card_type: str, cost: int) -> ModOrchestrator.CardDefinition:
+    card_color = "RED" if index % 2 else "BLUE"
+    return make_card(index, card_type=card_type, card_color=card_color, rarity=rarity, cost=cost, base_damage=index)
+
+
+class TestCardStore:
+    """Validate sequence behaviour, indexed queries and orchestrator compatibility."""
+
+    def test_rows_round_trip_and_queries_use_indexes(self) -> None:
+        cards = [
+            _card(0, "RARE", "ATTACK", 2),
+            _card(1, "COMMON", "SKILL", 1),
+            _card(2, "rare", "ATTACK", 0),
+            _card(3, "RARE", "ATTACK", 1),
+        ]
+        cards[3].image_path = Path("art/strike.png")
+        store = CardStore(cards)
+        assert len(store) == 4
+        assert list(store) == cards
+        assert store[-1] == cards[3]
+        assert store[1:3] == cards[1:3]
+
+        assert store.select(rarity="RARE", card_type="attack") == [0, 2, 3]
+        assert [card.card_id for card in store.query(rarity="RARE", card_color="RED")] == ["Card3"]
+        assert store.select(cost=(0, 1), card_type="ATTACK") == [2, 3]
+        assert store.select(rarity="UNCOMMON") == []
+        assert store.counts("rarity") == {"RARE": 3, "COMMON": 1}
+        with pytest.raises(KeyError):
+            store.select(name="Card 0")
+
+        store[0] = _card(0, "UNCOMMON", "POWER", 3)
+        del store[1]
+        store.insert(0, _card(9, "RARE", "SKILL", 1))
+        store.append(_card(5, "RARE", "ATTACK", 1))
+        assert [card.card_id for card in store] == ["Card9", "Card0", "Card2", "Card3", "Card5"]
+        assert store.select(rarity="RARE", cost=1) == [0, 3, 4]
+        assert store.counts("card_type") == {"SKILL": 1, "POWER": 1, "ATTACK": 3}
+        with pytest.raises(IndexError):
+            store[5]
+
+    def test_row_edits_are_written_back_to_the_store(self) -> None:
+        store = CardStore([_card(index, "COMMON", "ATTACK", 1) for index in range(5)])
+        first, third, last = store[0], store[2], store[4]
+        assert store[0] is first
+
+        first.cost = 3
+        last.image_path = Path("art/last.png")
+        assert store.select(cost=3) == [0]
+        assert store[4].image_path == Path("art/last.png")
+
+        del store[1:3]
+        store.insert(0, _card(9, "RARE", "SKILL", 0))
+        last.rarity = "RARE"
+        assert store[3] is last
+        assert store.select(rarity="RARE") == [0, 3]
+        third.cost = 0
+        assert store.select(cost=0) == [0]
+
+        store[1] = _card(7, "UNCOMMON", "POWER", 2)
+        first.cost = 1
+        assert (store[1].card_id, store[1].cost) == ("Card7", 2)
+        assert pickle.loads(pickle.dumps(store[3])) == last
+        assert list(pickle.loads(pickle.dumps(store))) == list(store)
+
+    def test_rejects_integers_outside_the_column_range(self) -> None:
+        store = CardStore([_card(0, "COMMON", "ATTACK", 1)])
+        with pytest.raises(ModOrchestrator.SpecificationError, match="Card1.*base_damage"):
+            store.append(make_card(1, base_damage=2**31))
+        with pytest.raises(ModOrchestrator.SpecificationError, match="Card0.*cost"):
+            store[0].cost = -(2**31) - 1
+        assert len(store) == 1
+        assert store[0].cost == 1
+        assert store.select(cost=1) == [0]
+
+    def test_store_replaces_project_card_list(self, tmp_path: Path) -> None:
+        cards = [_card(index, "COMMON", "ATTACK", 1) for index in range(3)]
+        metadata = ModOrchestrator.ModMetadata(
+            mod_id="storemod",
+            name="Store mod",
+            author="Best Bud",
+            version="1.0.0",
+            description="Columnar cards",
+            package="com.buddy.store",
+            entry_class="GeneratedMod",
+        )
+
+        def stage(project: ModOrchestrator.ModProject, name: str) -> dict[str, bytes]:
+            context = ModOrchestrator.BuildContext(
+                project=project,
+                project_root=tmp_path / name,
+                options=ModOrchestrator.BuildOptions(codegen_chunk_size=2),
+                previous_manifest=ModOrchestrator.BuildManifest(),
+            )
+            MOD_ORCHESTRATOR._validate_project(project)  # noqa: SLF001
+            MOD_ORCHESTRATOR._write_localization(context)  # noqa: SLF001
+            MOD_ORCHESTRATOR._write_card_classes(context)  # noqa: SLF001
+            MOD_ORCHESTRATOR._write_entry_class(context)  # noqa: SLF001
+            return {
+                path.relative_to(context.project_root).as_posix(): path.read_bytes()
+                for path in context.project_root.rglob("*")
+                if path.is_file()
+            }
+
+        listed = stage(ModOrchestrator.ModProject(metadata=metadata, cards=cards), "listed")
+        stored = stage(ModOrchestrator.ModProject(metadata=metadata, cards=CardStore(cards)), "stored")
+        assert stored == listed
@@ -0,0 +1,136 @@
+"""Tests for the streaming jar writer."""
+from __future__ import annotations
+
+import os
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from jartools import JarDiff, JarReader, JarWriter
+
+
+def _tree(root: Path) -> Path:
+    (root / "com" / "buddy").mkdir(parents=True)
+    (root / "com" / "buddy" / "Card.class").write_bytes(b"\xca\xfe\xba\xbe" + b"\x00\x01" * 2000)
+    (root / "cards.json").write_text('{"cards": {}}' * 50, encoding="utf-8")
+    (root / "art.png").write_bytes(os.urandom(4096))
+    return root
+
+
+class TestJarWriter:
+    """Validate compression policy, ordering and archive readability."""
+
+    def test_deflates_text_and_classes_but_stores_images(self, tmp_path: Path) -> None:
+        root = _tree(tmp_path / "classes")
+        entries = [JarWriter.Entry(JarWriter.MANIFEST_NAME, data=b"Manifest-Version: 1.0\n")]
+        entries.extend(JarWriter.directory_entries(root))
+        summary = JarWriter(workers=2).write(tmp_path / "mod.jar", entries)
+        assert summary.entries == 4
+        with zipfile.ZipFile(tmp_path / "mod.jar") as archive:
+            assert archive.testzip() is None
+            infos = {info.filename: info for info in archive.infolist()}
+            assert archive.infolist()[0].filename == JarWriter.MANIFEST_NAME
+            assert infos["com/buddy/Card.class"].compress_type == zipfile.ZIP_DEFLATED
+            assert infos["cards.json"].compress_type == zipfile.ZIP_DEFLATED
+            assert infos["art.png"].compress_type == zipfile.ZIP_STORED
+            assert archive.read("art.png") == (root / "art.png").read_bytes()
+        assert summary.bytes_out < summary.bytes_in
+
+    def test_skips_duplicate_names_and_replaces_atomically(self, tmp_path: Path) -> None:
+        destination = tmp_path / "mod.jar"
+        destination.write_bytes(b"stale")
+        entries = [JarWriter.Entry("a.txt", data=b"first"), JarWriter.Entry("a.txt", data=b"second")]
+        JarWriter(workers=1).write(destination, entries)
+        with zipfile.ZipFile(destination) as archive:
+            assert archive.namelist() == ["a.txt"]
+            assert archive.read("a.txt") == b"first"
+        assert not (tmp_path / "mod.jar.partial").exists()
+
+    def test_compression_level_zero_stores_everything(self, tmp_path: Path) -> None:
+        root = _tree(tmp_path / "classes")
+        summary = JarWriter(compression_level=0).write(tmp_path / "mod.jar", JarWriter.directory_entries(root))
+        assert summary.deflated == 0
+        with pytest.raises(JarWriter.JarError):
+            JarWriter(compression_level=10)
+
+    def test_update_reuses_unchanged_entries_and_matches_full_rewrite(self, tmp_path: Path) -> None:
+        root = _tree(tmp_path / "classes")
+        jar_path = tmp_path / "mod.jar"
+        JarWriter().write(jar_path, JarWriter.directory_entries(root))
+        (root / "cards.json").write_text('{"cards": {"Strike": {}}}', encoding="utf-8")
+        summary = JarWriter().write(jar_path, JarWriter.directory_entries(root), previous=jar_path)
+        assert summary.reused == 2
+        JarWriter().write(tmp_path / "full.jar", JarWriter.directory_entries(root))
+        assert jar_path.read_bytes() == (tmp_path / "full.jar").read_bytes()
+        with zipfile.ZipFile(jar_path) as archive:
+            assert archive.read("cards.json") == b'{"cards": {"Strike": {}}}'
+
+    def test_rewriting_the_same_entries_yields_identical_bytes(self, tmp_path: Path) -> None:
+        root = _tree(tmp_path / "classes")
+        jar_path = tmp_path / "mod.jar"
+
+        def entries() -> list[JarWriter.Entry]:
+            manifest = JarWriter.Entry(JarWriter.MANIFEST_NAME, data=b"Manifest-Version: 1.0\n")
+            return [manifest, *JarWriter.directory_entries(root)]
+
+        JarWriter().write(jar_path, entries())
+        first = jar_path.read_bytes()
+        # A clean rebuild rewrites unchanged files; reused entries keep the dates they were packaged with.
+        os.utime(root / "cards.json", (1_700_000_000, 1_700_000_000))
+        summary = JarWriter().write(jar_path, entries(), previous=jar_path)
+        assert summary.reused == 4
+        assert jar_path.read_bytes() == first
+        with zipfile.ZipFile(jar_path) as archive:
+            assert archive.getinfo(JarWriter.MANIFEST_NAME).date_time == (1980, 1, 1, 0, 0, 0)
+
+
+class TestJarReader:
+    """Validate central directory parsing."""
+
+    def test_reads_members_without_extracting(self, tmp_path: Path) -> None:
+        root = _tree(tmp_path / "classes")
+        JarWriter().write(tmp_path / "mod.jar", JarWriter.directory_entries(root))
+        members = JarReader(tmp_path / "mod.jar").members()
+        assert list(members) == ["art.png", "cards.json", "com/buddy/Card.class"]
+        with zipfile.ZipFile(tmp_path / "mod.jar") as archive:
+            for info in archive.infolist():
+                assert members[info.filename].crc == info.CRC
+                assert members[info.filename].compressed_size == info.compress_size
+
+    def test_rejects_non_archives(self, tmp_path: Path) -> None:
+        bogus = tmp_path / "bogus.jar"
+        bogus.write_bytes(b"definitely not a zip")
+        with pytest.raises(JarReader.FormatError):
+            JarReader(bogus).members()
+
+
+class TestDeterministicJars:
+    """Validate reproducible output and central-directory diffs."""
+
+    def test_deterministic_mode_ignores_mtimes_and_input_order(self, tmp_path: Path) -> None:
+        root = _tree(tmp_path / "classes")
+        entries = JarWriter.directory_entries(root)
+        JarWriter(deterministic=True).write(tmp_path / "first.jar", entries)
+        os.utime(root / "cards.json", (1_700_000_000, 1_700_000_000))
+        (root / "art.png").chmod(0o600)
+        JarWriter(deterministic=True).write(tmp_path / "second.jar", reversed(JarWriter.directory_entries(root)))
+        assert (tmp_path / "first.jar").read_bytes() == (tmp_path / "second.jar").read_bytes()
+        with zipfile.ZipFile(tmp_path / "first.jar") as archive:
+            assert archive.namelist() == sorted(archive.namelist())
+            assert {info.date_time for info in archive.infolist()} == {(1980, 1, 1, 0, 0, 0)}
+
+    def test_diff_reports_content_and_metadata_changes(self, tmp_path: Path) -> None:
+        root = _tree(tmp_path / "classes")
+        JarWriter().write(tmp_path / "left.jar", JarWriter.directory_entries(root))
+        (root / "cards.json").write_text("{}", encoding="utf-8")
+        (root / "extra.txt").write_text("new", encoding="utf-8")
+        os.utime(root / "art.png", (1_000_000_000, 1_000_000_000))
+        JarWriter().write(tmp_path / "right.jar", JarWriter.directory_entries(root))
+        result = JarDiff.compare(tmp_path / "left.jar", tmp_path / "right.jar")
+        assert result.added == ["extra.txt"]
+        assert result.changed == ["cards.json"]
+        assert result.metadata_changed == ["art.png"]
+        assert result.unchanged == 2
+        assert not result.identical
+        assert JarDiff.compare(tmp_path / "left.jar", tmp_path / "left.jar").identical
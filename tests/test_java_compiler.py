@@ -0,0 +1,136 @@
+"""Tests for the Java compiler service."""
+from __future__ import annotations
+
+import os
+import sys
+import textwrap
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from javacompiler import JAVA_COMPILER_SERVICE, JavaCompilerService
+
+
+def _fake_javac(directory: Path) -> str:
+    """Write a javac stand-in that "compiles" each source by copying it to ``<package>/<Name>.class``."""
+
+    script = directory / "javac"
+    script.write_text(
+        f"#!{sys.executable}\n"
+        + textwrap.dedent(
+            """
+            import re, sys
+            from pathlib import Path
+            args = sys.argv[1:]
+            if "--help" in args or "-version" in args:
+                print("fake javac --release")
+                sys.exit(0)
+            output = Path(args[args.index("-d") + 1])
+            argfile = next(arg for arg in args if arg.startswith("@"))[1:]
+            for line in Path(argfile).read_text(encoding="utf-8").splitlines():
+                source = Path(line.strip().strip('"'))
+                text = source.read_text(encoding="utf-8")
+                package = re.search(r"package ([\\w.]+);", text).group(1)
+                target = output / package.replace(".", "/") / (source.stem + ".class")
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_text(text, encoding="utf-8")
+            """
+        ),
+        encoding="utf-8",
+    )
+    script.chmod(0o755)
+    return str(script)
+
+
+def _hanging_javac(directory: Path) -> str:
+    """Write a javac stand-in that answers the probes but never finishes compiling."""
+
+    script = directory / "javac"
+    script.write_text(
+        f"#!{sys.executable}\n"
+        "import sys, time\n"
+        "if '--help' in sys.argv or '-version' in sys.argv:\n"
+        "    sys.exit(0)\n"
+        "time.sleep(60)\n",
+        encoding="utf-8",
+    )
+    script.chmod(0o755)
+    return str(script)
+
+
+class TestJavaCompilerService:
+    """Validate backend selection and diagnostic parsing."""
+
+    def test_parses_javac_diagnostics(self) -> None:
+        output = "\n".join(
+            [
+                "/tmp/src/com/buddy/BuddyMod.java:12: error: cannot find symbol",
+                "        BaseMod.addCard(new MissingCard());",
+                "                            ^",
+                "  symbol:   class MissingCard",
+                "warning: [options] bootstrap class path not set in conjunction with -source 8",
+                "1 error",
+                "1 warning",
+            ]
+        )
+        diagnostics = JavaCompilerService.SubprocessBackend.parse_diagnostics(output)
+        assert len(diagnostics) == 2
+        error, warning = diagnostics
+        assert error.kind == "ERROR"
+        assert error.source == "/tmp/src/com/buddy/BuddyMod.java"
+        assert error.line == 12
+        assert error.column == 29
+        assert error.message == "cannot find symbol"
+        assert warning.kind == "WARNING"
+        assert warning.source is None
+        assert error.format() == "/tmp/src/com/buddy/BuddyMod.java:12:29: error: cannot find symbol"
+
+    def test_unknown_backend_is_rejected(self, tmp_path: Path) -> None:
+        request = JavaCompilerService.CompileRequest(sources=[], classpath=[], output_dir=tmp_path)
+        with pytest.raises(JavaCompilerService.CompilerUnavailableError):
+            JAVA_COMPILER_SERVICE.compile(request, "missing-backend")
+
+    def test_subprocess_backend_requires_javac(self, tmp_path: Path) -> None:
+        request = JavaCompilerService.CompileRequest(sources=[], classpath=[], output_dir=tmp_path)
+        with pytest.raises(JavaCompilerService.CompilerUnavailableError):
+            JAVA_COMPILER_SERVICE.compile(request, JavaCompilerService.SUBPROCESS)
+
+    @pytest.mark.skipif(os.name == "nt", reason="the fake javac relies on a shebang line")
+    def test_subprocess_backend_compiles_in_memory_sources(self, tmp_path: Path) -> None:
+        request = JavaCompilerService.CompileRequest(
+            sources=[],
+            classpath=[],
+            output_dir=None,
+            javac=_fake_javac(tmp_path),
+            source_texts={"com/buddy/BuddyMod.java": "package com.buddy;\npublic class BuddyMod {}\n"},
+        )
+        result = JAVA_COMPILER_SERVICE.compile(request, JavaCompilerService.SUBPROCESS)
+        assert result.success
+        assert result.classes == {"com/buddy/BuddyMod.class": b"package com.buddy;\npublic class BuddyMod {}\n"}
+        assert not any(tmp_path.rglob("*.class"))
+
+    @pytest.mark.skipif(os.name == "nt", reason="the fake javac relies on a shebang line")
+    def test_subprocess_backend_stops_javac_on_timeout_and_cancel(self, tmp_path: Path) -> None:
+        request = JavaCompilerService.CompileRequest(
+            sources=[tmp_path / "Mod.java"],
+            classpath=[],
+            output_dir=tmp_path / "classes",
+            javac=_hanging_javac(tmp_path),
+            timeout=0.3,
+        )
+        started = time.perf_counter()
+        with pytest.raises(JavaCompilerService.CompileCancelledError) as timed_out:
+            JAVA_COMPILER_SERVICE.compile(request, JavaCompilerService.SUBPROCESS)
+        assert timed_out.value.timed_out
+
+        cancel = threading.Event()
+        threading.Timer(0.3, cancel.set).start()
+        request.timeout, request.cancel_event = None, cancel
+        with pytest.raises(JavaCompilerService.CompileCancelledError) as cancelled:
+            JAVA_COMPILER_SERVICE.compile(request, JavaCompilerService.SUBPROCESS)
+        assert not cancelled.value.timed_out
+        assert time.perf_counter() - started < 10
+        with pytest.raises(JavaCompilerService.CompileCancelledError):
+            JAVA_COMPILER_SERVICE.compile(request, JavaCompilerService.SUBPROCESS)
@@ -0,0 +1,76 @@
+"""Tests for the keyword usage index."""
+from __future__ import annotations
+
+import random
+import re
+
+from keywordindex import KeywordIndex
+from modorchestrator import ModOrchestrator
+
+
+def _card(card_id: str, description: str, upgrade_description: str = "") -> ModOrchestrator.CardDefinition:
+    return ModOrchestrator.CardDefinition(
+        card_id=card_id,
+        name=card_id,
+        description=description,
+        upgrade_description=upgrade_description,
+        card_type="SKILL",
+        card_color="RED",
+        rarity="COMMON",
+        target="SELF",
+        cost=1,
+    )
+
+
+class TestKeywordIndex:
+    """Validate usage counts, orphans, undefined references and incremental updates."""
+
+    def test_usage_orphans_and_undefined_references(self) -> None:
+        keywords = [
+            ModOrchestrator.KeywordDefinition("Burn", ["burn", "burns"], "Lose HP."),
+            ModOrchestrator.KeywordDefinition("Burn Out", ["burn out"], "Exhaust."),
+            ModOrchestrator.KeywordDefinition("Chill", ["chill"], "Cold."),
+            ModOrchestrator.KeywordDefinition("Spark", ["spark"], "Zap."),
+        ]
+        index = KeywordIndex(
+            keywords,
+            [
+                _card("Ember", "Apply 3 Burn. Burnt cards don't count.", "Apply 5 mymod:burn."),
+                _card("Flare", "BURN OUT. Gain mymod:shield.", "Burns twice."),
+                _card("Frost", "Apply 1 Chill. chills are ignored."),
+            ],
+        )
+        report = index.report()
+        assert report.usage == {"Burn": 4, "Burn Out": 1, "Chill": 1, "Spark": 0}
+        assert report.cards["Burn"] == ["Ember", "Flare"]
+        assert report.orphans == ["Spark"]
+        assert report.undefined == {"mymod:shield": ["Flare"]}
+        assert index.scan("x burn out") == [(2, "Burn"), (2, "Burn Out")]
+
+        index.update_card(_card("Frost", "Apply 1 Spark."))
+        index.update_card(_card("Volt", "Spark and mymod:static."))
+        assert index.remove_card("Ember")
+        assert not index.remove_card("Ember")
+        assert index.usage("Burn") == 2
+        assert index.usage("Spark") == 2
+        assert index.orphans() == ["Chill"]
+        assert index.cards_using("Spark") == ["Frost", "Volt"]
+        assert index.undefined() == {"mymod:shield": ["Flare"], "mymod:static": ["Volt"]}
+
+        index.set_keywords(keywords + [ModOrchestrator.KeywordDefinition("Static", ["static"], "Stays.")])
+        assert index.usage("Static") == 1
+        assert index.undefined() == {"mymod:shield": ["Flare"]}
+
+    def test_automaton_matches_a_naive_word_scan(self) -> None:
+        generator = random.Random(7)
+        names = sorted({"".join(generator.choice("abc") for _ in range(generator.randint(1, 4))) for _ in range(40)})
+        keywords = [ModOrchestrator.KeywordDefinition(name.upper(), [name], "") for name in names]
+        index = KeywordIndex(keywords)
+        for _ in range(50):
+            text = " ".join("".join(generator.choice("abc") for _ in range(generator.randint(1, 5))) for _ in range(20))
+            expected = sorted(
+                (match.start(), name.upper())
+                for name in names
+                for match in re.finditer(rf"(?<!\w)(?={re.escape(name)}(?!\w))", text)
+            )
+            assert sorted(index.scan(text)) == expected
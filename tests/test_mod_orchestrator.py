@@ -3,15 +3,22 @@ from __future__ import annotations
 
 import json
 import os
+import struct
+import threading
 import urllib.request
 import zipfile
 from pathlib import Path
+from typing import Iterator
 
 import jpype
 import pytest
 
+from artifactcache import ArtifactCache
+from conftest import make_project
+from javacompiler import JAVA_COMPILER_SERVICE, JavaCompilerService
 from logic import APPLICATION_LOGIC
 from modorchestrator import MOD_ORCHESTRATOR, ModOrchestrator
+from plugin_manager import PluginManager
 from scripts.create_fake_desktop_jar import create_fake_desktop_jar
 
 BASEMOD_URL = "https://github.com/daviscook477/BaseMod/releases/download/v5.5.0/BaseMod.jar"
@@ -55,6 +62,42 @@ def restore_runtime_config() -> None:
     APPLICATION_LOGIC.update_configuration(**original)
 
 
+class StubCompiler:
+    """Compiler backend that writes a placeholder class file for every source without running javac."""
+
+    def __init__(self) -> None:
+        self.requests: list[JavaCompilerService.CompileRequest] = []
+
+    def version(self, javac: str = "") -> str:
+        return "stub"
+
+    def compile(self, request: JavaCompilerService.CompileRequest) -> JavaCompilerService.CompileResult:
+        self.requests.append(request)
+        for source in request.sources:
+            (request.output_dir / f"{source.stem}.class").write_bytes(b"\xca\xfe\xba\xbe")
+        return JavaCompilerService.CompileResult(success=True, backend="stub")
+
+
+@pytest.fixture()
+def stub_compiler(restore_runtime_config: None) -> Iterator[StubCompiler]:
+    """Register ``StubCompiler`` as the "stub" backend with an empty dependency classpath."""
+
+    APPLICATION_LOGIC.update_configuration(
+        java_home="",
+        modthespire_jar="",
+        basemod_path="",
+        stslib_path="",
+        actlikeit_path="",
+        desktop_jar_path="",
+    )
+    compiler = StubCompiler()
+    JAVA_COMPILER_SERVICE.register_backend("stub", compiler)
+    try:
+        yield compiler
+    finally:
+        JAVA_COMPILER_SERVICE._backends.pop("stub")  # noqa: SLF001
+
+
 def _write_card_image(path: Path) -> None:
     """Persist a minimal transparent PNG used for card registration."""
 
@@ -67,9 +110,414 @@ def _write_card_image(path: Path) -> None:
     path.write_bytes(png_bytes)
 
 
+def _configure_dependencies(dependency_bundle: dict[str, Path]) -> None:
+    """Point the runtime configuration at the cached dependency jars."""
+
+    APPLICATION_LOGIC.update_configuration(
+        java_home="",
+        modthespire_jar=str(dependency_bundle["modthespire"]),
+        basemod_path=str(dependency_bundle["basemod"]),
+        stslib_path="",
+        actlikeit_path="",
+        desktop_jar_path=str(dependency_bundle["desktop"]),
+    )
+
+
 class TestModOrchestrator:
     """Validate that the orchestrator produces runnable assets."""
 
+    def test_card_source_matches_reference_layout(self) -> None:
+        project = make_project("layoutmod", "com.buddy.layout", 1)
+        card = project.cards[0]
+        card.upgrade_damage = 3
+        expected = "\n".join(
+            [
+                "package com.buddy.layout.cards;",
+                "",
+                "import basemod.abstracts.CustomCard;",
+                "import com.megacrit.cardcrawl.actions.AbstractGameAction;",
+                "import com.megacrit.cardcrawl.actions.common.DamageAction;",
+                "import com.megacrit.cardcrawl.actions.common.GainBlockAction;",
+                "import com.megacrit.cardcrawl.cards.AbstractCard;",
+                "import com.megacrit.cardcrawl.cards.DamageInfo;",
+                "import com.megacrit.cardcrawl.characters.AbstractPlayer;",
+                "import com.megacrit.cardcrawl.monsters.AbstractMonster;",
+                "",
+                "public class Card0Card extends CustomCard {",
+                '    public static final String ID = "layoutmod:Card0";',
+                "    private static final int COST = 1;",
+                "    private static final int DAMAGE = 6;",
+                "    private static final int BLOCK = 0;",
+                "    private static final int MAGIC = 0;",
+                "",
+                "    public Card0Card() {",
+                "        super(",
+                "            ID,",
+                '            "Card 0",',
+                '            "layoutmodResources/images/cards/Card0.png",',
+                "            COST,",
+                '            "Deal damage.",',
+                "            CardType.ATTACK,",
+                "            CardColor.COLORLESS,",
+                "            CardRarity.COMMON,",
+                "            CardTarget.ENEMY",
+                "        );",
+                "        baseDamage = DAMAGE;",
+                "        baseBlock = BLOCK;",
+                "        baseMagicNumber = MAGIC;",
+                "        magicNumber = baseMagicNumber;",
+                "    }",
+                "",
+                "    @Override",
+                "    public void use(AbstractPlayer p, AbstractMonster m) {",
+                "addToBot(new DamageAction(m, new DamageInfo(p, this.damage, DamageInfo.DamageType.NORMAL),"
+                " AbstractGameAction.AttackEffect.SLASH_HORIZONTAL));",
+                "    }",
+                "",
+                "    @Override",
+                "    public void upgrade() {",
+                "        if (!upgraded) {",
+                "            upgradeName();",
+                "upgradeDamage(3);",
+                "        }",
+                "    }",
+                "",
+                "    @Override",
+                "    public AbstractCard makeCopy() {",
+                "        return new Card0Card();",
+                "    }",
+                "}",
+                "",
+            ]
+        )
+        assert MOD_ORCHESTRATOR._render_card_source(project, card) == expected  # noqa: SLF001
+
+    def test_identical_card_art_is_staged_once(self, tmp_path: Path) -> None:
+        project = make_project("artmod", "com.buddy.art", 3)
+        shared_image = tmp_path / "art" / "shared.png"
+        _write_card_image(shared_image)
+        unique_image = tmp_path / "art" / "unique.png"
+        unique_image.write_bytes(shared_image.read_bytes() + b"\x00")
+        project.cards[0].image_path = shared_image
+        project.cards[1].image_path = shared_image
+        project.cards[2].image_path = unique_image
+
+        def stage() -> ModOrchestrator.BuildContext:
+            context = ModOrchestrator.BuildContext(
+                project=project,
+                project_root=tmp_path / "out" / "artmod",
+                options=ModOrchestrator.BuildOptions(),
+                previous_manifest=ModOrchestrator.BuildManifest(),
+            )
+            MOD_ORCHESTRATOR._copy_assets(context)  # noqa: SLF001
+            MOD_ORCHESTRATOR._write_card_classes(context)  # noqa: SLF001
+            return context
+
+        context = stage()
+        card_dir = context.resource_root / "artmodResources" / "images" / "cards"
+        assert sorted(path.name for path in card_dir.iterdir()) == ["Card0.png", "Card2.png"]
+        assert context.image_paths == {"Card1": "artmodResources/images/cards/Card0.png"}
+        assert context.metrics["assets_deduplicated"] == 1
+        card_source = context.java_root / "com" / "buddy" / "art" / "cards" / "Card1Card.java"
+        assert '"artmodResources/images/cards/Card0.png"' in card_source.read_text(encoding="utf-8")
+
+        context = stage()
+        assert context.metrics["assets_skipped"] == 2
+        assert "assets_copied" not in context.metrics
+
+    def test_packed_card_art_loads_from_atlas(self, tmp_path: Path) -> None:
+        image_module = pytest.importorskip("PIL.Image")
+        project = make_project("atlasmod", "com.buddy.atlas", 2)
+        for index, card in enumerate(project.cards):
+            card.image_path = tmp_path / "art" / f"{index}.png"
+            card.image_path.parent.mkdir(parents=True, exist_ok=True)
+            image_module.new("RGBA", (250, 190), (index, 0, 0, 255)).save(card.image_path, format="PNG")
+        context = ModOrchestrator.BuildContext(
+            project=project,
+            project_root=tmp_path / "out" / "atlasmod",
+            options=ModOrchestrator.BuildOptions(pack_card_atlas=True),
+            previous_manifest=ModOrchestrator.BuildManifest(),
+        )
+        MOD_ORCHESTRATOR._copy_assets(context)  # noqa: SLF001
+        MOD_ORCHESTRATOR._write_card_classes(context)  # noqa: SLF001
+
+        atlas_dir = context.resource_root / "atlasmodResources" / "images" / "cards" / "atlas"
+        assert sorted(path.name for path in atlas_dir.parent.iterdir()) == ["atlas"]
+        assert sorted(path.name for path in atlas_dir.iterdir()) == ["cards.atlas", "cards.png"]
+        atlas_text = (atlas_dir / "cards.atlas").read_text(encoding="utf-8")
+        assert "atlasmodResources/images/cards/Card1\n" in atlas_text
+        cards_dir = context.java_root / "com" / "buddy" / "atlas" / "cards"
+        helper = (cards_dir / "CardAtlas.java").read_text(encoding="utf-8")
+        assert '"atlasmodResources/images/cards/atlas/cards.atlas"' in helper
+        card_source = (cards_dir / "Card0Card.java").read_text(encoding="utf-8")
+        override = "        return new Card0Card();\n    }\n\n    @Override\n    public void loadCardImage(String img) {\n"
+        assert override in card_source
+        assert card_source.endswith('CustomCard.class, "portrait", region);\n    }\n}\n')
+
+    def test_in_memory_staging_leaves_build_tree_untouched(self, tmp_path: Path) -> None:
+        project = make_project("memmod", "com.buddy.mem", 2)
+        image_path = tmp_path / "art" / "strike.png"
+        _write_card_image(image_path)
+        project.cards[0].image_path = image_path
+        context = ModOrchestrator.BuildContext(
+            project=project,
+            project_root=tmp_path / "out" / "memmod",
+            options=ModOrchestrator.BuildOptions(in_memory=True),
+            previous_manifest=ModOrchestrator.BuildManifest(),
+            memory={},
+        )
+        MOD_ORCHESTRATOR._copy_assets(context)  # noqa: SLF001
+        MOD_ORCHESTRATOR._write_card_classes(context)  # noqa: SLF001
+
+        assert not context.project_root.exists()
+        assert context.memory["src/main/resources/memmodResources/images/cards/Card0.png"] == image_path
+        card_key = "src/main/java/com/buddy/mem/cards/Card1Card.java"
+        assert b"public class Card1Card" in context.memory[card_key]
+        assert set(context.manifest.entries) == set(context.memory)
+        assert context.profiler.report().files_written == len(context.memory)
+
+        result = ModOrchestrator.BuildResult(
+            jar_path=context.project_root / "build" / "memmod.jar",
+            project_root=context.project_root,
+            files=dict(context.memory),
+        )
+        written = result.export_tree(tmp_path / "export", prefix="src/main/java/")
+        assert [path.name for path in written] == ["Card0Card.java", "Card1Card.java"]
+        assert (tmp_path / "export" / card_key).read_bytes() == context.memory[card_key]
+
+    def test_large_projects_register_cards_through_helpers(self, tmp_path: Path) -> None:
+        project = make_project("bigmod", "com.buddy.big", 5)
+
+        def entry_sources(**options: object) -> dict[str, str]:
+            context = ModOrchestrator.BuildContext(
+                project=project,
+                project_root=tmp_path / "out" / str(options.get("card_registration", "auto")),
+                options=ModOrchestrator.BuildOptions(**options),
+                previous_manifest=ModOrchestrator.BuildManifest(),
+            )
+            MOD_ORCHESTRATOR._write_entry_class(context)  # noqa: SLF001
+            package_dir = context.java_root / "com" / "buddy" / "big"
+            return {path.name: path.read_text(encoding="utf-8") for path in package_dir.iterdir()}
+
+        assert list(entry_sources()) == ["GeneratedMod.java"]
+        assert "BaseMod.addCard(new com.buddy.big.cards.Card4Card());" in entry_sources()["GeneratedMod.java"]
+
+        chunked = entry_sources(registration_chunk_size=2)
+        assert sorted(chunked) == [
+            "GeneratedMod.java",
+            "GeneratedModCards0.java",
+            "GeneratedModCards1.java",
+            "GeneratedModCards2.java",
+        ]
+        assert "GeneratedModCards2.register();" in chunked["GeneratedMod.java"]
+        assert "addCard" not in chunked["GeneratedMod.java"]
+        assert chunked["GeneratedModCards2.java"].count("BaseMod.addCard") == 1
+        assert "        BaseMod.addCard(new com.buddy.big.cards.Card0Card());\n" in chunked["GeneratedModCards0.java"]
+
+        tabled = entry_sources(card_registration="table")
+        assert sorted(tabled) == ["GeneratedMod.java", "GeneratedModCardTable.java"]
+        assert '"/bigmodResources/registration/cards.txt"' in tabled["GeneratedModCardTable.java"]
+        table = tmp_path / "out" / "table" / "src" / "main" / "resources" / "bigmodResources" / "registration"
+        assert (table / "cards.txt").read_text(encoding="utf-8").splitlines()[:2] == ["Card0Card", "Card1Card"]
+        with pytest.raises(ModOrchestrator.SpecificationError):
+            entry_sources(card_registration="sideways")
+
+    def test_table_mode_emits_one_card_class_and_a_stats_table(self, tmp_path: Path) -> None:
+        project = make_project("tablemod", "com.buddy.table", 3)
+        project.cards[1].name = "Tëst Card"
+        context = ModOrchestrator.BuildContext(
+            project=project,
+            project_root=tmp_path / "out" / "tablemod",
+            options=ModOrchestrator.BuildOptions(card_implementation="table"),
+            previous_manifest=ModOrchestrator.BuildManifest(),
+        )
+        MOD_ORCHESTRATOR._write_entry_class(context)  # noqa: SLF001
+        MOD_ORCHESTRATOR._write_card_classes(context)  # noqa: SLF001
+
+        cards_dir = context.java_root / "com" / "buddy" / "table" / "cards"
+        assert sorted(path.name for path in cards_dir.iterdir()) == ["CardTable.java", "TableCard.java"]
+        entry = (context.java_root / "com" / "buddy" / "table" / "GeneratedMod.java").read_text(encoding="utf-8")
+        assert "com.buddy.table.cards.CardTable.registerAll();" in entry
+        assert "return CardTable.create(data.id);" in (cards_dir / "TableCard.java").read_text(encoding="utf-8")
+
+        table = (context.resource_root / "tablemodResources" / "cards" / "cards.bin").read_bytes()
+        magic, version, count = struct.unpack_from(">iii", table)
+        assert (magic, version, count) == (ModOrchestrator.CARD_TABLE_MAGIC, ModOrchestrator.CARD_TABLE_VERSION, 3)
+        offset = 12
+        rows = []
+        for _ in range(count):
+            strings = []
+            for _ in range(8):
+                (length,) = struct.unpack_from(">i", table, offset)
+                strings.append(table[offset + 4 : offset + 4 + length].decode("utf-8"))
+                offset += 4 + length
+            rows.append((strings, struct.unpack_from(">7i", table, offset)))
+            offset += 28
+        assert offset == len(table)
+        assert rows[1][0][:2] == ["tablemod:Card1", "Tëst Card"]
+        assert rows[1][0][4:] == ["ATTACK", "COLORLESS", "COMMON", "ENEMY"]
+        assert rows[1][1] == (1, 6, 0, 0, 0, 0, 0)
+
+    def test_streamed_cards_match_list_based_outputs(self, tmp_path: Path) -> None:
+        image_path = tmp_path / "art" / "strike.png"
+        _write_card_image(image_path)
+
+        def stage(streamed: bool, **options: object) -> dict[str, bytes]:
+            project = make_project("streammod", "com.buddy.stream", 5)
+            project.cards[0].image_path = image_path
+            project.cards[3].image_path = image_path
+            project.translations = [ModOrchestrator.Translation("zhs", cards={"Card1": {"NAME": "卡一"}})]
+            if streamed:
+                project.card_stream, project.cards = iter(project.cards), []
+            context = ModOrchestrator.BuildContext(
+                project=project,
+                project_root=tmp_path / ("streamed" if streamed else "listed") / str(options),
+                options=ModOrchestrator.BuildOptions(codegen_chunk_size=2, deduplicate_assets=True, **options),
+                previous_manifest=ModOrchestrator.BuildManifest(),
+            )
+            MOD_ORCHESTRATOR._write_localization(context)  # noqa: SLF001
+            if streamed:
+                MOD_ORCHESTRATOR._stream_cards(context)  # noqa: SLF001
+                assert context.metrics["streamed_cards"] == 5
+            else:
+                MOD_ORCHESTRATOR._copy_assets(context)  # noqa: SLF001
+                MOD_ORCHESTRATOR._write_card_classes(context)  # noqa: SLF001
+            MOD_ORCHESTRATOR._write_entry_class(context)  # noqa: SLF001
+            assert context.metrics["assets_deduplicated"] == 1
+            assert not list(context.project_root.rglob("*.partial"))
+            return {
+                path.relative_to(context.project_root).as_posix(): path.read_bytes()
+                for path in context.project_root.rglob("*")
+                if path.is_file()
+            }
+
+        streamed = stage(True)
+        assert streamed == stage(False)
+        assert "src/main/java/com/buddy/stream/cards/Card4Card.java" in streamed
+        chinese = json.loads(streamed["src/main/resources/streammodResources/localization/zhs/cards.json"])
+        assert chinese["cards"]["Card1"]["NAME"] == "卡一"
+        assert stage(True, card_implementation="table") == stage(False, card_implementation="table")
+
+        project = make_project("streammod", "com.buddy.stream", 1)
+        project.card_stream = iter(project.cards)
+        with pytest.raises(ModOrchestrator.SpecificationError):
+            MOD_ORCHESTRATOR.build_project(project, tmp_path / "both")
+        duplicated = make_project("streammod", "com.buddy.stream", 2)
+        duplicated.cards[1].card_id = "Card0"
+        duplicated.card_stream, duplicated.cards = iter(duplicated.cards), []
+        context = ModOrchestrator.BuildContext(
+            project=duplicated,
+            project_root=tmp_path / "duplicated",
+            options=ModOrchestrator.BuildOptions(),
+            previous_manifest=ModOrchestrator.BuildManifest(),
+        )
+        with pytest.raises(ModOrchestrator.SpecificationError, match="Duplicate card id"):
+            MOD_ORCHESTRATOR._stream_cards(context)  # noqa: SLF001
+        assert not list(context.project_root.rglob("*.partial"))
+
+        waves = [[name for name, _ in wave] for wave in MOD_ORCHESTRATOR.plan_build(streaming=True)]
+        assert waves[:2] == [["metadata", "localization", "assets", "card_stream"], ["entry_class", "card_classes"]]
+
+    def test_translations_are_written_per_language_and_skipped_when_unchanged(self, tmp_path: Path) -> None:
+        project = make_project("langmod", "com.buddy.lang", 3)
+        project.keywords = [ModOrchestrator.KeywordDefinition("Burn", ["burn"], "Lose HP.")]
+        project.translations = [
+            ModOrchestrator.Translation("zhs", cards={"Card1": {"NAME": "卡一"}}, keywords={"Burn": {"NAMES": ["灼烧"]}}),
+            ModOrchestrator.Translation("fra", cards={"Card2": {"DESCRIPTION": "Inflige des dégâts."}}),
+        ]
+
+        def stage(previous: ModOrchestrator.BuildManifest, **options: object) -> ModOrchestrator.BuildContext:
+            context = ModOrchestrator.BuildContext(
+                project=project,
+                project_root=tmp_path / "out",
+                options=ModOrchestrator.BuildOptions(incremental=True, **options),
+                previous_manifest=previous,
+            )
+            MOD_ORCHESTRATOR._write_localization(context)  # noqa: SLF001
+            return context
+
+        first = stage(ModOrchestrator.BuildManifest())
+        localization = first.resource_root / "langmodResources" / "localization"
+        assert sorted(path.name for path in localization.iterdir()) == ["eng", "fra", "zhs"]
+        english = {
+            card.card_id: {
+                "NAME": card.name,
+                "DESCRIPTION": card.description,
+                "UPGRADE_DESCRIPTION": card.upgrade_description,
+            }
+            for card in project.cards
+        }
+        assert (localization / "eng" / "cards.json").read_bytes() == json.dumps({"cards": english}, indent=2).encode()
+        chinese = json.loads((localization / "zhs" / "cards.json").read_text(encoding="utf-8"))["cards"]
+        assert chinese["Card1"] == {**english["Card1"], "NAME": "卡一"}
+        assert chinese["Card0"] == english["Card0"]
+        keywords = json.loads((localization / "zhs" / "keywords.json").read_text(encoding="utf-8"))["keywords"]
+        assert keywords == [{"PROPER_NAME": "Burn", "NAMES": ["灼烧"], "DESCRIPTION": "Lose HP."}]
+
+        project.translations[1].cards["Card2"]["DESCRIPTION"] = "Inflige beaucoup de dégâts."
+        second = stage(first.manifest)
+        assert second.changed_outputs == {"src/main/resources/langmodResources/localization/fra/cards.json"}
+
+        compact = stage(second.manifest, compact_localization=True)
+        compact_text = (localization / "zhs" / "cards.json").read_text(encoding="utf-8")
+        assert json.loads(compact_text)["cards"] == chinese
+        assert '"NAME":"卡一"' in compact_text and "\n" not in compact_text
+        assert len(compact.changed_outputs) == 6
+
+        MOD_ORCHESTRATOR._write_entry_class(compact)  # noqa: SLF001
+        entry = (compact.java_root / "com" / "buddy" / "lang" / "GeneratedMod.java").read_text(encoding="utf-8")
+        assert 'java.util.Arrays.asList("eng", "zhs", "fra")' in entry
+        assert "com.megacrit.cardcrawl.core.Settings.language.name().toLowerCase()" in entry
+        assert '+ "/keywords.json").readString("UTF-8");' in entry
+        assert 'keyword.get("PROPER_NAME").getAsString()' in entry
+        assert "BaseMod.addKeyword(\"Burn\"" not in entry
+
+    def test_build_many_reports_every_project_without_aborting(
+        self, tmp_path: Path, stub_compiler: StubCompiler
+    ) -> None:
+        shared_image = tmp_path / "art" / "shared.png"
+        _write_card_image(shared_image)
+        projects = [make_project(f"variant{index}", "com.buddy.variant", 2) for index in range(2)]
+        for project in projects:
+            project.cards[0].image_path = shared_image
+        projects.append(make_project("variant0", "com.buddy.again", 1))
+        projects.append(make_project("Broken", "com.buddy.broken", 1))
+        options = ModOrchestrator.BuildOptions(compiler_backend="stub")
+        outcomes = MOD_ORCHESTRATOR.build_many(projects, tmp_path / "out", options=options, workers=1)
+        assert [outcome.mod_id for outcome in outcomes] == ["variant0", "variant1", "variant0", "Broken"]
+        assert [outcome.ok for outcome in outcomes] == [True, True, False, False]
+        assert all(outcome.result.jar_path.exists() for outcome in outcomes[:2])
+        assert "already builds mod 'variant0'" in outcomes[2].error
+        assert outcomes[3].error_type == "ValidationError"
+
+        # Worker processes only know the built-in backends, so both builds fail on their own.
+        pooled = MOD_ORCHESTRATOR.build_many(projects[:2], tmp_path / "pool", options=options, workers=2)
+        assert [(outcome.ok, outcome.error_type) for outcome in pooled] == [(False, "BuildError")] * 2
+        assert all("stub" in outcome.error for outcome in pooled)
+
+    def test_plugin_phases_join_the_build_plan(self) -> None:
+        waves = MOD_ORCHESTRATOR.plan_build()
+        assert [name for name, _ in waves[0]] == ["metadata", "localization", "assets", "entry_class"]
+        assert [[name for name, _ in wave] for wave in waves[1:]] == [["card_classes"], ["prune"], ["compile"]]
+
+        MOD_ORCHESTRATOR.register_build_phase(
+            "relics",
+            lambda context: MOD_ORCHESTRATOR.emit_output(context, "src/main/java/Relic.java", b"class Relic {}"),
+            requires=("metadata",),
+            description="Relic classes",
+        )
+        try:
+            waves = MOD_ORCHESTRATOR.plan_build()
+            assert ("relics", "Relic classes") in waves[1]
+            assert [name for name, _ in waves[-2]] == ["prune"]
+            with pytest.raises(ModOrchestrator.SpecificationError):
+                MOD_ORCHESTRATOR.register_build_phase("relics", lambda context: None)
+            with pytest.raises(ModOrchestrator.SpecificationError):
+                MOD_ORCHESTRATOR.register_build_phase("loop", lambda context: None, requires=("compile",))
+            assert "loop" not in [name for wave in MOD_ORCHESTRATOR.plan_build() for name, _ in wave]
+        finally:
+            MOD_ORCHESTRATOR.unregister_build_phase("relics")
+
     def test_builds_mod_and_exposes_classes(
         self,
         tmp_path: Path,
@@ -149,3 +597,210 @@ class TestModOrchestrator:
             assert entry_class is not None
         finally:
             jpype.shutdownJVM()
+
+    def test_incremental_build_rewrites_only_changed_outputs(
+        self,
+        tmp_path: Path,
+        dependency_bundle: dict[str, Path],
+        restore_runtime_config: None,
+    ) -> None:
+        output_dir = tmp_path / "build"
+        _configure_dependencies(dependency_bundle)
+        project = make_project("incrementalmod", "com.buddy.incremental", 3)
+        cards = list(project.cards)
+        options = ModOrchestrator.BuildOptions(incremental=True)
+
+        jar_path = MOD_ORCHESTRATOR.build_mod(project, output_dir, options=options)
+        classes_dir = output_dir / "incrementalmod" / "build" / "classes" / "com" / "buddy" / "incremental" / "cards"
+        untouched_mtime = (classes_dir / "Card0Card.class").stat().st_mtime_ns
+        jar_mtime = jar_path.stat().st_mtime_ns
+
+        assert MOD_ORCHESTRATOR.build_mod(project, output_dir, options=options) == jar_path
+        assert jar_path.stat().st_mtime_ns == jar_mtime
+
+        cards[1].description = "Deal a different amount of damage."
+        project.cards = cards[:2]
+        MOD_ORCHESTRATOR.build_mod(project, output_dir, options=options)
+        assert (classes_dir / "Card0Card.class").stat().st_mtime_ns == untouched_mtime
+        assert not (classes_dir / "Card2Card.class").exists()
+        with zipfile.ZipFile(jar_path, "r") as archive:
+            names = archive.namelist()
+        assert "com/buddy/incremental/cards/Card2Card.class" not in names
+        assert "com/buddy/incremental/cards/Card1Card.class" in names
+
+    def test_sharded_compile_produces_every_class(
+        self,
+        tmp_path: Path,
+        dependency_bundle: dict[str, Path],
+        restore_runtime_config: None,
+    ) -> None:
+        _configure_dependencies(dependency_bundle)
+        project = make_project("shardedmod", "com.buddy.sharded", 5)
+        options = ModOrchestrator.BuildOptions(sharded_compile=True, compile_shard_size=2, compile_workers=2)
+
+        jar_path = MOD_ORCHESTRATOR.build_mod(project, tmp_path / "build", options=options)
+
+        with zipfile.ZipFile(jar_path, "r") as archive:
+            names = set(archive.namelist())
+        assert "com/buddy/sharded/GeneratedMod.class" in names
+        for card in project.cards:
+            assert f"com/buddy/sharded/cards/{card.class_name()}.class" in names
+
+    def test_parallel_codegen_matches_serial_sources(self, tmp_path: Path, stub_compiler: StubCompiler) -> None:
+        project = make_project("codegenmod", "com.buddy.codegen", 9)
+        serial = MOD_ORCHESTRATOR.build_project(
+            project, tmp_path / "serial", options=ModOrchestrator.BuildOptions(compiler_backend="stub")
+        )
+        parallel_options = ModOrchestrator.BuildOptions(
+            compiler_backend="stub", parallel_codegen=True, codegen_chunk_size=2, codegen_workers=2
+        )
+        parallel = MOD_ORCHESTRATOR.build_project(project, tmp_path / "parallel", options=parallel_options)
+
+        def sources(result: ModOrchestrator.BuildResult) -> dict[str, bytes]:
+            root = result.project_root / "src"
+            return {path.relative_to(root).as_posix(): path.read_bytes() for path in root.rglob("*.java")}
+
+        assert len(sources(serial)) == 10
+        assert sources(parallel) == sources(serial)
+        for result in (serial, parallel):
+            assert result.metrics["card_classes"] == 9.0
+            assert result.metrics["cards_per_second"] > 0
+            assert "card_codegen_seconds" in result.metrics
+
+    def test_sharded_compile_resolves_packed_atlas_helper(
+        self,
+        tmp_path: Path,
+        dependency_bundle: dict[str, Path],
+        restore_runtime_config: None,
+    ) -> None:
+        image_module = pytest.importorskip("PIL.Image")
+        _configure_dependencies(dependency_bundle)
+        project = make_project("shardatlasmod", "com.buddy.shardatlas", 5)
+        for index, card in enumerate(project.cards):
+            card.image_path = tmp_path / "art" / f"{index}.png"
+            card.image_path.parent.mkdir(parents=True, exist_ok=True)
+            image_module.new("RGBA", (250, 190), (index, 0, 0, 255)).save(card.image_path, format="PNG")
+        options = ModOrchestrator.BuildOptions(
+            sharded_compile=True, compile_shard_size=2, compile_workers=2, pack_card_atlas=True
+        )
+
+        jar_path = MOD_ORCHESTRATOR.build_mod(project, tmp_path / "build", options=options)
+
+        with zipfile.ZipFile(jar_path, "r") as archive:
+            names = set(archive.namelist())
+        assert "com/buddy/shardatlas/cards/CardAtlas.class" in names
+        for card in project.cards:
+            assert f"com/buddy/shardatlas/cards/{card.class_name()}.class" in names
+
+    def test_sharded_compile_builds_card_helpers_first(self, tmp_path: Path, stub_compiler: StubCompiler) -> None:
+        project = make_project("shardtablemod", "com.buddy.shardtable", 3)
+        options = ModOrchestrator.BuildOptions(
+            compiler_backend="stub", card_implementation="table", sharded_compile=True, compile_shard_size=1
+        )
+
+        result = MOD_ORCHESTRATOR.build_project(project, tmp_path / "build", options=options)
+
+        classes_dir = str(result.project_root / "build" / "classes")
+        batches = [sorted(source.name for source in request.sources) for request in stub_compiler.requests]
+        # One-source shards used to split the helpers, which reference each other, across javac runs.
+        assert batches == [["CardTable.java", "TableCard.java"], ["GeneratedMod.java"]]
+        assert all(request.classpath[0] == classes_dir for request in stub_compiler.requests)
+
+    def test_artifact_cache_returns_identical_jar(
+        self,
+        tmp_path: Path,
+        dependency_bundle: dict[str, Path],
+        restore_runtime_config: None,
+    ) -> None:
+        _configure_dependencies(dependency_bundle)
+        APPLICATION_LOGIC.update_configuration(artifact_cache_dir=str(tmp_path / "artifacts"))
+        project = make_project("cachedmod", "com.buddy.cached", 2)
+        options = ModOrchestrator.BuildOptions(use_artifact_cache=True)
+
+        first = MOD_ORCHESTRATOR.build_mod(project, tmp_path / "first", options=options)
+        second = MOD_ORCHESTRATOR.build_mod(project, tmp_path / "second", options=options)
+
+        assert second.read_bytes() == first.read_bytes()
+        assert not (tmp_path / "second" / "cachedmod" / "src" / "main" / "java" / "com").exists()
+        assert len(MOD_ORCHESTRATOR.artifact_cache().entries()) == 1
+
+    def test_artifact_cache_failures_do_not_fail_the_build(
+        self, tmp_path: Path, stub_compiler: StubCompiler, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        APPLICATION_LOGIC.update_configuration(artifact_cache_dir=str(tmp_path / "artifacts"))
+        project = make_project("uncachedmod", "com.buddy.uncached", 1)
+        options = ModOrchestrator.BuildOptions(compiler_backend="stub", use_artifact_cache=True)
+
+        def refuse(*args: object, **kwargs: object) -> Path:
+            raise ArtifactCache.CacheError("cache volume is read-only")
+
+        monkeypatch.setattr(ArtifactCache, "store", refuse)
+        result = MOD_ORCHESTRATOR.build_project(project, tmp_path / "build", options=options)
+
+        assert result.jar_path.exists()
+        assert not result.cache_hit
+        assert MOD_ORCHESTRATOR.artifact_cache().entries() == []
+
+    def test_artifact_evicted_after_lookup_counts_as_a_miss(
+        self, tmp_path: Path, stub_compiler: StubCompiler, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        APPLICATION_LOGIC.update_configuration(artifact_cache_dir=str(tmp_path / "artifacts"))
+        project = make_project("evictedmod", "com.buddy.evicted", 1)
+        options = ModOrchestrator.BuildOptions(compiler_backend="stub", use_artifact_cache=True)
+        MOD_ORCHESTRATOR.build_project(project, tmp_path / "first", options=options)
+        lookup = ArtifactCache.lookup
+
+        def lookup_then_evict(cache: ArtifactCache, key: str) -> Path | None:
+            found = lookup(cache, key)
+            cache.remove(key)
+            return found
+
+        monkeypatch.setattr(ArtifactCache, "lookup", lookup_then_evict)
+        compiles = len(stub_compiler.requests)
+        result = MOD_ORCHESTRATOR.build_project(project, tmp_path / "second", options=options)
+
+        assert not result.cache_hit
+        assert result.jar_path.exists()
+        assert len(stub_compiler.requests) > compiles
+
+    def test_clean_rebuild_reuses_entries_of_the_previous_jar(
+        self, tmp_path: Path, stub_compiler: StubCompiler
+    ) -> None:
+        completed: list[dict[str, float]] = []
+
+        class Listener:
+            def handle_event(self, event_name: str, payload: dict) -> None:
+                completed.append(payload["metrics"])
+
+        plugins = PluginManager()
+        plugins.register_event_listener("mod.build.completed", Listener())
+        orchestrator = ModOrchestrator(APPLICATION_LOGIC, plugins)
+        project = make_project("rebuiltmod", "com.buddy.rebuilt", 2)
+        options = ModOrchestrator.BuildOptions(compiler_backend="stub")
+        first = orchestrator.build_mod(project, tmp_path, options=options).read_bytes()
+
+        jar_path = orchestrator.build_mod(project, tmp_path, options=options)
+
+        assert completed[1]["jar_reused_entries"] == completed[1]["jar_entries"] > 0
+        assert jar_path.read_bytes() == first
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["rebuiltmod"]
+
+    def test_phase_events_are_dispatched_on_the_build_thread(self, tmp_path: Path, stub_compiler: StubCompiler) -> None:
+        events: list[tuple[str, int]] = []
+        phase_threads: set[int] = set()
+
+        class Listener:
+            def handle_event(self, event_name: str, payload: dict) -> None:
+                events.append((payload["phase"], threading.get_ident()))
+
+        plugins = PluginManager()
+        plugins.register_event_listener("mod.build.phase", Listener())
+        orchestrator = ModOrchestrator(APPLICATION_LOGIC, plugins)
+        orchestrator.register_build_phase("probe", lambda context: phase_threads.add(threading.get_ident()))
+        options = ModOrchestrator.BuildOptions(compiler_backend="stub")
+
+        orchestrator.build_project(make_project("threadedmod", "com.buddy.threaded", 2), tmp_path, options=options)
+
+        assert threading.get_ident() not in phase_threads
+        assert {name for name, _ in events} >= {"metadata", "assets", "probe", "compile"}
+        assert {ident for _, ident in events} == {threading.get_ident()}
@@ -0,0 +1,116 @@
+"""Tests for single-pass project validation."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from modorchestrator import MOD_ORCHESTRATOR, ModOrchestrator
+from projectvalidator import ProjectValidator
+
+
+def _card(card_id: str, **overrides: object) -> ModOrchestrator.CardDefinition:
+    values: dict[str, object] = {
+        "card_id": card_id,
+        "name": card_id,
+        "description": "Deal damage.",
+        "upgrade_description": "Deal more damage.",
+        "card_type": "attack",
+        "card_color": "RED",
+        "rarity": "COMMON",
+        "target": "ENEMY",
+        "cost": 1,
+    }
+    values.update(overrides)
+    return ModOrchestrator.CardDefinition(**values)
+
+
+def _project(**overrides: object) -> ModOrchestrator.ModProject:
+    metadata = ModOrchestrator.ModMetadata(
+        mod_id="checkmod",
+        name="Check mod",
+        author="Best Bud",
+        version="1.0.0",
+        description="Validation",
+        package="com.buddy.check",
+        entry_class="CheckMod",
+    )
+    return ModOrchestrator.ModProject(metadata=metadata, **overrides)
+
+
+class TestProjectValidator:
+    """Validate that every violation is collected in one pass."""
+
+    def test_every_violation_is_reported_at_once(self, tmp_path: Path) -> None:
+        present = tmp_path / "art" / "present.png"
+        present.parent.mkdir()
+        present.write_bytes(b"png")
+        project = _project(
+            cards=[
+                _card("Strike", image_path=present),
+                _card("Strike"),
+                _card("strike-card", card_type="ATACK", image_path=tmp_path / "art" / "gone.png"),
+                _card("StrikeCard", rarity="LEGENDARY", target="everyone", cost=-3, base_damage=-1),
+                _card("!!!", card_color="not a colour"),
+            ],
+            keywords=[
+                ModOrchestrator.KeywordDefinition("Burn", ["burn", "scorch"], "Hot."),
+                ModOrchestrator.KeywordDefinition("Scorch", ["Scorch", "two words"], "Hotter."),
+            ],
+            assets=[
+                ModOrchestrator.AssetMapping(present, "checkmodResources/images/present.png"),
+                ModOrchestrator.AssetMapping(tmp_path / "missing" / "x.png", "../escape.png"),
+            ],
+            translations=[
+                ModOrchestrator.Translation("zhs", cards={"Strike": {"NAME": "打击"}, "Ghost": {"TITLE": "?"}}),
+                ModOrchestrator.Translation("french", keywords={"Burn": {"NAMES": ["brûlure"]}}),
+            ],
+        )
+        project.metadata.mod_id = "CheckMod"
+
+        report = ProjectValidator().validate(project)
+        found = {(violation.subject, violation.field) for violation in report.violations}
+        assert found == {
+            ("metadata", "mod_id"),
+            ("card 'Strike'", "card_id"),
+            ("card 'strike-card'", "card_type"),
+            ("card 'strike-card'", "image_path"),
+            ("card 'StrikeCard'", "card_id"),
+            ("card 'StrikeCard'", "rarity"),
+            ("card 'StrikeCard'", "target"),
+            ("card 'StrikeCard'", "cost"),
+            ("card 'StrikeCard'", "base_damage"),
+            ("card '!!!'", "card_id"),
+            ("card '!!!'", "card_color"),
+            ("keyword 'Scorch'", "names"),
+            (f"asset '{tmp_path / 'missing' / 'x.png'}'", "relative_path"),
+            (f"asset '{tmp_path / 'missing' / 'x.png'}'", "source"),
+            ("translation 'zhs'", "cards"),
+            ("translation 'french'", "language"),
+        }
+        assert report.items_checked == 11
+        assert "translation 'zhs'.cards: 'Ghost' has unknown string keys TITLE" in report.summary()
+        assert "generates class StrikeCardCard, which card 'strike-card' already uses" in report.summary()
+        assert ProjectValidator.missing_files([present, tmp_path / "art" / "gone.png"]) == {tmp_path / "art" / "gone.png"}
+
+        with pytest.raises(ModOrchestrator.ValidationError) as raised:
+            MOD_ORCHESTRATOR.build_project(project, tmp_path / "out")
+        assert len(raised.value.violations) == len(report.violations)
+        assert not (tmp_path / "out").exists()
+
+    def test_streamed_rows_are_validated_before_anything_is_kept(self, tmp_path: Path) -> None:
+        project = _project(card_stream=iter([_card("Strike"), _card("Defend", target="ME"), _card("Bash", cost="2")]))
+        assert MOD_ORCHESTRATOR.validate_project(project).ok
+        context = ModOrchestrator.BuildContext(
+            project=project,
+            project_root=tmp_path / "streamed",
+            options=ModOrchestrator.BuildOptions(),
+            previous_manifest=ModOrchestrator.BuildManifest(),
+        )
+        with pytest.raises(ModOrchestrator.ValidationError) as raised:
+            MOD_ORCHESTRATOR._stream_cards(context)  # noqa: SLF001
+        assert [str(violation) for violation in raised.value.violations] == [
+            "card 'Defend'.target: must be one of ALL, ALL_ENEMY, ENEMY, NONE, SELF, SELF_AND_ENEMY",
+            "card 'Bash'.cost: cost must be an integer of at least -2",
+        ]
+        assert not list(context.project_root.rglob("*.json*"))
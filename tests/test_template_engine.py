@@ -0,0 +1,41 @@
+"""Tests for the precompiled template engine."""
+from __future__ import annotations
+
+import pytest
+
+from plugin_manager import PluginManager
+from templateengine import TEMPLATE_ENGINE, TemplateEngine
+
+
+class TestTemplateEngine:
+    """Validate template parsing, rendering and plugin registration."""
+
+    def test_compiles_into_segments_and_slots(self) -> None:
+        template = TemplateEngine.compile(
+            """
+            public class ${name} {
+                int cost = ${cost}; // $$ literal
+            }
+            """
+        )
+        assert template.slots == ("name", "cost")
+        rendered = template.render({"name": "Strike", "cost": 1})
+        assert rendered == "public class Strike {\n    int cost = 1; // $ literal\n}\n"
+
+    def test_missing_slot_is_reported(self) -> None:
+        template = TemplateEngine.compile("${present} ${absent}", dedent=False)
+        with pytest.raises(TemplateEngine.TemplateError):
+            template.render({"present": "value"})
+
+    def test_malformed_placeholder_is_rejected(self) -> None:
+        with pytest.raises(TemplateEngine.TemplateError):
+            TemplateEngine.compile("value ${not closed", dedent=False)
+
+    def test_plugins_register_templates_through_the_registry(self) -> None:
+        engine = PluginManager.get_instance().get_symbol("templateengine.engine")
+        assert engine is TEMPLATE_ENGINE
+        engine.register_template("tests.relic", "public class ${name}Relic {}", kind="relic", replace=True)
+        assert "tests.relic" in engine.templates(kind="relic")
+        assert engine.render("tests.relic", {"name": "Buddy"}) == "public class BuddyRelic {}\n"
+        with pytest.raises(TemplateEngine.TemplateError):
+            engine.register_template("tests.relic", "duplicate", kind="relic")
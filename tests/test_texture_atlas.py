@@ -0,0 +1,63 @@
+"""Tests for texture atlas packing."""
+from __future__ import annotations
+
+from itertools import combinations
+from pathlib import Path
+
+import pytest
+
+from textureatlas import TextureAtlasPacker
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _images(directory: Path, count: int, size: tuple[int, int]) -> dict[str, Path]:
+    directory.mkdir(parents=True, exist_ok=True)
+    images: dict[str, Path] = {}
+    for index in range(count):
+        path = directory / f"card{index}.png"
+        Image.new("RGBA", size, (index * 10 % 256, 0, 0, 255)).save(path, format="PNG")
+        images[f"mod/cards/card{index}"] = path
+    return images
+
+
+class TestTextureAtlasPacker:
+    """Validate shelf packing, page splitting and the atlas description."""
+
+    def test_regions_never_overlap_and_stay_on_page(self, tmp_path: Path) -> None:
+        images = _images(tmp_path / "art", 12, (250, 190))
+        pages = TextureAtlasPacker(page_size=1024).layout(images, page_name="cards")
+        assert sum(len(page.regions) for page in pages) == 12
+        for page in pages:
+            for region in page.regions:
+                assert region.x + region.width <= page.width
+                assert region.y + region.height <= page.height
+            for first, second in combinations(page.regions, 2):
+                assert (
+                    first.x + first.width <= second.x
+                    or second.x + second.width <= first.x
+                    or first.y + first.height <= second.y
+                    or second.y + second.height <= first.y
+                )
+
+    def test_overflow_starts_new_pages(self, tmp_path: Path) -> None:
+        images = _images(tmp_path / "art", 10, (250, 190))
+        pages = TextureAtlasPacker(page_size=512).layout(images, page_name="cards")
+        assert [page.file_name for page in pages] == ["cards.png", "cards2.png", "cards3.png"]
+        rendered = TextureAtlasPacker(page_size=512).render_page(pages[0])
+        assert rendered.startswith(b"\x89PNG")
+
+    def test_atlas_text_lists_every_region(self, tmp_path: Path) -> None:
+        images = _images(tmp_path / "art", 2, (250, 190))
+        pages = TextureAtlasPacker().layout(images, page_name="cards")
+        text = TextureAtlasPacker.atlas_text(pages)
+        assert text.startswith("\ncards.png\nsize: 512,256\n")
+        assert "mod/cards/card0\n  rotate: false\n  xy: 0, 0\n  size: 250, 190\n" in text
+        assert "mod/cards/card1\n  rotate: false\n  xy: 252, 0\n" in text
+
+    def test_rejects_oversized_images_and_bad_page_sizes(self, tmp_path: Path) -> None:
+        images = _images(tmp_path / "art", 1, (600, 100))
+        with pytest.raises(TextureAtlasPacker.AtlasError):
+            TextureAtlasPacker(page_size=512).layout(images, page_name="cards")
+        with pytest.raises(TextureAtlasPacker.AtlasError):
+            TextureAtlasPacker(page_size=1000)
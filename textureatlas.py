@@ -0,0 +1,169 @@
+"""Shelf packing of card art into libGDX texture atlas pages."""
+from __future__ import annotations
+
+import io
+import logging
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Mapping, Tuple
+
+from plugin_manager import PluginManager
+
+
+class TextureAtlasPacker:
+    """Packs images into a few fixed-size pages and describes them in the libGDX ``.atlas`` format.
+
+    Images are sorted by height and laid out left to right on shelves; a shelf that does not
+    fit on the current page starts a new page. The last page is trimmed to the smallest
+    power-of-two size holding its shelves. Layouts depend only on image sizes and names, so
+    the same inputs always produce the same pages.
+    """
+
+    class AtlasError(Exception):
+        """Raised when images cannot be packed into atlas pages."""
+
+    class PillowUnavailableError(Exception):
+        """Raised when Pillow is required but not installed."""
+
+    @dataclass
+    class Region:
+        """Placement of one source image on an atlas page."""
+
+        name: str
+        source: Path
+        x: int
+        y: int
+        width: int
+        height: int
+
+    @dataclass
+    class Page:
+        """One atlas texture with the regions packed onto it."""
+
+        file_name: str
+        width: int
+        height: int
+        regions: List["TextureAtlasPacker.Region"] = field(default_factory=list)
+
+    def __init__(self, page_size: int = 2048, padding: int = 2) -> None:
+        if page_size <= 0 or page_size & (page_size - 1):
+            raise TextureAtlasPacker.AtlasError(f"Atlas page size must be a power of two, got {page_size}")
+        self._page_size = page_size
+        self._padding = padding
+        self._logger = logging.getLogger("stsm.texture_atlas")
+        if not self._logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter("[%(asctime)s] %(levelname)s %(name)s: %(message)s")
+            handler.setFormatter(formatter)
+            self._logger.addHandler(handler)
+        self._logger.setLevel(logging.INFO)
+
+    def layout(self, images: Mapping[str, Path], page_name: str) -> List["TextureAtlasPacker.Page"]:
+        """Assign every image (region name -> file) a position; only image headers are read."""
+
+        Image = self._pillow()
+        sized: List[Tuple[str, Path, int, int]] = []
+        for name, source in images.items():
+            try:
+                with Image.open(source) as image:
+                    width, height = image.size
+            except OSError as exc:
+                raise TextureAtlasPacker.AtlasError(f"Unable to read atlas image '{source}': {exc}") from exc
+            if width > self._page_size or height > self._page_size:
+                raise TextureAtlasPacker.AtlasError(
+                    f"Image '{source}' ({width}x{height}) exceeds the {self._page_size}px atlas page"
+                )
+            sized.append((name, Path(source), width, height))
+        sized.sort(key=lambda item: (-item[3], -item[2], item[0]))
+
+        pages: List[TextureAtlasPacker.Page] = []
+        current: List[TextureAtlasPacker.Region] = []
+        shelf_x = shelf_y = shelf_height = 0
+        for name, source, width, height in sized:
+            if shelf_x + width > self._page_size:
+                shelf_x, shelf_y, shelf_height = 0, shelf_y + shelf_height + self._padding, 0
+            if shelf_y + height > self._page_size:
+                pages.append(self._close_page(page_name, len(pages), current))
+                current = []
+                shelf_x = shelf_y = shelf_height = 0
+            current.append(TextureAtlasPacker.Region(name, source, shelf_x, shelf_y, width, height))
+            shelf_x += width + self._padding
+            shelf_height = max(shelf_height, height)
+        if current:
+            pages.append(self._close_page(page_name, len(pages), current))
+        return pages
+
+    def render_page(self, page: "TextureAtlasPacker.Page") -> bytes:
+        """Composite the regions of ``page`` into PNG bytes."""
+
+        Image = self._pillow()
+        canvas = Image.new("RGBA", (page.width, page.height), (0, 0, 0, 0))
+        for region in page.regions:
+            with Image.open(region.source) as image:
+                canvas.paste(image.convert("RGBA"), (region.x, region.y))
+        buffer = io.BytesIO()
+        canvas.save(buffer, format="PNG")
+        return buffer.getvalue()
+
+    @staticmethod
+    def atlas_text(pages: List["TextureAtlasPacker.Page"]) -> str:
+        """Describe ``pages`` in the libGDX texture atlas format read by ``TextureAtlas``."""
+
+        lines: List[str] = []
+        for page in pages:
+            lines.extend(
+                [
+                    "",
+                    page.file_name,
+                    f"size: {page.width},{page.height}",
+                    "format: RGBA8888",
+                    "filter: Linear,Linear",
+                    "repeat: none",
+                ]
+            )
+            for region in page.regions:
+                lines.extend(
+                    [
+                        region.name,
+                        "  rotate: false",
+                        f"  xy: {region.x}, {region.y}",
+                        f"  size: {region.width}, {region.height}",
+                        f"  orig: {region.width}, {region.height}",
+                        "  offset: 0, 0",
+                        "  index: -1",
+                    ]
+                )
+        return "\n".join(lines) + "\n"
+
+    def _close_page(
+        self,
+        page_name: str,
+        index: int,
+        regions: List["TextureAtlasPacker.Region"],
+    ) -> "TextureAtlasPacker.Page":
+        width = max(region.x + region.width for region in regions)
+        height = max(region.y + region.height for region in regions)
+        file_name = f"{page_name}{index + 1 if index else ''}.png"
+        return TextureAtlasPacker.Page(file_name, self._power_of_two(width), self._power_of_two(height), regions)
+
+    def _power_of_two(self, value: int) -> int:
+        size = 1
+        while size < value:
+            size *= 2
+        return min(size, self._page_size)
+
+    @staticmethod
+    def _pillow():
+        try:
+            from PIL import Image
+        except ImportError as exc:
+            raise TextureAtlasPacker.PillowUnavailableError(
+                "Pillow is required to pack texture atlases; install it with 'pip install Pillow'"
+            ) from exc
+        return Image
+
+
+PluginManager.get_instance().register_module(__name__, sys.modules[__name__])
+
+__all__ = ["TextureAtlasPacker"]